@@ -28,8 +28,10 @@ from app.core.database import BaseModel
 from app.modules.bookings.models import Booking  # noqa: F401
 from app.modules.organizations.models import Organization  # noqa: F401
 from app.modules.ratings.models import Rating  # noqa: F401
+from app.modules.uploads.models import UploadBlob  # noqa: F401
 from app.modules.users.models import User  # noqa: F401
 from app.modules.venues.models import Venue  # noqa: F401
+from app.modules.webhooks.models import WebhookEvent  # noqa: F401
 
 # Alembic Config object (provides access to alembic.ini values)
 config = context.config
@@ -0,0 +1,85 @@
+"""booking_event_period
+
+Add event_end_date and a generated tsrange event_period column to bookings
+so overnight and multi-day events can be stored and checked for overlap.
+The (venue_id, event_date, start, end) btree index is replaced by a GiST
+index on (venue_id, event_period), which requires btree_gist.
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-04-01 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add event_end_date, the generated event_period range and its GiST index."""
+    # btree_gist lets the GiST index cover the venue_id equality column
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # Existing bookings all end on the day they start
+    op.add_column(
+        "bookings",
+        sa.Column("event_end_date", sa.Date(), nullable=True),
+    )
+    op.execute("UPDATE bookings SET event_end_date = event_date")
+    op.alter_column(
+        "bookings",
+        "event_end_date",
+        existing_type=sa.Date(),
+        nullable=False,
+    )
+
+    # End must be after start across the full date + time, not just the time
+    op.drop_constraint("booking_end_after_start_check", "bookings", type_="check")
+    op.create_check_constraint(
+        "booking_end_after_start_check",
+        "bookings",
+        "event_end_date + event_end_time > event_date + event_start_time",
+    )
+
+    # Alembic has no portable op for generated columns, so emit the DDL directly
+    op.execute(
+        "ALTER TABLE bookings ADD COLUMN event_period tsrange "
+        "GENERATED ALWAYS AS "
+        "(tsrange(event_date + event_start_time, event_end_date + event_end_time, '[)')) "
+        "STORED"
+    )
+
+    op.create_index(
+        "ix_bookings_venue_event_period",
+        "bookings",
+        ["venue_id", "event_period"],
+        postgresql_using="gist",
+    )
+    op.drop_index("ix_bookings_venue_date_time", table_name="bookings")
+
+
+def downgrade() -> None:
+    """Drop event_period and event_end_date, restoring the same-day constraint."""
+    op.create_index(
+        "ix_bookings_venue_date_time",
+        "bookings",
+        ["venue_id", "event_date", "event_start_time", "event_end_time"],
+    )
+    op.drop_index("ix_bookings_venue_event_period", table_name="bookings")
+    op.drop_column("bookings", "event_period")
+
+    # Overnight rows cannot satisfy the old check, so skip validating existing data
+    op.drop_constraint("booking_end_after_start_check", "bookings", type_="check")
+    op.execute(
+        "ALTER TABLE bookings ADD CONSTRAINT booking_end_after_start_check "
+        "CHECK (event_end_time > event_start_time) NOT VALID"
+    )
+    op.drop_column("bookings", "event_end_date")
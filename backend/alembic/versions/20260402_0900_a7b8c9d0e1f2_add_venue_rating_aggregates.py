@@ -0,0 +1,98 @@
+"""add_venue_rating_aggregates
+
+Denormalize rating count, sum and a 1-5 score histogram onto venues, with a
+generated rating_average column and a partial index backing sort=rating.
+Existing ratings are folded in by the backfill below.
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-04-02 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "f6a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add rating aggregate columns to venues and backfill them."""
+    op.add_column(
+        "venues",
+        sa.Column("rating_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "venues",
+        sa.Column("rating_sum", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "venues",
+        sa.Column(
+            "rating_histogram",
+            postgresql.ARRAY(sa.Integer()),
+            server_default="{0,0,0,0,0}",
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "venues",
+        sa.Column(
+            "rating_average",
+            sa.Double(),
+            sa.Computed(
+                "CASE WHEN rating_count > 0 THEN rating_sum::double precision / rating_count END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+
+    # Backfill from existing ratings
+    op.execute(
+        """
+        UPDATE venues
+        SET rating_count = agg.rating_count,
+            rating_sum = agg.rating_sum,
+            rating_histogram = agg.rating_histogram
+        FROM (
+            SELECT
+                venue_id,
+                count(*) AS rating_count,
+                sum(score) AS rating_sum,
+                ARRAY[
+                    count(*) FILTER (WHERE score = 1),
+                    count(*) FILTER (WHERE score = 2),
+                    count(*) FILTER (WHERE score = 3),
+                    count(*) FILTER (WHERE score = 4),
+                    count(*) FILTER (WHERE score = 5)
+                ] AS rating_histogram
+            FROM ratings
+            GROUP BY venue_id
+        ) AS agg
+        WHERE venues.id = agg.venue_id
+        """
+    )
+
+    op.create_index(
+        "ix_venues_rating_average",
+        "venues",
+        [sa.text("rating_average DESC NULLS LAST"), sa.text("created_at DESC")],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Remove rating aggregate columns from venues."""
+    op.drop_index("ix_venues_rating_average", table_name="venues")
+    op.drop_column("venues", "rating_average")
+    op.drop_column("venues", "rating_histogram")
+    op.drop_column("venues", "rating_sum")
+    op.drop_column("venues", "rating_count")
@@ -0,0 +1,39 @@
+"""ratings_venue_created_at_index
+
+Replace the single-column ratings.venue_id index with a composite
+(venue_id, created_at DESC, id DESC) index so a venue's ratings can be
+keyset-paginated newest first straight off the index.
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-04-02 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap ix_ratings_venue_id for the composite keyset index."""
+    op.create_index(
+        "ix_ratings_venue_created_at",
+        "ratings",
+        ["venue_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    # The composite index's leading column covers plain venue_id lookups
+    op.drop_index("ix_ratings_venue_id", table_name="ratings")
+
+
+def downgrade() -> None:
+    """Restore the single-column venue_id index."""
+    op.create_index("ix_ratings_venue_id", "ratings", ["venue_id"], unique=False)
+    op.drop_index("ix_ratings_venue_created_at", table_name="ratings")
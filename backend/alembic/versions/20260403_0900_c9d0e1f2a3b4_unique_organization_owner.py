@@ -0,0 +1,36 @@
+"""unique_organization_owner
+
+Make organizations.owner_id unique so organization provisioning can use
+INSERT ... ON CONFLICT (owner_id) DO NOTHING. The API already allowed only
+one organization per owner; this enforces it in the database.
+
+Duplicates left behind by earlier signup races must be merged before
+upgrading, otherwise creating the unique index fails.
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-04-03 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace ix_organizations_owner_id with a unique index of the same name."""
+    op.drop_index("ix_organizations_owner_id", table_name="organizations")
+    op.create_index("ix_organizations_owner_id", "organizations", ["owner_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Restore the non-unique owner_id index."""
+    op.drop_index("ix_organizations_owner_id", table_name="organizations")
+    op.create_index("ix_organizations_owner_id", "organizations", ["owner_id"], unique=False)
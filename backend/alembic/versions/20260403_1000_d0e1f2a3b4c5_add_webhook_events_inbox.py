@@ -0,0 +1,75 @@
+"""add_webhook_events_inbox
+
+Create the webhook_events inbox table. The webhook endpoint stores verified
+deliveries here (de-duplicated on svix_id) and a background worker
+processes them with retries and dead-lettering.
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-04-03 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, Sequence[str], None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+webhook_event_status = sa.Enum(
+    "pending",
+    "processing",
+    "succeeded",
+    "dead",
+    name="webhook_event_status",
+)
+
+
+def upgrade() -> None:
+    """Create webhook_events and its due-events partial index."""
+    op.create_table(
+        "webhook_events",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("svix_id", sa.String(length=255), nullable=False),
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "status",
+            webhook_event_status,
+            server_default="pending",
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("svix_id"),
+        sa.CheckConstraint("attempts >= 0", name="webhook_event_attempts_check"),
+    )
+    op.create_index(
+        "ix_webhook_events_due",
+        "webhook_events",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status IN ('pending', 'processing')"),
+    )
+
+
+def downgrade() -> None:
+    """Drop webhook_events and its status enum."""
+    op.drop_index("ix_webhook_events_due", table_name="webhook_events")
+    op.drop_table("webhook_events")
+    webhook_event_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,41 @@
+"""add_logo_variants
+
+Add a nullable logo_variants JSONB column to venues and organizations to
+record the resized WebP/JPEG derivatives (thumbnail, card, full) rendered
+for each uploaded logo. Existing logos keep only their original URL.
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-04-04 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add logo_variants to venues and organizations."""
+    op.add_column(
+        "venues",
+        sa.Column("logo_variants", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column(
+        "organizations",
+        sa.Column("logo_variants", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop logo_variants from venues and organizations."""
+    op.drop_column("organizations", "logo_variants")
+    op.drop_column("venues", "logo_variants")
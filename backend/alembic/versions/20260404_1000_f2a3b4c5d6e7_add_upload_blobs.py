@@ -0,0 +1,62 @@
+"""add_upload_blobs
+
+Create the upload_blobs table, which reference-counts content-addressed
+upload files so unreferenced ones can be garbage-collected. Existing logos
+are backfilled with their current reference counts, so files they point at
+are never collected.
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-04-04 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create upload_blobs, its orphan index, and count existing logo references."""
+    op.create_table(
+        "upload_blobs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("ref_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key"),
+        sa.CheckConstraint("ref_count >= 0", name="upload_blob_ref_count_check"),
+    )
+    op.create_index(
+        "ix_upload_blobs_orphaned",
+        "upload_blobs",
+        ["updated_at"],
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+
+    # Keys are logo URLs without the "/uploads/" prefix
+    op.execute(
+        "INSERT INTO upload_blobs (id, key, ref_count, created_at, updated_at) "
+        "SELECT gen_random_uuid(), substr(logo_url, 10), count(*), now(), now() "
+        "FROM ("
+        "  SELECT logo_url FROM venues WHERE logo_url LIKE '/uploads/%' "
+        "  UNION ALL "
+        "  SELECT logo_url FROM organizations WHERE logo_url LIKE '/uploads/%'"
+        ") AS logos "
+        "GROUP BY substr(logo_url, 10)"
+    )
+
+
+def downgrade() -> None:
+    """Drop upload_blobs."""
+    op.drop_index("ix_upload_blobs_orphaned", table_name="upload_blobs")
+    op.drop_table("upload_blobs")
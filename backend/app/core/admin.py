@@ -0,0 +1,32 @@
+"""Access control for operator endpoints (/api/admin and /api/metrics).
+
+These endpoints expose internals (pool sizing, captured SQL and query
+plans), so they are not tied to user roles: callers present
+ADMIN_API_TOKEN as a bearer token. With no token configured the endpoints
+answer 404, as if they did not exist.
+"""
+
+import hmac
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.config import settings
+
+admin_security = HTTPBearer(auto_error=False)
+
+
+def require_admin_token(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(admin_security)],
+) -> None:
+    """Reject the request unless it carries the configured admin token."""
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not hmac.compare_digest(credentials.credentials.encode(), settings.ADMIN_API_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
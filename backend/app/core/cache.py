@@ -0,0 +1,136 @@
+"""In-process caching primitives.
+
+Provides a small bounded LRU cache whose entries each carry their own
+absolute expiry time. It is meant for per-process memoization of values
+that are expensive to compute but safe to reuse until a known deadline
+(e.g. verified JWT claims, which are valid until the token's ``exp``).
+
+The cache is not thread-safe. It is intended for use from the asyncio
+event loop, where no await happens between a lookup and an insert.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing cache effectiveness.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that found nothing usable (absent or expired)
+        evictions: Entries dropped to stay within max_entries
+        expirations: Entries dropped because their expiry passed
+        size: Current number of entries
+        max_entries: Configured capacity
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ExpiringLRUCache(Generic[K, V]):
+    """
+    Bounded LRU cache with a per-entry expiry timestamp.
+
+    - Lookups move the entry to the most-recently-used end.
+    - Inserting past ``max_entries`` evicts the least-recently-used entry.
+    - Expired entries are dropped lazily when looked up.
+    - ``max_entries=0`` disables caching (every lookup is a miss).
+
+    Usage:
+        cache: ExpiringLRUCache[str, dict] = ExpiringLRUCache(max_entries=1000)
+        cache.set("key", value, expires_at=time.time() + 60)
+        cached = cache.get("key")
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of live entries to keep
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._stats = CacheStats(max_entries=max_entries)
+
+    def get(self, key: K, now: float | None = None) -> V | None:
+        """
+        Return the cached value for ``key`` if present and not expired.
+
+        Args:
+            key: Cache key
+            now: Current UNIX time (defaults to ``time.time()``)
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= (time.time() if now is None else now):
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V, expires_at: float) -> None:
+        """
+        Store ``value`` until the UNIX timestamp ``expires_at``.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            expires_at: Absolute UNIX time after which the entry is stale
+        """
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def discard(self, key: K) -> None:
+        """Remove ``key`` from the cache if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        snapshot = CacheStats(**vars(self._stats))
+        snapshot.size = len(self._entries)
+        return snapshot
+
+    def __len__(self) -> int:
+        """Number of entries currently stored (including not-yet-pruned expired ones)."""
+        return len(self._entries)
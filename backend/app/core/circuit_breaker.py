@@ -0,0 +1,106 @@
+"""Circuit breaker for calls to external services.
+
+Counts consecutive failures of calls to one dependency. After
+``failure_threshold`` failures the breaker opens and calls are rejected
+immediately (no network traffic) for ``reset_timeout`` seconds. It then
+lets a single trial call through (half-open): success closes the breaker,
+failure opens it again.
+
+Like the in-process cache, the breaker is per process and intended for use
+from the asyncio event loop.
+
+Usage:
+    breaker = CircuitBreaker("clerk", failure_threshold=5, reset_timeout=30)
+    breaker.before_call()        # raises CircuitOpenError while open
+    try:
+        response = await do_call()
+    except httpx.HTTPError:
+        breaker.record_failure()
+        raise
+    breaker.record_success()
+"""
+
+import time
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    """Breaker states."""
+
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_after:.1f}s")
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open trial call."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        """
+        Create a closed breaker.
+
+        Args:
+            name: Dependency name, used in errors
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (open turns half-open once reset_timeout has passed)."""
+        if self._opened_at is None:
+            return CircuitState.closed
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return CircuitState.half_open
+        return CircuitState.open
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (including while a
+                half-open trial call is in flight).
+        """
+        state = self.state
+        if state == CircuitState.closed:
+            return
+        now = time.monotonic()
+        if state == CircuitState.half_open:
+            # Let this call through as the trial and re-arm the timer, so
+            # concurrent callers stay rejected while it runs (and a trial that
+            # never reports back doesn't wedge the breaker half-open)
+            self._opened_at = now
+            self._trial_in_flight = True
+            return
+
+        opened_at = self._opened_at if self._opened_at is not None else now
+        raise CircuitOpenError(self.name, self.reset_timeout - (now - opened_at))
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening (or re-opening) the breaker at the threshold."""
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
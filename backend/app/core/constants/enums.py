@@ -87,3 +87,27 @@ class BookingStatus(str, PyEnum):
     rejected = "rejected"
     completed = "completed"
     cancelled = "cancelled"
+
+
+class WebhookEventStatus(str, PyEnum):
+    """
+    Processing states of a stored (inbox) webhook event.
+
+    State transitions:
+        pending -> processing (claimed by a worker)
+        processing -> succeeded (handler finished)
+        processing -> pending (failed; retried after a backoff)
+        processing -> dead (permanent failure or out of attempts)
+        processing -> processing (worker lease expired; reclaimed)
+
+    Attributes:
+        pending: Stored, waiting for its next attempt
+        processing: Claimed by a worker until its lease expires
+        succeeded: Handled successfully (kept for svix-id de-duplication)
+        dead: Dead-lettered; needs manual inspection
+    """
+
+    pending = "pending"
+    processing = "processing"
+    succeeded = "succeeded"
+    dead = "dead"
@@ -1,14 +1,32 @@
 """Database configuration and session management."""
 
 from app.core.database.base import BaseModel, SoftDeleteMixin, TimestampMixin, UUIDMixin
-from app.core.database.session import AsyncSessionLocal, engine, get_db
+from app.core.database.session import (
+    AsyncSessionLocal,
+    PrimaryReadSessionLocal,
+    ReadSessionLocal,
+    engine,
+    get_db,
+    get_primary_read_db,
+    get_read_db,
+    read_engine,
+    replica_router,
+    slow_query_log,
+)
 
 __all__ = [
     "AsyncSessionLocal",
     "BaseModel",
+    "PrimaryReadSessionLocal",
+    "ReadSessionLocal",
     "SoftDeleteMixin",
     "TimestampMixin",
     "UUIDMixin",
     "engine",
     "get_db",
+    "get_primary_read_db",
+    "get_read_db",
+    "read_engine",
+    "replica_router",
+    "slow_query_log",
 ]
@@ -0,0 +1,104 @@
+"""Connection pool instrumentation.
+
+``InstrumentedAsyncPool`` is SQLAlchemy's async queue pool with checkout
+timing: every checkout records how long the caller waited for a
+connection (queueing behind a full pool, plus connect time when the pool
+opens a new one), and checkouts that hit DB_POOL_TIMEOUT_SECONDS are
+counted. ``pool_status`` combines those counters with the pool's live
+size, in-use and overflow counts for the metrics endpoint.
+
+Counters are per process, so each worker reports its own pool.
+"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass
+class CheckoutStats:
+    """
+    Checkout wait counters.
+
+    Attributes:
+        checkouts: Connections handed out
+        timeouts: Checkouts that gave up after the pool timeout
+        wait_seconds_total: Sum of checkout waits
+        wait_seconds_max: Longest single checkout wait
+        wait_buckets: Cumulative counts of waits <= each WAIT_BUCKETS bound
+    """
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    wait_buckets: list[int] = field(default_factory=lambda: [0] * len(WAIT_BUCKETS))
+
+    def record(self, waited: float) -> None:
+        """Add one successful checkout that waited ``waited`` seconds."""
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        for i, bound in enumerate(WAIT_BUCKETS):
+            if waited <= bound:
+                self.wait_buckets[i] += 1
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times how long each checkout waits."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Create the pool with empty checkout counters."""
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        """Recreate the pool (after invalidation), keeping the counters."""
+        pool = super().recreate()
+        pool.checkout_stats = self.checkout_stats
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Check out a connection, recording the wait."""
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_stats.timeouts += 1
+            raise
+        self.checkout_stats.record(time.perf_counter() - start)
+        return entry
+
+
+def pool_status(pool: Pool) -> dict[str, Any]:
+    """
+    Snapshot of a pool's occupancy and checkout wait counters.
+
+    Args:
+        pool: The engine's pool (``engine.pool``)
+
+    Returns:
+        dict with size, checked_in, checked_out (in use), overflow and
+        max_overflow, plus the CheckoutStats fields when instrumented
+    """
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # QueuePool.overflow() is negative until the pool fills up
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, InstrumentedAsyncPool):
+        stats = pool.checkout_stats
+        status.update(asdict(stats))
+        status["wait_bucket_bounds"] = list(WAIT_BUCKETS)
+    return status
@@ -0,0 +1,195 @@
+"""Per-request SQL statement counting and N+1 detection.
+
+``instrument_engine`` hooks an engine's ``before_cursor_execute`` and
+``after_cursor_execute`` events to time every statement. While a request
+is being served by ``QueryStatsMiddleware``, each statement's duration is
+added to that request's ``RequestQueryStats`` (held in a context variable,
+which SQLAlchemy's async greenlets inherit from the calling task).
+
+When the request finishes the middleware:
+
+- adds ``Server-Timing: db;dur=<ms>;desc="<n> queries"`` to the response,
+  so browser dev tools show DB time next to the request
+- logs one ``query_stats`` line with the method, path, status, statement
+  count and DB time (also attached as ``extra`` fields for JSON handlers)
+- logs a warning for each statement run QUERY_STATS_N_PLUS_ONE_THRESHOLD
+  or more times with the same SQL, the usual signature of a lazy load or
+  per-row check inside a loop (an N+1 candidate)
+
+Statements are grouped by their SQL text with bound parameters left out,
+so ``SELECT ... WHERE id = $1`` run for ten different ids counts as ten
+repeats. Enabled with QUERY_STATS_ENABLED (by default everywhere but
+production).
+"""
+
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Characters of SQL quoted in N+1 warnings
+STATEMENT_LOG_MAX_CHARS = 300
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestQueryStats:
+    """
+    SQL statements executed while serving one request.
+
+    Attributes:
+        count: Statements executed
+        seconds: Total time spent executing them
+        statements: Executions per distinct SQL text
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Add one executed statement that took ``seconds``."""
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most frequent first."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        """The ``Server-Timing`` header value for these statements."""
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    """Stats for the request being served, or None outside an instrumented request."""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    _cursor: Any,  # noqa: ANN401
+    _statement: str,
+    _parameters: Any,  # noqa: ANN401
+    _context: Any,  # noqa: ANN401
+    _executemany: bool,
+) -> None:
+    """Note the statement's start time on the connection."""
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    _cursor: Any,  # noqa: ANN401
+    statement: str,
+    _parameters: Any,  # noqa: ANN401
+    _context: Any,  # noqa: ANN401
+    _executemany: bool,
+) -> None:
+    """Add the statement's duration to the current request's stats."""
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every statement ``engine`` executes (including its execution_options views)."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware that collects and reports each HTTP request's SQL statements.
+
+    Usage:
+        app.add_middleware(QueryStatsMiddleware, n_plus_one_threshold=5)
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int) -> None:
+        """
+        Wrap ``app``.
+
+        Args:
+            app: The ASGI application
+            n_plus_one_threshold: Executions of one SQL text that count as an
+                N+1 candidate
+        """
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request with fresh stats, then report them."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if stats.count:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("server-timing", stats.server_timing())
+            await send(message)
+
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            if stats.count:
+                self._report(scope, status_code, stats)
+
+    def _report(self, scope: Scope, status_code: int, stats: RequestQueryStats) -> None:
+        """Log the request's totals and any N+1 candidates."""
+        method, path = scope["method"], scope["path"]
+        repeated = stats.repeated(self.n_plus_one_threshold)
+        logger.info(
+            "query_stats method=%s path=%s status=%d queries=%d db_ms=%.1f repeated=%d",
+            method,
+            path,
+            status_code,
+            stats.count,
+            stats.seconds * 1000,
+            len(repeated),
+            extra={
+                "query_stats": {
+                    "method": method,
+                    "path": path,
+                    "status": status_code,
+                    "queries": stats.count,
+                    "db_ms": round(stats.seconds * 1000, 1),
+                    "distinct_queries": len(stats.statements),
+                    "repeated": len(repeated),
+                }
+            },
+        )
+        for statement, times in repeated:
+            logger.warning(
+                "Possible N+1: %s %s ran the same statement %d times: %s",
+                method,
+                path,
+                times,
+                " ".join(statement.split())[:STATEMENT_LOG_MAX_CHARS],
+                extra={"n_plus_one": {"method": method, "path": path, "times": times}},
+            )
@@ -0,0 +1,103 @@
+"""Read-only sessions for GET endpoints.
+
+Read-only sessions are bound to an engine in AUTOCOMMIT mode, so asyncpg
+never sends BEGIN, and no COMMIT or ROLLBACK is needed when the session
+ends. Each statement runs in its own implicit transaction, and no
+transaction is held open between statements. That suits a replica or a
+transaction-pooling proxy. The trade-off is that two queries in one
+request may see different snapshots, which browse and detail pages
+tolerate.
+
+Without an enclosing transaction, ``SET TRANSACTION READ ONLY`` has
+nothing to apply to, so read-only is enforced by the application, in two
+layers, each raising ``InvalidRequestError``:
+
+- The session refuses to flush pending ORM changes or execute ORM
+  INSERT/UPDATE/DELETE statements.
+- The engine view checks the SQL text of every statement before it is
+  sent, which also covers ``text()`` and ``exec_driver_sql``. A statement
+  must start with SELECT, WITH, SHOW, VALUES or TABLE and contain no
+  INSERT, UPDATE (other than a FOR [NO KEY] UPDATE lock), DELETE, MERGE or
+  INTO keyword.
+
+The text check can't see what a called function does, so a SELECT of a
+function with side effects still runs (and, in autocommit, commits) on the
+primary. A replica rejects writes on its own.
+"""
+
+import re
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+READ_ONLY_ERROR = "This session is read-only; use get_db for endpoints that write"
+
+# Leading keywords of statements that only read
+READ_ONLY_KEYWORDS = frozenset({"SELECT", "WITH", "SHOW", "VALUES", "TABLE"})
+# Keywords that write anywhere in a statement (data-modifying CTEs, SELECT INTO);
+# row locks (FOR UPDATE, FOR NO KEY UPDATE) are allowed
+WRITE_KEYWORDS = re.compile(
+    r"\b(?:INSERT|DELETE|MERGE|INTO)\b|(?<!FOR )(?<!KEY )\bUPDATE\b",
+    re.IGNORECASE,
+)
+
+
+def is_read_only_sql(statement: str) -> bool:
+    """Whether a SQL string passes the read-only text check."""
+    words = statement.lstrip("( \t\r\n").split(maxsplit=1)
+    return (
+        bool(words)
+        and words[0].upper() in READ_ONLY_KEYWORDS
+        and WRITE_KEYWORDS.search(statement) is None
+    )
+
+
+class ReadOnlySyncSession(Session):
+    """Session that refuses to flush changes or execute DML."""
+
+    def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Execute a statement, rejecting INSERT/UPDATE/DELETE."""
+        if getattr(statement, "is_dml", False):
+            raise InvalidRequestError(READ_ONLY_ERROR)
+        return super().execute(statement, *args, **kwargs)
+
+    def flush(self, objects: Any = None) -> None:  # noqa: ANN401
+        """Refuse to flush pending ORM changes."""
+        if self.new or self.dirty or self.deleted:
+            raise InvalidRequestError(READ_ONLY_ERROR)
+        super().flush(objects)
+
+
+class ReadOnlySession(AsyncSession):
+    """AsyncSession backed by ``ReadOnlySyncSession``."""
+
+    sync_session_class = ReadOnlySyncSession
+
+
+def _reject_writes(
+    _conn: Connection,
+    _cursor: Any,  # noqa: ANN401
+    statement: str,
+    _parameters: Any,  # noqa: ANN401
+    _context: Any,  # noqa: ANN401
+    _executemany: bool,
+) -> None:
+    """Refuse to send a statement that fails the read-only text check."""
+    if not is_read_only_sql(statement):
+        raise InvalidRequestError(READ_ONLY_ERROR)
+
+
+def read_only_engine(engine: AsyncEngine) -> AsyncEngine:
+    """
+    Return a read-only view of ``engine`` (sharing its pool) in AUTOCOMMIT mode.
+
+    The view rejects any statement that fails ``is_read_only_sql``; the
+    engine itself is unaffected.
+    """
+    view = engine.execution_options(isolation_level="AUTOCOMMIT")
+    event.listen(view.sync_engine, "before_cursor_execute", _reject_writes)
+    return view
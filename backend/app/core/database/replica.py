@@ -0,0 +1,153 @@
+"""Read-replica routing policy.
+
+Decides, per request, whether a read-only session may use the replica or
+must go to the primary:
+
+- Replica lag is probed at most every DATABASE_READ_LAG_CHECK_SECONDS.
+  While it exceeds DATABASE_READ_MAX_LAG_SECONDS, or the probe fails, all
+  reads go to the primary.
+- After a caller's write request commits, that caller keeps reading from
+  the primary until the replica has had time to replay it (the observed lag
+  plus one probe interval), so users always see their own writes.
+
+Callers are identified by the ``sub`` of their bearer token, read without
+verification: it only steers routing, never authorization, and a forged
+value can at worst send reads to the primary.
+
+Write tracking is per process. With several workers, a read that lands on
+a worker other than the one that served the write is protected only by
+the lag check, which is why the default max lag is kept short.
+"""
+
+import asyncio
+import logging
+import math
+import time
+
+from fastapi import Request
+from jose import JWTError, jwt
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.cache import ExpiringLRUCache
+
+# Seconds of WAL the replica has yet to replay; 0 when it is caught up
+# (an idle primary doesn't advance the replay timestamp) or not a standby
+LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+LAG_PROBE_TIMEOUT_SECONDS = 1.0
+RECENT_WRITERS_MAX_ENTRIES = 10_000
+# Methods whose requests never write
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+logger = logging.getLogger(__name__)
+
+
+def caller_key(request: Request) -> str | None:
+    """Return the bearer token's subject, or None for anonymous requests."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        subject = jwt.get_unverified_claims(token).get("sub")
+    except JWTError:
+        return None
+    return subject if isinstance(subject, str) else None
+
+
+class ReplicaRouter:
+    """
+    Lag-aware routing between a replica and the primary.
+
+    Usage:
+        router = ReplicaRouter(read_engine, max_lag_seconds=5, check_interval_seconds=1)
+        router.record_write(request)  # after a write request commits
+        if await router.use_replica(request):
+            ...
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine | None,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ) -> None:
+        """
+        Create a router.
+
+        Args:
+            engine: Replica engine, or None when no replica is configured
+            max_lag_seconds: Lag above which all reads go to the primary
+            check_interval_seconds: Minimum time between lag probes
+        """
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._lag = math.inf
+        self._checked_at = -math.inf
+        self._lock = asyncio.Lock()
+        # caller -> monotonic time of their last committed write
+        self._writes: ExpiringLRUCache[str, float] = ExpiringLRUCache(
+            max_entries=RECENT_WRITERS_MAX_ENTRIES,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a replica is configured."""
+        return self.engine is not None
+
+    def record_write(self, request: Request) -> None:
+        """Pin the request's caller to the primary until the replica catches up."""
+        if not self.enabled or request.method in SAFE_METHODS:
+            return
+        key = caller_key(request)
+        if key is None:
+            return
+        # Past max lag everyone reads the primary anyway, so forget the write then
+        self._writes.set(
+            key,
+            time.monotonic(),
+            expires_at=time.time() + self.max_lag_seconds + self.check_interval_seconds,
+        )
+
+    async def use_replica(self, request: Request) -> bool:
+        """Whether this request's reads may be served by the replica."""
+        if not self.enabled:
+            return False
+        lag = await self.current_lag()
+        if lag > self.max_lag_seconds:
+            return False
+
+        key = caller_key(request)
+        written_at = self._writes.get(key) if key is not None else None
+        if written_at is None:
+            return True
+        # The lag reading may be up to one interval old
+        return time.monotonic() - written_at > lag + self.check_interval_seconds
+
+    async def current_lag(self) -> float:
+        """Replica lag in seconds (inf if unreachable), probing when stale."""
+        if time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return self._lag
+        async with self._lock:
+            # Another request may have probed while this one waited
+            if time.monotonic() - self._checked_at >= self.check_interval_seconds:
+                self._lag = await self._probe()
+                self._checked_at = time.monotonic()
+        return self._lag
+
+    async def _probe(self) -> float:
+        """Measure replica lag; any failure counts as infinitely behind."""
+        if self.engine is None:
+            return math.inf
+        try:
+            async with asyncio.timeout(LAG_PROBE_TIMEOUT_SECONDS):
+                async with self.engine.connect() as conn:
+                    lag = await conn.scalar(LAG_QUERY)
+        except Exception:
+            # Any failure means "use the primary" until the next probe
+            logger.warning("Replica lag probe failed", exc_info=True)
+            return math.inf
+        return float(lag or 0)
@@ -4,36 +4,136 @@ This module provides:
 - Async SQLAlchemy engine with connection pooling
 - Session factory for creating database sessions
 - FastAPI dependency for dependency injection
+- Read-only sessions for GET endpoints (see readonly.py): ``get_read_db``
+  may be served by the optional read replica (DATABASE_READ_URL, routed by
+  ``ReplicaRouter``, see replica.py), ``get_primary_read_db`` always reads
+  the primary
 
-Connection pooling configuration:
-- pool_size=5: Maximum 5 persistent connections
-- max_overflow=10: Allow up to 10 additional connections during spikes
-- pool_pre_ping=True: Test connections before use to avoid stale connections
+Connection pooling is configured from the DB_* settings (size, overflow,
+timeout, recycle, pre-ping) plus asyncpg options (statement cache size,
+command timeout) and per-connection server settings (statement_timeout,
+idle_in_transaction_session_timeout). Pools are InstrumentedAsyncPool, so
+checkout waits and occupancy can be read with ``pool_status``. With
+DB_POOLING_MODE="transaction" (PgBouncer or similar in transaction mode)
+the engines use NullPool and keep no per-connection state instead.
+When QUERY_STATS_ENABLED, every statement is timed for the per-request
+counts reported by ``QueryStatsMiddleware`` (see query_stats.py), and
+statements over SLOW_QUERY_THRESHOLD_MS go to ``slow_query_log`` (see
+slow_queries.py).
 
 Usage in FastAPI routes:
     @router.get("/users")
     async def get_users(db: AsyncSession = Depends(get_db)):
         result = await db.execute(select(User))
         return result.scalars().all()
+
+    @router.get("/venues")
+    async def list_venues(db: AsyncSession = Depends(get_read_db)):
+        ...  # reads only; may be served by the replica
+
+    @router.get("/venues/me")
+    async def get_my_venue(db: AsyncSession = Depends(get_primary_read_db)):
+        ...  # reads only; must see writes made elsewhere (e.g. by webhooks)
 """
 
 from collections.abc import AsyncGenerator
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.core.database.pool import InstrumentedAsyncPool
+from app.core.database.query_stats import instrument_engine
+from app.core.database.readonly import ReadOnlySession, read_only_engine
+from app.core.database.replica import ReplicaRouter
+from app.core.database.slow_queries import SlowQueryLog
+
+# DB_POOLING_MODE values
+POOLING_MODE_SESSION = "session"
+POOLING_MODE_TRANSACTION = "transaction"
+
 
-# Create async engine with connection pooling
-# echo=True enables SQL query logging in development (useful for debugging)
-# pool_pre_ping=True tests connections before use to avoid stale connections
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.ENVIRONMENT == "development",  # Log SQL in development only
-    pool_size=5,  # Maximum number of persistent connections
-    max_overflow=10,  # Allow up to 10 additional connections during traffic spikes
-    pool_pre_ping=True,  # Verify connections are alive before using them
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    max_entries=settings.SLOW_QUERY_LOG_MAX_ENTRIES,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
 )
 
+
+def _unique_statement_name() -> str:
+    """Prepared statement name that can't collide on a shared server connection."""
+    return f"__asyncpg_{uuid4().hex}__"
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Create an engine for ``url`` with the enabled statement instrumentation."""
+    engine = _create_pooled_engine(url)
+    if settings.query_stats_enabled:
+        instrument_engine(engine)
+    if slow_query_log.enabled:
+        slow_query_log.instrument(engine)
+    return engine
+
+
+def _create_pooled_engine(url: str) -> AsyncEngine:
+    """
+    Create an async engine with the configured pool and asyncpg options.
+
+    echo=True enables SQL query logging in development (useful for debugging).
+
+    Behind a transaction-mode pooler (DB_POOLING_MODE="transaction") each
+    transaction may run on a different server connection, so nothing may
+    outlive a transaction: the pooler does the pooling (NullPool here),
+    prepared statements are not cached and get unique names, and no
+    session-level server settings are sent.
+    """
+    if settings.DB_POOLING_MODE == POOLING_MODE_TRANSACTION:
+        return create_async_engine(
+            url,
+            echo=settings.ENVIRONMENT == "development",
+            poolclass=NullPool,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+                "command_timeout": settings.DB_COMMAND_TIMEOUT_SECONDS,
+                "server_settings": {"application_name": settings.PROJECT_NAME},
+            },
+        )
+
+    server_settings = {"application_name": settings.PROJECT_NAME}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    if settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS:
+        server_settings["idle_in_transaction_session_timeout"] = str(
+            settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS
+        )
+    return create_async_engine(
+        url,
+        echo=settings.ENVIRONMENT == "development",  # Log SQL in development only
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT_SECONDS,
+            "server_settings": server_settings,
+        },
+    )
+
+
+engine = _create_engine(settings.DATABASE_URL)
+
 # Session factory for creating new async sessions
 # expire_on_commit=False: Keep objects usable after commit (better for FastAPI)
 # class_=AsyncSession: Use async session implementation
@@ -45,16 +145,47 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,  # Explicit transaction control
 )
 
+# Read-only sessions on the primary: autocommit, so no BEGIN/COMMIT round trips
+PrimaryReadSessionLocal = async_sessionmaker(
+    bind=read_only_engine(engine),
+    class_=ReadOnlySession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+# Optional read replica, pooled the same way as the primary
+read_engine = _create_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+ReadSessionLocal = (
+    async_sessionmaker(
+        bind=read_only_engine(read_engine),
+        class_=ReadOnlySession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+    if read_engine is not None
+    else None
+)
+
+replica_router = ReplicaRouter(
+    read_engine,
+    max_lag_seconds=settings.DATABASE_READ_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DATABASE_READ_LAG_CHECK_SECONDS,
+)
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency that provides async database sessions.
 
     This dependency:
     1. Creates a new session for each request
-    2. Automatically commits on success
+    2. Automatically commits on success; this is the request's only commit,
+       since repositories just flush (one transaction per request)
     3. Automatically rolls back on exception
     4. Always closes the session to prevent leaks
+    5. After a write request commits, pins the caller's reads to the
+       primary until the replica has replayed it
 
     Usage:
         @router.get("/users")
@@ -69,8 +200,44 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()  # Commit if no exception occurred
+            replica_router.record_write(request)
         except Exception:
             await session.rollback()  # Rollback on any exception
             raise  # Re-raise exception for FastAPI error handling
         finally:
             await session.close()  # Always close session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that provides a read-only session, possibly on the replica.
+
+    Served by the replica when one is configured, it is within
+    DATABASE_READ_MAX_LAG_SECONDS, and the caller has no write it may not
+    have replayed yet; otherwise by the primary. Either way the session is
+    read-only and runs in autocommit mode, so there is nothing to commit.
+
+    Yields:
+        AsyncSession: Read-only session for use in request handler
+    """
+    session_factory = PrimaryReadSessionLocal
+    if ReadSessionLocal is not None and await replica_router.use_replica(request):
+        session_factory = ReadSessionLocal
+
+    async with session_factory() as session:
+        yield session
+
+
+async def get_primary_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that provides a read-only session on the primary.
+
+    For GET endpoints that must see writes the caller didn't make through
+    this API (e.g. the organization or venue a signup webhook just created),
+    which the replica may not have replayed yet.
+
+    Yields:
+        AsyncSession: Read-only session for use in request handler
+    """
+    async with PrimaryReadSessionLocal() as session:
+        yield session
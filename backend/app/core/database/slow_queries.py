@@ -0,0 +1,199 @@
+"""Slow-query log with sampled EXPLAIN capture.
+
+``SlowQueryLog.instrument`` times every statement an engine executes.
+Statements slower than SLOW_QUERY_THRESHOLD_MS are logged (SQL text and
+duration, never the bound parameters) and kept in a bounded in-memory ring
+buffer, newest last, which the admin endpoint returns.
+
+For a sample of slow SELECTs the statement is run again with its original
+parameters under ``EXPLAIN (ANALYZE, BUFFERS)`` on a separate connection
+from the same engine, and the plan is attached to the buffered entry once
+it arrives. EXPLAIN ANALYZE really executes the statement, so sampling is
+conservative:
+
+- only plain SELECTs, inside a READ ONLY transaction that is rolled back
+- SLOW_QUERY_EXPLAIN_SAMPLE_RATE of slow statements, at most one EXPLAIN
+  in flight per process and one per distinct SQL text per
+  EXPLAIN_COOLDOWN_SECONDS
+- a server-side statement_timeout of EXPLAIN_STATEMENT_TIMEOUT_MS
+
+The buffer is per process, so each worker reports its own slow queries.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.cache import ExpiringLRUCache
+
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE, BUFFERS) "
+EXPLAIN_STATEMENT_TIMEOUT_MS = 10_000
+EXPLAIN_COOLDOWN_SECONDS = 60
+# Distinct SQL texts remembered for the cooldown
+EXPLAIN_COOLDOWN_MAX_ENTRIES = 1000
+MAX_CONCURRENT_EXPLAINS = 1
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SlowQuery:
+    """
+    One statement that exceeded the slow-query threshold.
+
+    Attributes:
+        recorded_at: When it finished
+        duration_ms: How long it ran
+        statement: SQL text, with parameter placeholders
+        plan: EXPLAIN (ANALYZE, BUFFERS) output lines, once captured
+        explain_error: Why the EXPLAIN failed, if it did
+    """
+
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    plan: list[str] | None = None
+    explain_error: str | None = None
+
+
+class SlowQueryLog:
+    """
+    Ring buffer of slow statements, fed by engine cursor events.
+
+    Usage:
+        slow_query_log = SlowQueryLog(threshold_ms=500, max_entries=200,
+                                      explain_sample_rate=0.1)
+        slow_query_log.instrument(engine)
+        slow_query_log.entries()  # oldest first
+    """
+
+    def __init__(
+        self,
+        threshold_ms: int,
+        max_entries: int,
+        explain_sample_rate: float,
+    ) -> None:
+        """
+        Create an empty log.
+
+        Args:
+            threshold_ms: Duration above which a statement is recorded (0 disables)
+            max_entries: Ring buffer size; the oldest entries are dropped
+            explain_sample_rate: Fraction of slow SELECTs to EXPLAIN (0 disables)
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._entries: deque[SlowQuery] = deque(maxlen=max_entries)
+        self._explain_tasks: set[asyncio.Task[None]] = set()
+        # SQL text -> True while its EXPLAIN cooldown runs
+        self._explained: ExpiringLRUCache[str, bool] = ExpiringLRUCache(
+            max_entries=EXPLAIN_COOLDOWN_MAX_ENTRIES,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether statements are being timed."""
+        return self.threshold_ms > 0
+
+    def entries(self) -> list[SlowQuery]:
+        """The buffered slow statements, oldest first."""
+        return list(self._entries)
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Time every statement ``engine`` executes (including its execution_options views)."""
+
+        def before_cursor_execute(
+            conn: Connection,
+            _cursor: Any,  # noqa: ANN401
+            _statement: str,
+            _parameters: Any,  # noqa: ANN401
+            _context: Any,  # noqa: ANN401
+            _executemany: bool,
+        ) -> None:
+            conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+        def after_cursor_execute(
+            conn: Connection,
+            _cursor: Any,  # noqa: ANN401
+            statement: str,
+            parameters: Any,  # noqa: ANN401
+            _context: Any,  # noqa: ANN401
+            executemany: bool,
+        ) -> None:
+            elapsed = time.perf_counter() - conn.info["slow_query_start_time"].pop()
+            if elapsed * 1000 >= self.threshold_ms:
+                self._record(engine, statement, parameters, elapsed, executemany=executemany)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+    def _record(
+        self,
+        engine: AsyncEngine,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        elapsed: float,
+        *,
+        executemany: bool,
+    ) -> None:
+        """Buffer and log a slow statement, scheduling an EXPLAIN if sampled."""
+        if statement.startswith(EXPLAIN_PREFIX):
+            return
+        entry = SlowQuery(
+            recorded_at=datetime.now(UTC),
+            duration_ms=round(elapsed * 1000, 1),
+            statement=statement,
+        )
+        self._entries.append(entry)
+        logger.warning(
+            "Slow query (%.1f ms): %s",
+            entry.duration_ms,
+            " ".join(statement.split()),
+            extra={"slow_query": {"duration_ms": entry.duration_ms}},
+        )
+
+        if executemany or not self._should_explain(statement):
+            return
+        self._explained.set(statement, True, expires_at=time.time() + EXPLAIN_COOLDOWN_SECONDS)
+        # Cursor events run in SQLAlchemy's greenlet, on the event loop thread
+        task = asyncio.get_running_loop().create_task(
+            self._explain(engine, entry, tuple(parameters or ()))
+        )
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    def _should_explain(self, statement: str) -> bool:
+        """Whether this slow statement is sampled for EXPLAIN ANALYZE."""
+        return (
+            statement.lstrip().upper().startswith("SELECT")
+            and len(self._explain_tasks) < MAX_CONCURRENT_EXPLAINS
+            and self._explained.get(statement) is None
+            and random.random() < self.explain_sample_rate  # noqa: S311
+        )
+
+    async def _explain(
+        self, engine: AsyncEngine, entry: SlowQuery, parameters: tuple[Any, ...]
+    ) -> None:
+        """Run EXPLAIN (ANALYZE, BUFFERS) with the original parameters; attach the plan."""
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SET TRANSACTION READ ONLY"))
+                await conn.execute(
+                    text(f"SET LOCAL statement_timeout = {EXPLAIN_STATEMENT_TIMEOUT_MS}")
+                )
+                result = await conn.exec_driver_sql(EXPLAIN_PREFIX + entry.statement, parameters)
+                entry.plan = [row[0] for row in result]
+                await conn.rollback()
+        except Exception as e:
+            # A failed EXPLAIN is diagnostic noise, never a request error
+            entry.explain_error = str(e)
+            logger.warning("EXPLAIN of slow query failed", exc_info=True)
@@ -41,3 +41,15 @@ class ConflictError(VenueLinkError):
 
     def __init__(self, message: str) -> None:
         super().__init__(message, "CONFLICT")
+
+
+class ExternalServiceError(VenueLinkError):
+    """Raised when a call to an external service fails or is short-circuited.
+
+    ``retryable`` is False when the service rejected the request itself
+    (e.g. a 4xx), so repeating the same call can't succeed.
+    """
+
+    def __init__(self, service: str, detail: str, *, retryable: bool = True) -> None:
+        super().__init__(f"{service}: {detail}", "EXTERNAL_SERVICE_ERROR")
+        self.retryable = retryable
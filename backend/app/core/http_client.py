@@ -0,0 +1,63 @@
+"""Shared outbound HTTP client.
+
+A single pooled ``httpx.AsyncClient`` is reused for all outbound calls
+(Clerk JWKS, Clerk Backend API) so connections and TLS sessions are kept
+alive between requests instead of being re-established per call.
+
+Lifecycle:
+- ``start_http_client()`` is called from the FastAPI lifespan on startup
+- ``close_http_client()`` is called on shutdown
+- ``get_http_client()`` returns the shared client, creating it lazily when
+  used outside the app lifespan (scripts, one-off tasks)
+
+Limits and timeouts come from the HTTP_* settings. Outbound calls are small
+JSON requests, so the connect timeout is kept short: an unreachable host
+fails fast instead of holding a request worker.
+"""
+
+import httpx
+
+from app.core.config import settings
+
+_client: httpx.AsyncClient | None = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Build the pooled client with shared limits and timeouts."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            settings.HTTP_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client.
+
+    Returns:
+        httpx.AsyncClient: Process-wide pooled client
+    """
+    global _client  # noqa: PLW0603
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    """Create the shared client at application startup."""
+    return get_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release its pooled connections."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
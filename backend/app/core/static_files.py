@@ -0,0 +1,251 @@
+"""Static file serving for content-addressed uploads.
+
+Every file under the uploads directory is written once under a name derived
+from its content (or, for legacy uploads, a random UUID) and never
+modified, so responses can be cached forever:
+
+- ``Cache-Control: public, max-age=<1 year>, immutable`` tells browsers and
+  proxies never to revalidate
+- The ETag is the file's stem (the content hash), a strong validator that
+  stays the same across replicas and redeploys, unlike Starlette's default
+  mtime/size-based tag
+- ``Last-Modified`` / ``If-Modified-Since`` are honoured for clients that
+  only revalidate by date
+- Single ``Range`` requests (with ``If-Range``) are answered with 206, so
+  large images can be resumed or fetched progressively
+
+Bodies are sent with the ASGI ``http.response.zerocopy`` extension
+(sendfile) when the server advertises it, and otherwise streamed in
+fixed-size chunks read off the event loop. Path lookups are cached briefly
+in process so repeat fetches of the same image skip the threadpool stat.
+"""
+
+import os
+import stat
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from pathlib import Path
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.core.cache import ExpiringLRUCache
+from app.core.storage import IMMUTABLE_CACHE_CONTROL
+
+# Read size when the server cannot sendfile
+CHUNK_SIZE = 64 * 1024
+# Resolved paths kept in memory; files never change, but GC may delete them
+LOOKUP_CACHE_MAX_ENTRIES = 4096
+LOOKUP_CACHE_TTL_SECONDS = 60
+ZEROCOPY_EXTENSION = "http.response.zerocopy"
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range ``Range`` header into an inclusive (start, end).
+
+    Returns:
+        The byte range, or None when the header should be ignored
+        (malformed or invalid, other units, or multiple ranges)
+
+    Raises:
+        HTTPException: 416 when the range lies wholly outside the file
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+            # last < first is an invalid range, ignored like any malformed one
+            if end < start:
+                return None
+            end = min(end, size - 1)
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError
+            start, end = max(size - suffix, 0), size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code=416,
+            headers={"content-range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+class UploadFileResponse(Response):
+    """
+    Response for an immutable file on local disk, whole or a byte range.
+
+    The file is opened before the response starts, so a file removed since
+    lookup produces a clean 404 instead of a truncated body.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        headers: dict[str, str],
+        byte_range: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Build the response.
+
+        Args:
+            path: File to send
+            stat_result: Its stat (for the total size)
+            headers: Validator, caching and content-type headers
+            byte_range: Inclusive (start, end) to send with 206, or None
+        """
+        size = stat_result.st_size
+        self.path = path
+        if byte_range is None:
+            self.offset, self.count = 0, size
+            status_code = 200
+        else:
+            start, end = byte_range
+            self.offset, self.count = start, end - start + 1
+            headers = {**headers, "content-range": f"bytes {start}-{end}/{size}"}
+            status_code = 206
+        super().__init__(status_code=status_code, headers=headers)
+        self.headers["content-length"] = str(self.count)
+        self.headers["accept-ranges"] = "bytes"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        """Send the headers, then the body via sendfile or chunked reads."""
+        try:
+            file = await anyio.open_file(self.path, mode="rb")
+        except FileNotFoundError as e:
+            raise HTTPException(status_code=404) from e
+
+        async with file:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            if scope["method"] == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+
+            if ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+                await send(
+                    {
+                        "type": ZEROCOPY_EXTENSION,
+                        "file": file.wrapped,
+                        "offset": self.offset,
+                        "count": self.count,
+                        "more_body": False,
+                    }
+                )
+                return
+
+            await file.seek(self.offset)
+            remaining = self.count
+            while True:
+                chunk = await file.read(min(CHUNK_SIZE, remaining))
+                remaining -= len(chunk)
+                more_body = remaining > 0 and len(chunk) > 0
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                if not more_body:
+                    return
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for immutable uploads: strong ETags, ranges and sendfile."""
+
+    def __init__(self, *, directory: str | os.PathLike[str]) -> None:
+        """Serve ``directory`` with an in-process path lookup cache."""
+        super().__init__(directory=directory)
+        self._lookups: ExpiringLRUCache[str, tuple[str, os.stat_result]] = ExpiringLRUCache(
+            max_entries=LOOKUP_CACHE_MAX_ENTRIES
+        )
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Resolve ``path`` (from the lookup cache when possible) and serve it."""
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        # Dotfiles are staging and touch-sidecar files, never uploads
+        if any(part.startswith(".") for part in Path(path).parts):
+            raise HTTPException(status_code=404)
+
+        cached = self._lookups.get(path)
+        if cached is not None:
+            return self.file_response(*cached, scope)
+
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            raise HTTPException(status_code=404)
+        self._lookups.set(
+            path, (full_path, stat_result), expires_at=time.time() + LOOKUP_CACHE_TTL_SECONDS
+        )
+        return self.file_response(full_path, stat_result, scope)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,  # noqa: ARG002
+    ) -> Response:
+        """Build the file response, answering 304 or 206 where the request allows."""
+        headers = {
+            "etag": f'"{Path(full_path).stem}"',
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": IMMUTABLE_CACHE_CONTROL,
+            "content-type": guess_type(str(full_path))[0] or "application/octet-stream",
+        }
+        request_headers = Headers(scope=scope)
+
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+
+        byte_range = None
+        range_header = request_headers.get("range")
+        if range_header and self._if_range_matches(headers, request_headers):
+            byte_range = _parse_range(range_header, stat_result.st_size)
+        return UploadFileResponse(full_path, stat_result, headers, byte_range)
+
+    def is_not_modified(self, response_headers: Headers, request_headers: Headers) -> bool:
+        """
+        Whether a 304 can be returned.
+
+        If-None-Match takes precedence over If-Modified-Since (RFC 9110
+        section 13.2.2), so a stale ETag is never masked by a matching date.
+        """
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or response_headers["etag"] in tags
+        return super().is_not_modified(response_headers, request_headers)
+
+    @staticmethod
+    def _if_range_matches(headers: dict[str, str], request_headers: Headers) -> bool:
+        """Whether the Range may be honoured given If-Range (absent means yes)."""
+        if_range = request_headers.get("if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith('"'):
+            # Strong comparison: weak tags never match
+            return if_range == headers["etag"]
+        try:
+            return parsedate_to_datetime(if_range) == parsedate_to_datetime(
+                headers["last-modified"]
+            )
+        except (TypeError, ValueError):
+            return False
@@ -0,0 +1,16 @@
+"""Object storage backends for uploaded files."""
+
+from app.core.storage.base import IMMUTABLE_CACHE_CONTROL, ObjectInfo, ObjectStorage, PresignedPut
+from app.core.storage.local import LocalStorage
+from app.core.storage.s3 import S3Storage
+from app.core.storage.sigv4 import Credentials
+
+__all__ = [
+    "IMMUTABLE_CACHE_CONTROL",
+    "Credentials",
+    "LocalStorage",
+    "ObjectInfo",
+    "ObjectStorage",
+    "PresignedPut",
+    "S3Storage",
+]
@@ -0,0 +1,131 @@
+"""Object storage interface for uploaded files.
+
+Uploads are staged on local disk (hashed, validated and, for images,
+resized there), then handed to an ``ObjectStorage`` backend under their
+storage key (e.g. "venues/<sha256>.png"). Backends:
+
+- ``LocalStorage``: files under UPLOAD_DIR, served by the API at /uploads
+- ``S3Storage``: any S3-compatible service (AWS S3, MinIO, R2, ...)
+
+Keys are content-addressed and objects are never modified after they are
+written, so backends may serve them with immutable cache headers.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# Cache policy for stored objects (content-addressed, so they never change)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """
+    Metadata of a stored object.
+
+    Attributes:
+        key: Storage key
+        size: Size in bytes
+        last_modified: UNIX time the object was last written or touched
+    """
+
+    key: str
+    size: int
+    last_modified: float
+
+
+@dataclass(frozen=True)
+class PresignedPut:
+    """
+    A signed request a client can use to upload bytes directly to storage.
+
+    Attributes:
+        url: URL to PUT the bytes to
+        headers: Headers the client must send with exactly these values
+        expires_in: Seconds until the URL stops being accepted
+    """
+
+    url: str
+    headers: dict[str, str]
+    expires_in: int
+
+
+class ObjectStorage(ABC):
+    """
+    Backend that stores, lists and deletes uploaded objects.
+
+    Attributes:
+        staging_dir: Local directory uploads are staged in before ``put_file``
+        supports_presigned_uploads: Whether ``presign_put`` is available
+    """
+
+    staging_dir: Path
+    supports_presigned_uploads: bool = False
+
+    @property
+    @abstractmethod
+    def public_base_url(self) -> str:
+        """URL prefix objects are served under (no trailing slash)."""
+
+    def url_for(self, key: str) -> str:
+        """Public URL of an object."""
+        return f"{self.public_base_url}/{key}"
+
+    def key_for_url(self, url: str | None) -> str | None:
+        """
+        Storage key of a public URL produced by ``url_for``.
+
+        Returns:
+            The key, or None for empty URLs and URLs served from elsewhere
+        """
+        prefix = f"{self.public_base_url}/"
+        if not url or not url.startswith(prefix):
+            return None
+        return url.removeprefix(prefix)
+
+    @abstractmethod
+    async def put_file(self, key: str, path: Path, content_type: str) -> None:
+        """
+        Store a staged local file under ``key``, replacing any existing object.
+
+        The backend may move ``path`` instead of copying it; callers should
+        delete it afterwards with ``missing_ok``.
+        """
+
+    @abstractmethod
+    async def stat(self, key: str) -> ObjectInfo | None:
+        """Return the object's metadata, or None if it doesn't exist."""
+
+    @abstractmethod
+    async def touch(self, key: str) -> None:
+        """Make ``stat``/``list_objects`` report now as the object's last_modified."""
+
+    @abstractmethod
+    async def read_head(self, key: str, length: int) -> bytes:
+        """Return the first ``length`` bytes of the object."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete the object (no error if it doesn't exist)."""
+
+    @abstractmethod
+    def list_objects(self, prefix: str = "") -> AsyncIterator[ObjectInfo]:
+        """Iterate over the objects whose keys start with ``prefix``."""
+
+    def presign_put(
+        self,
+        key: str,
+        content_type: str,
+        size: int,
+        sha256_b64: str,
+        expires_in: int,
+    ) -> PresignedPut:
+        """
+        Sign a direct upload of exactly ``size`` bytes hashing to ``sha256_b64``.
+
+        Raises:
+            NotImplementedError: If the backend can't accept direct uploads
+        """
+        raise NotImplementedError
@@ -0,0 +1,138 @@
+"""Local-filesystem object storage (single host; the API serves /uploads)."""
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+from stat import S_ISREG
+
+from app.core.storage.base import ObjectInfo, ObjectStorage
+
+# Suffix of the dotfile recording when an object was last touched
+TOUCH_SUFFIX = ".touched"
+
+
+class LocalStorage(ObjectStorage):
+    """
+    Stores objects as files under a root directory.
+
+    Uploads are staged in the root itself, so moving them into place is an
+    atomic rename on one filesystem. Staged files are dotfiles and are
+    never listed.
+
+    ``touch`` never changes an object's own mtime, which is served as its
+    Last-Modified and must stay fixed for an immutable file. It updates an
+    empty ``.<name>.touched`` sidecar instead, and ``stat``/``list_objects``
+    report the later of the two times as ``last_modified``.
+    """
+
+    def __init__(self, root: Path, base_url: str) -> None:
+        """
+        Create a local backend.
+
+        Args:
+            root: Directory objects are stored under
+            base_url: URL prefix the directory is served at (e.g. "/uploads")
+        """
+        self.root = root
+        self.staging_dir = root
+        self._base_url = base_url.rstrip("/")
+
+    @property
+    def public_base_url(self) -> str:
+        """URL prefix objects are served under."""
+        return self._base_url
+
+    def _path(self, key: str) -> Path:
+        """Filesystem path of a key."""
+        return self.root / key
+
+    @staticmethod
+    def _touch_path(path: Path) -> Path:
+        """Sidecar file whose mtime records when ``path`` was last touched."""
+        return path.with_name(f".{path.name}{TOUCH_SUFFIX}")
+
+    @classmethod
+    def _info(cls, key: str, path: Path, result: os.stat_result) -> ObjectInfo:
+        """Object metadata, counting a touch as a modification."""
+        try:
+            touched_at = cls._touch_path(path).stat().st_mtime
+        except FileNotFoundError:
+            touched_at = result.st_mtime
+        return ObjectInfo(
+            key=key, size=result.st_size, last_modified=max(result.st_mtime, touched_at)
+        )
+
+    async def put_file(self, key: str, path: Path, content_type: str) -> None:  # noqa: ARG002
+        """Flush the staged file to disk and atomically rename it into place."""
+        await asyncio.to_thread(self._move_into_place, path, self._path(key))
+
+    @staticmethod
+    def _move_into_place(source: Path, target: Path) -> None:
+        """fsync ``source`` and rename it to ``target``."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(source, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        source.replace(target)
+
+    async def stat(self, key: str) -> ObjectInfo | None:
+        """Return the file's size and last write or touch time, or None if missing."""
+
+        def _stat() -> ObjectInfo | None:
+            path = self._path(key)
+            try:
+                return self._info(key, path, path.stat())
+            except FileNotFoundError:
+                return None
+
+        return await asyncio.to_thread(_stat)
+
+    async def touch(self, key: str) -> None:
+        """Record a touch in the sidecar file, leaving the object's mtime alone."""
+        await asyncio.to_thread(self._touch_path(self._path(key)).touch)
+
+    async def read_head(self, key: str, length: int) -> bytes:
+        """Read the first ``length`` bytes of the file."""
+
+        def _read() -> bytes:
+            with self._path(key).open("rb") as f:
+                return f.read(length)
+
+        return await asyncio.to_thread(_read)
+
+    async def delete(self, key: str) -> None:
+        """Delete the file and its touch sidecar if present."""
+
+        def _delete() -> None:
+            path = self._path(key)
+            path.unlink(missing_ok=True)
+            self._touch_path(path).unlink(missing_ok=True)
+
+        await asyncio.to_thread(_delete)
+
+    async def list_objects(self, prefix: str = "") -> AsyncIterator[ObjectInfo]:
+        """Iterate over stored files (skipping staged dotfiles) under ``prefix``."""
+        objects = await asyncio.to_thread(self._scan, prefix)
+        for info in objects:
+            yield info
+
+    def _scan(self, prefix: str) -> list[ObjectInfo]:
+        """Walk the directory that can contain ``prefix`` and stat matching files."""
+        directory = self._path(prefix).parent if prefix else self.root
+        if not directory.is_dir():
+            return []
+        objects = []
+        for path in directory.rglob("*"):
+            key = path.relative_to(self.root).as_posix()
+            if path.name.startswith(".") or not key.startswith(prefix):
+                continue
+            try:
+                result = path.stat()
+            except FileNotFoundError:
+                continue
+            if S_ISREG(result.st_mode):
+                objects.append(self._info(key, path, result))
+        return objects
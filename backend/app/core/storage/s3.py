@@ -0,0 +1,206 @@
+"""S3-compatible object storage (AWS S3, MinIO, R2, ...).
+
+Requests go through the shared pooled HTTP client and are signed with
+SigV4 (see sigv4.py). Path-style URLs (``<endpoint>/<bucket>/<key>``) are
+used, so self-hosted services such as MinIO work without DNS set-up.
+Objects are written with immutable cache headers, so a CDN or browser in
+front of the bucket never revalidates them.
+"""
+
+import asyncio
+import hashlib
+import tempfile
+import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import quote
+
+import httpx
+
+from app.core.exceptions import ExternalServiceError
+from app.core.http_client import get_http_client
+from app.core.storage.base import IMMUTABLE_CACHE_CONTROL, ObjectInfo, ObjectStorage, PresignedPut
+from app.core.storage.sigv4 import EMPTY_PAYLOAD_SHA256, Credentials, presign_url, sign_headers
+
+STORAGE_SERVICE_NAME = "Object storage"
+S3_XML_NAMESPACE = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
+# Keys per ListObjectsV2 page (the S3 maximum)
+LIST_PAGE_SIZE = 1000
+
+
+class S3Storage(ObjectStorage):
+    """Stores objects in an S3-compatible bucket."""
+
+    supports_presigned_uploads = True
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        credentials: Credentials,
+        public_base_url: str = "",
+    ) -> None:
+        """
+        Create an S3 backend.
+
+        Args:
+            endpoint_url: Service endpoint (e.g. https://s3.us-east-1.amazonaws.com,
+                http://127.0.0.1:9000 for MinIO or stubs/s3.py)
+            bucket: Bucket name
+            credentials: Signing credentials and region
+            public_base_url: URL prefix objects are served under (CDN or
+                public bucket URL); defaults to the path-style bucket URL
+        """
+        self.bucket = bucket
+        self.bucket_url = f"{endpoint_url.rstrip('/')}/{bucket}"
+        self.credentials = credentials
+        self.staging_dir = Path(tempfile.gettempdir())
+        self._public_base_url = (public_base_url or self.bucket_url).rstrip("/")
+
+    @property
+    def public_base_url(self) -> str:
+        """URL prefix objects are served under."""
+        return self._public_base_url
+
+    def _object_url(self, key: str) -> str:
+        """Path-style URL of an object."""
+        return f"{self.bucket_url}/{quote(key)}"
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+        allowed_statuses: tuple[int, ...] = (),
+    ) -> httpx.Response:
+        """
+        Send a signed request.
+
+        Raises:
+            ExternalServiceError: On transport errors and unexpected statuses
+        """
+        payload_hash = hashlib.sha256(content).hexdigest() if content else EMPTY_PAYLOAD_SHA256
+        signed = sign_headers(method, url, headers or {}, payload_hash, self.credentials)
+        try:
+            response = await get_http_client().request(method, url, headers=signed, content=content)
+        except httpx.HTTPError as e:
+            raise ExternalServiceError(STORAGE_SERVICE_NAME, f"{method} failed: {e!r}") from e
+
+        if response.is_success or response.status_code in allowed_statuses:
+            return response
+        raise ExternalServiceError(
+            STORAGE_SERVICE_NAME,
+            f"{method} returned {response.status_code}",
+            retryable=response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR,
+        )
+
+    async def put_file(self, key: str, path: Path, content_type: str) -> None:
+        """Upload the staged file (uploads are at most a few MB, so one PUT)."""
+        content = await asyncio.to_thread(path.read_bytes)
+        await self._request(
+            "PUT",
+            self._object_url(key),
+            headers={"Content-Type": content_type, "Cache-Control": IMMUTABLE_CACHE_CONTROL},
+            content=content,
+        )
+
+    async def stat(self, key: str) -> ObjectInfo | None:
+        """HEAD the object."""
+        response = await self._request(
+            "HEAD", self._object_url(key), allowed_statuses=(httpx.codes.NOT_FOUND,)
+        )
+        if response.status_code == httpx.codes.NOT_FOUND:
+            return None
+        return ObjectInfo(
+            key=key,
+            size=int(response.headers.get("content-length", 0)),
+            last_modified=parsedate_to_datetime(response.headers["last-modified"]).timestamp(),
+        )
+
+    async def touch(self, key: str) -> None:
+        """Copy the object onto itself, which resets its Last-Modified."""
+        head = await self._request("HEAD", self._object_url(key))
+        await self._request(
+            "PUT",
+            self._object_url(key),
+            headers={
+                "x-amz-copy-source": f"/{self.bucket}/{quote(key)}",
+                "x-amz-metadata-directive": "REPLACE",
+                "Content-Type": head.headers.get("content-type", "application/octet-stream"),
+                "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            },
+        )
+
+    async def read_head(self, key: str, length: int) -> bytes:
+        """Ranged GET of the first ``length`` bytes."""
+        response = await self._request(
+            "GET", self._object_url(key), headers={"Range": f"bytes=0-{length - 1}"}
+        )
+        return response.content[:length]
+
+    async def delete(self, key: str) -> None:
+        """DELETE the object (S3 answers 204 whether or not it existed)."""
+        await self._request(
+            "DELETE", self._object_url(key), allowed_statuses=(httpx.codes.NOT_FOUND,)
+        )
+
+    async def list_objects(self, prefix: str = "") -> AsyncIterator[ObjectInfo]:
+        """Page through ListObjectsV2 results."""
+        token: str | None = None
+        while True:
+            params = {"list-type": "2", "max-keys": str(LIST_PAGE_SIZE), "prefix": prefix}
+            if token:
+                params["continuation-token"] = token
+            url = f"{self.bucket_url}?{httpx.QueryParams(params)}"
+            response = await self._request("GET", url)
+
+            # Response comes from our own bucket over an authenticated request
+            root = ET.fromstring(response.content)  # noqa: S314
+            for item in root.iterfind("s3:Contents", S3_XML_NAMESPACE):
+                modified = item.findtext("s3:LastModified", "", S3_XML_NAMESPACE)
+                yield ObjectInfo(
+                    key=item.findtext("s3:Key", "", S3_XML_NAMESPACE),
+                    size=int(item.findtext("s3:Size", "0", S3_XML_NAMESPACE)),
+                    last_modified=_parse_iso_timestamp(modified),
+                )
+            if root.findtext("s3:IsTruncated", "false", S3_XML_NAMESPACE) != "true":
+                return
+            token = root.findtext("s3:NextContinuationToken", None, S3_XML_NAMESPACE)
+
+    def presign_put(
+        self,
+        key: str,
+        content_type: str,
+        size: int,
+        sha256_b64: str,
+        expires_in: int,
+    ) -> PresignedPut:
+        """
+        Sign a PUT bound to the content's type, length and SHA-256.
+
+        Storage verifies the x-amz-checksum-sha256 header against the body,
+        so the object stored under a content-addressed key really has that
+        hash. The browser sets Content-Length itself; it is signed too.
+        """
+        headers = {
+            "Content-Type": content_type,
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            "x-amz-checksum-sha256": sha256_b64,
+        }
+        url = presign_url(
+            "PUT",
+            self._object_url(key),
+            {**headers, "Content-Length": str(size)},
+            expires_in,
+            self.credentials,
+        )
+        return PresignedPut(url=url, headers=headers, expires_in=expires_in)
+
+
+def _parse_iso_timestamp(value: str) -> float:
+    """Parse an S3 ISO 8601 timestamp (e.g. 2026-04-04T10:00:00.000Z) to UNIX time."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
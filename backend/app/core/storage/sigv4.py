@@ -0,0 +1,227 @@
+"""AWS Signature Version 4 for S3-compatible object storage.
+
+Implements the two signing forms the storage backend needs, without an AWS
+SDK dependency:
+
+- ``sign_headers``: an ``Authorization`` header for server-side calls
+- ``presign_url``: a query-string signed URL a client can use directly
+  (for direct-to-storage uploads)
+
+``signature`` is the shared core and is also used by stubs/s3.py to verify
+requests. See https://docs.aws.amazon.com/IAM/latest/UserGuide/reference_sigv4-create-signed-request.html
+"""
+
+import hashlib
+import hmac
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from urllib.parse import parse_qsl, quote, unquote, urlsplit
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+SERVICE = "s3"
+TERMINATOR = "aws4_request"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+EMPTY_PAYLOAD_SHA256 = hashlib.sha256(b"").hexdigest()
+AMZ_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+# Presigned URLs are valid for at most 7 days
+MAX_PRESIGN_EXPIRES_SECONDS = 7 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """
+    Access key pair and region requests are signed for.
+
+    Attributes:
+        access_key_id: Access key id
+        secret_access_key: Secret access key
+        region: Signing region (e.g. "us-east-1")
+    """
+
+    access_key_id: str
+    secret_access_key: str
+    region: str
+
+
+def _encode(value: str, *, safe: str = "-_.~") -> str:
+    """URI-encode per SigV4 (RFC 3986 unreserved characters kept)."""
+    return quote(value, safe=safe)
+
+
+def _canonical_query(params: list[tuple[str, str]]) -> str:
+    """Encode and sort query parameters."""
+    return "&".join(f"{_encode(k)}={_encode(v)}" for k, v in sorted(params))
+
+
+def _scope(date_stamp: str, region: str) -> str:
+    """Credential scope for a signing date and region."""
+    return f"{date_stamp}/{region}/{SERVICE}/{TERMINATOR}"
+
+
+def signature(  # noqa: PLR0913, PLR0917
+    method: str,
+    path: str,
+    query: list[tuple[str, str]],
+    headers: dict[str, str],
+    payload_hash: str,
+    amz_date: str,
+    credentials: Credentials,
+) -> str:
+    """
+    Compute the SigV4 signature of a request.
+
+    Args:
+        method: HTTP method
+        path: Decoded request path (encoded here, "/" kept)
+        query: Query parameters to sign (excluding X-Amz-Signature)
+        headers: Signed headers, lower-case names
+        payload_hash: Hex SHA-256 of the body, or UNSIGNED_PAYLOAD
+        amz_date: Request timestamp (YYYYMMDDTHHMMSSZ)
+        credentials: Signing credentials
+
+    Returns:
+        Hex signature
+    """
+    names = sorted(headers)
+    canonical_request = "\n".join(
+        [
+            method,
+            _encode(path, safe="/-_.~"),
+            _canonical_query(query),
+            "".join(f"{name}:{' '.join(headers[name].split())}\n" for name in names),
+            ";".join(names),
+            payload_hash,
+        ]
+    )
+    date_stamp = amz_date[:8]
+    string_to_sign = "\n".join(
+        [
+            ALGORITHM,
+            amz_date,
+            _scope(date_stamp, credentials.region),
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+
+    key = f"AWS4{credentials.secret_access_key}".encode()
+    for part in (date_stamp, credentials.region, SERVICE, TERMINATOR):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+
+def sign_headers(  # noqa: PLR0913, PLR0917
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    payload_hash: str,
+    credentials: Credentials,
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """
+    Sign a request with an Authorization header.
+
+    Args:
+        method: HTTP method
+        url: Full request URL (path already percent-encoded, as sent)
+        headers: Extra headers to send and sign
+        payload_hash: Hex SHA-256 of the body, or UNSIGNED_PAYLOAD
+        credentials: Signing credentials
+        now: Signing time (defaults to the current time)
+
+    Returns:
+        The headers to send: the given ones plus host, x-amz-date,
+        x-amz-content-sha256 and authorization
+    """
+    parts = urlsplit(url)
+    amz_date = (now or datetime.now(UTC)).strftime(AMZ_DATE_FORMAT)
+    signed = {name.lower(): value for name, value in headers.items()}
+    signed.update(
+        {
+            "host": parts.netloc,
+            "x-amz-date": amz_date,
+            "x-amz-content-sha256": payload_hash,
+        }
+    )
+    query = _parse_query(parts.query)
+    sig = signature(
+        method,
+        _decoded_path(parts.path),
+        query,
+        signed,
+        payload_hash,
+        amz_date,
+        credentials,
+    )
+    scope = _scope(amz_date[:8], credentials.region)
+    signed["authorization"] = (
+        f"{ALGORITHM} Credential={credentials.access_key_id}/{scope}, "
+        f"SignedHeaders={';'.join(sorted(n for n in signed if n != 'authorization'))}, "
+        f"Signature={sig}"
+    )
+    return signed
+
+
+def presign_url(  # noqa: PLR0913, PLR0917
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    expires_seconds: int,
+    credentials: Credentials,
+    now: datetime | None = None,
+) -> str:
+    """
+    Build a query-string signed URL.
+
+    Every header in ``headers`` is signed, so the client must send exactly
+    those values (storage rejects the request otherwise). The body is not
+    signed; sign a checksum header to bind the content.
+
+    Args:
+        method: HTTP method the URL is valid for
+        url: Object URL (path already percent-encoded)
+        headers: Headers the client must send
+        expires_seconds: Validity period (at most 7 days)
+        credentials: Signing credentials
+        now: Signing time (defaults to the current time)
+
+    Returns:
+        The signed URL
+    """
+    parts = urlsplit(url)
+    amz_date = (now or datetime.now(UTC)).strftime(AMZ_DATE_FORMAT)
+    signed = {name.lower(): value for name, value in headers.items()}
+    signed["host"] = parts.netloc
+    query = [
+        *_parse_query(parts.query),
+        ("X-Amz-Algorithm", ALGORITHM),
+        (
+            "X-Amz-Credential",
+            f"{credentials.access_key_id}/{_scope(amz_date[:8], credentials.region)}",
+        ),
+        ("X-Amz-Date", amz_date),
+        ("X-Amz-Expires", str(min(expires_seconds, MAX_PRESIGN_EXPIRES_SECONDS))),
+        ("X-Amz-SignedHeaders", ";".join(sorted(signed))),
+    ]
+    sig = signature(
+        method,
+        _decoded_path(parts.path),
+        query,
+        signed,
+        UNSIGNED_PAYLOAD,
+        amz_date,
+        credentials,
+    )
+    return (
+        f"{parts.scheme}://{parts.netloc}{parts.path}"
+        f"?{_canonical_query(query)}&X-Amz-Signature={sig}"
+    )
+
+
+def _parse_query(query: str) -> list[tuple[str, str]]:
+    """Split a raw query string into decoded (name, value) pairs."""
+    return parse_qsl(query, keep_blank_values=True)
+
+
+def _decoded_path(path: str) -> str:
+    """Decode a percent-encoded path so ``signature`` can re-encode it canonically."""
+    return unquote(path) or "/"
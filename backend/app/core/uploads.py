@@ -1,26 +1,86 @@
 """File upload utility for handling image uploads.
 
-Provides a shared upload function that validates file type and size,
-generates a unique filename, and saves the file to the local uploads directory.
+Provides a shared upload function that streams the file to a local staging
+file in chunks, enforcing the size limit as it goes, detects the image type
+from the file's magic bytes, and hands the result to the configured object
+storage backend (see app.core.storage; STORAGE_BACKEND selects local disk
+or an S3-compatible service).
+
+Uploads are content-addressed: each file is stored under the SHA-256 of its
+bytes, so identical uploads share one object and an object never changes
+once written (safe to cache forever). References from database rows are
+counted in upload_blobs; objects nothing refers to any more are removed by
+the upload garbage collector (see app.modules.uploads.services).
+
+Images can additionally be rendered into resized derivatives (thumbnail,
+card, full) in WebP and JPEG. Decoding and resizing are CPU-bound, so they
+run in a process pool (started and stopped by the application lifespan)
+and never block the event loop.
+
+With an S3 backend, clients can also upload directly to storage: the API
+presigns a PUT bound to the file's type, size and hash, and afterwards only
+verifies and records the resulting key.
 """
 
 import asyncio
-import uuid
+import base64
+import hashlib
+import multiprocessing
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
 
 from fastapi import UploadFile
+from PIL import Image, ImageOps
 
+from app.core.config import settings
 from app.core.exceptions import BusinessRuleError
+from app.core.storage import (
+    Credentials,
+    LocalStorage,
+    ObjectStorage,
+    PresignedPut,
+    S3Storage,
+)
+
+if TYPE_CHECKING:
+    from hashlib import _Hash
 
 # Upload configuration
 UPLOAD_DIR = "uploads"
+UPLOAD_URL_PREFIX = f"/{UPLOAD_DIR}"
 ALLOWED_IMAGE_TYPES: set[str] = {"image/png", "image/jpeg", "image/webp"}
 MAX_FILE_SIZE_BYTES = 5 * 1024 * 1024  # 5MB
+UPLOAD_CHUNK_SIZE = 64 * 1024  # Bytes read (and held in memory) at a time
+
+# Staged uploads are dotfiles in the backend's staging directory (for local
+# storage, UPLOAD_DIR itself, so moving them into place is an atomic rename)
+TEMP_FILE_PREFIX = ".upload-"
+TEMP_FILE_SUFFIX = ".part"
+
+# Content-addressed originals are "<sha256 hex><ext>"; derivatives add "-<size>"
+CONTENT_ORIGINAL_PATTERN = re.compile(r"^[0-9a-f]{64}\.[a-z]+$")
+SHA256_HEX_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+# Bytes needed to recognize every allowed format by its signature
+SNIFF_LENGTH = 16
+
+# Storage backends (STORAGE_BACKEND setting)
+STORAGE_BACKEND_LOCAL = "local"
+STORAGE_BACKEND_S3 = "s3"
 
 # Error messages
 INVALID_FILE_TYPE_MSG = "Invalid file type. Allowed types: PNG, JPEG, WebP."
 FILE_TOO_LARGE_MSG = "File too large. Maximum size is 5MB."
 EMPTY_FILE_MSG = "Uploaded file is empty."
+SAVE_FAILED_MSG = "Failed to save the uploaded file. Please try again."
+INVALID_IMAGE_MSG = "Uploaded image could not be processed."
+INVALID_CHECKSUM_MSG = "Invalid SHA-256 checksum; expected 64 hex characters."
+DIRECT_UPLOADS_UNSUPPORTED_MSG = "Direct uploads are not available; upload the file instead."
+INVALID_UPLOAD_KEY_MSG = "Invalid upload key."
+UPLOAD_NOT_FOUND_MSG = "Upload not found. PUT the file to the presigned URL first."
 
 # Extension mapping for content types
 CONTENT_TYPE_EXTENSIONS: dict[str, str] = {
@@ -28,76 +88,607 @@ CONTENT_TYPE_EXTENSIONS: dict[str, str] = {
     "image/jpeg": ".jpg",
     "image/webp": ".webp",
 }
+EXTENSION_CONTENT_TYPES: dict[str, str] = {
+    extension: content_type for content_type, extension in CONTENT_TYPE_EXTENSIONS.items()
+}
+
+# Magic-byte signatures at the start of each allowed format
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+RIFF_SIGNATURE = b"RIFF"  # WebP: "RIFF" <4-byte size> "WEBP"
+WEBP_SIGNATURE = b"WEBP"
+WEBP_SIGNATURE_OFFSET = 8
+
+# Image derivatives: name -> longest edge in pixels (images are never upscaled)
+IMAGE_DERIVATIVE_SIZES: dict[str, int] = {"thumbnail": 128, "card": 480, "full": 1200}
+# Derivative formats: key -> (Pillow format, extension, quality)
+IMAGE_DERIVATIVE_FORMATS: dict[str, tuple[str, str, int]] = {
+    "webp": ("WEBP", ".webp", 80),
+    "jpeg": ("JPEG", ".jpg", 85),
+}
+# Refuse to decode images above this many pixels (decompression bombs)
+IMAGE_MAX_PIXELS = 40_000_000
+# JPEG has no alpha channel; transparent logos are flattened onto white
+JPEG_BACKGROUND = (255, 255, 255)
+
+# Derivative map as stored on logo_variants: size name -> width, height and
+# one URL per derivative format
+ImageVariants = dict[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ImageUpload:
+    """A stored original image plus its resized derivatives.
+
+    Attributes:
+        key: Storage key of the original (e.g., "venues/<sha256>.png")
+        url: URL of the original upload
+        variants: Derivative URLs and dimensions by size name, or None when
+            none were rendered (direct uploads)
+    """
+
+    key: str
+    url: str
+    variants: ImageVariants | None
+
+
+@dataclass(frozen=True)
+class PresignedImageUpload:
+    """Where and how a client uploads an image directly to storage.
+
+    Attributes:
+        key: Storage key the image will have (confirm it once uploaded)
+        upload: The signed PUT, or None if the bytes are already stored
+    """
 
+    key: str
+    upload: PresignedPut | None
 
-def _validate_content_type(content_type: str | None) -> str:
-    """Validate that the file content type is allowed.
+
+@dataclass(frozen=True)
+class _StagedUpload:
+    """An upload streamed to a local staging file, not yet stored."""
+
+    path: Path
+    digest: str
+    content_type: str
+
+    def key(self, subfolder: str, suffix: str = "") -> str:
+        """Storage key of the original (or, with ``suffix``, a derivative)."""
+        extension = CONTENT_TYPE_EXTENSIONS[self.content_type]
+        return _content_key(subfolder, self.digest, suffix, extension)
+
+
+_storage: ObjectStorage | None = None
+_image_pool: ProcessPoolExecutor | None = None
+
+
+def get_storage() -> ObjectStorage:
+    """Return the configured object storage backend, creating it on first use."""
+    global _storage  # noqa: PLW0603
+    if _storage is None:
+        if settings.STORAGE_BACKEND == STORAGE_BACKEND_S3:
+            _storage = S3Storage(
+                endpoint_url=settings.S3_ENDPOINT_URL,
+                bucket=settings.S3_BUCKET,
+                credentials=Credentials(
+                    access_key_id=settings.S3_ACCESS_KEY_ID,
+                    secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+                    region=settings.S3_REGION,
+                ),
+                public_base_url=settings.S3_PUBLIC_BASE_URL,
+            )
+        else:
+            _storage = LocalStorage(Path(UPLOAD_DIR), base_url=UPLOAD_URL_PREFIX)
+    return _storage
+
+
+def _sniff_content_type(head: bytes) -> str:
+    """Detect the image type from the file's first bytes.
+
+    The client-supplied content type is not trusted; only the magic bytes
+    decide what the file is (and which extension it is saved with).
 
     Args:
-        content_type: MIME type of the uploaded file.
+        head: First chunk of the uploaded file.
 
     Returns:
-        Validated content type string.
+        Detected MIME type (one of ALLOWED_IMAGE_TYPES).
 
     Raises:
-        BusinessRuleError: If content type is not allowed.
+        BusinessRuleError: If the bytes don't match an allowed image format.
     """
-    if not content_type or content_type not in ALLOWED_IMAGE_TYPES:
-        raise BusinessRuleError(INVALID_FILE_TYPE_MSG)
-    return content_type
+    if head.startswith(PNG_SIGNATURE):
+        return "image/png"
+    if head.startswith(JPEG_SIGNATURE):
+        return "image/jpeg"
+    webp_end = WEBP_SIGNATURE_OFFSET + len(WEBP_SIGNATURE)
+    if head.startswith(RIFF_SIGNATURE) and head[WEBP_SIGNATURE_OFFSET:webp_end] == WEBP_SIGNATURE:
+        return "image/webp"
+    raise BusinessRuleError(INVALID_FILE_TYPE_MSG)
+
+
+def _content_key(subfolder: str, digest: str, suffix: str, extension: str) -> str:
+    """Build a content-addressed storage key.
+
+    Args:
+        subfolder: Key prefix (e.g., "organizations", "venues").
+        digest: SHA-256 hex digest of the original's bytes.
+        suffix: "" for the original, "-<size>" for a derivative.
+        extension: File extension including the dot.
+
+    Returns:
+        Storage key (e.g., "venues/9f86d081...0f00a08.png").
+    """
+    return f"{subfolder}/{digest}{suffix}{extension}"
 
 
-def _generate_unique_filename(content_type: str) -> str:
-    """Generate a unique filename using UUID and file extension.
+def upload_key(url: str | None) -> str | None:
+    """Storage key for an upload URL.
 
     Args:
-        content_type: MIME type used to determine extension.
+        url: Stored URL such as "/uploads/venues/<sha256>.png".
 
     Returns:
-        Unique filename string (e.g., "a1b2c3d4.png").
+        The key (e.g., "venues/<sha256>.png"), or None if the URL is empty
+        or doesn't point into the configured storage.
     """
-    extension = CONTENT_TYPE_EXTENSIONS[content_type]
-    return f"{uuid.uuid4()}{extension}"
+    return get_storage().key_for_url(url)
+
+
+def _open_temp_file(staging_dir: Path) -> IO[bytes]:
+    """Create the staging directory and an in-progress temp file inside it."""
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    # Closed by _close_staged or _discard
+    return tempfile.NamedTemporaryFile(
+        dir=staging_dir,
+        prefix=TEMP_FILE_PREFIX,
+        suffix=TEMP_FILE_SUFFIX,
+        delete=False,
+    )
+
+
+def _write_chunk(temp_file: IO[bytes], digest: "_Hash", chunk: bytes) -> None:
+    """Append a chunk to the temp file and fold it into the running hash."""
+    digest.update(chunk)
+    temp_file.write(chunk)
+
+
+def _close_staged(temp_file: IO[bytes]) -> None:
+    """Flush and close a fully written temp file."""
+    temp_file.flush()
+    temp_file.close()
+
+
+def _discard(temp_file: IO[bytes]) -> None:
+    """Close and delete an abandoned temp file."""
+    temp_file.close()
+    Path(temp_file.name).unlink(missing_ok=True)
+
+
+def _unlink_all(paths: list[Path]) -> None:
+    """Delete staged files that weren't moved into storage."""
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+async def _store(storage: ObjectStorage, key: str, path: Path, content_type: str) -> None:
+    """Store a staged file under ``key`` unless identical content is already there.
+
+    Keys are content hashes, so an existing object has the same bytes. It is
+    touched instead, restarting the garbage collector's grace period before
+    the caller takes its reference.
+    """
+    try:
+        if await storage.stat(key) is not None:
+            await storage.touch(key)
+            return
+        await storage.put_file(key, path, content_type)
+    except OSError as exc:
+        raise BusinessRuleError(SAVE_FAILED_MSG) from exc
 
 
 async def save_upload(file: UploadFile, subfolder: str) -> str:
-    """Save an uploaded file to the local uploads directory.
+    """Stream an uploaded file into object storage.
 
-    Validates file type and size, generates a unique filename,
-    creates the target directory if needed, and writes the file.
+    See ``_stage_upload`` for how the file is validated and staged. An
+    upload whose bytes are already stored resolves to the existing object.
 
     Args:
         file: The uploaded file from the request.
-        subfolder: Subdirectory under uploads/ (e.g., "organizations", "venues").
+        subfolder: Key prefix (e.g., "organizations", "venues").
 
     Returns:
-        Relative URL path (e.g., "/uploads/organizations/uuid.png").
+        Public URL (e.g., "/uploads/organizations/<sha256>.png").
 
     Raises:
         BusinessRuleError: If file type is invalid or file is too large.
     """
-    content_type = _validate_content_type(file.content_type)
+    storage = get_storage()
+    staged = await _stage_upload(file, storage.staging_dir)
+    key = staged.key(subfolder)
+    try:
+        await _store(storage, key, staged.path, staged.content_type)
+    finally:
+        await asyncio.to_thread(_unlink_all, [staged.path])
+    return storage.url_for(key)
+
+
+async def save_image_upload(file: UploadFile, subfolder: str) -> ImageUpload:
+    """Store an uploaded image and its resized derivatives.
+
+    The original is staged as by ``save_upload``; the derivatives are
+    rendered from the staged file in the image process pool, then all of
+    them are stored concurrently as ``<sha256>-<size>.<ext>``. Nothing is
+    stored if the image can't be decoded. Rendering is deterministic, so
+    re-rendering a deduplicated upload produces identical derivatives.
+
+    Args:
+        file: The uploaded image from the request.
+        subfolder: Key prefix (e.g., "organizations", "venues").
+
+    Returns:
+        The original's key and URL and the derivative map.
+
+    Raises:
+        BusinessRuleError: If the file is not a valid image or is too large.
+    """
+    storage = get_storage()
+    staged = await _stage_upload(file, storage.staging_dir)
+    staged_paths = [staged.path]
+    loop = asyncio.get_running_loop()
+    try:
+        try:
+            rendered = await loop.run_in_executor(
+                get_image_pool(),
+                _render_derivatives,
+                str(staged.path),
+                str(storage.staging_dir),
+            )
+        except ValueError as exc:
+            raise BusinessRuleError(INVALID_IMAGE_MSG) from exc
+
+        key = staged.key(subfolder)
+        stores = [_store(storage, key, staged.path, staged.content_type)]
+        variants: ImageVariants = {}
+        for size_name, variant in rendered.items():
+            variants[size_name] = {"width": variant["width"], "height": variant["height"]}
+            for format_key, (_, extension, _) in IMAGE_DERIVATIVE_FORMATS.items():
+                derivative_key = _content_key(subfolder, staged.digest, f"-{size_name}", extension)
+                derivative_path = Path(variant[format_key])
+                staged_paths.append(derivative_path)
+                stores.append(
+                    _store(
+                        storage,
+                        derivative_key,
+                        derivative_path,
+                        EXTENSION_CONTENT_TYPES[extension],
+                    )
+                )
+                variants[size_name][format_key] = storage.url_for(derivative_key)
+        await asyncio.gather(*stores)
+    finally:
+        await asyncio.to_thread(_unlink_all, staged_paths)
+
+    return ImageUpload(key=key, url=storage.url_for(key), variants=variants)
+
+
+def _presigned_image_key(
+    subfolder: str,
+    content_type: str,
+    size: int,
+    sha256: str,
+) -> str:
+    """Validate a direct-upload request and return the key it will store to.
 
-    # Read file content and validate size
-    content = await file.read()
+    Args:
+        subfolder: Key prefix (e.g., "organizations", "venues").
+        content_type: Declared MIME type of the image.
+        size: Declared size in bytes.
+        sha256: Declared SHA-256 of the bytes, hex-encoded.
+
+    Returns:
+        The content-addressed storage key.
 
-    if not content:
+    Raises:
+        BusinessRuleError: If the type, size or checksum is invalid, or the
+            storage backend can't accept direct uploads.
+    """
+    if not get_storage().supports_presigned_uploads:
+        raise BusinessRuleError(DIRECT_UPLOADS_UNSUPPORTED_MSG)
+    if content_type not in ALLOWED_IMAGE_TYPES:
+        raise BusinessRuleError(INVALID_FILE_TYPE_MSG)
+    if size <= 0:
         raise BusinessRuleError(EMPTY_FILE_MSG)
+    if size > MAX_FILE_SIZE_BYTES:
+        raise BusinessRuleError(FILE_TOO_LARGE_MSG)
+    if not SHA256_HEX_PATTERN.match(sha256):
+        raise BusinessRuleError(INVALID_CHECKSUM_MSG)
+    return _content_key(subfolder, sha256, "", CONTENT_TYPE_EXTENSIONS[content_type])
+
+
+async def create_presigned_image_upload(
+    subfolder: str,
+    content_type: str,
+    size: int,
+    sha256: str,
+) -> PresignedImageUpload:
+    """Presign a direct-to-storage image upload.
+
+    The PUT is bound to the declared type, size and SHA-256 (storage
+    rejects any other bytes), and the key is derived from the hash. If the
+    content is already stored no URL is issued; the client can confirm the
+    key straight away.
 
-    if len(content) > MAX_FILE_SIZE_BYTES:
+    Args:
+        subfolder: Key prefix (e.g., "organizations", "venues").
+        content_type: Declared MIME type of the image.
+        size: Declared size in bytes.
+        sha256: Declared SHA-256 of the bytes, hex-encoded.
+
+    Returns:
+        The key and, unless already stored, the signed PUT.
+
+    Raises:
+        BusinessRuleError: If the type, size or checksum is invalid, or the
+            storage backend can't accept direct uploads.
+    """
+    key = _presigned_image_key(subfolder, content_type, size, sha256)
+    storage = get_storage()
+    if await storage.stat(key) is not None:
+        await storage.touch(key)
+        return PresignedImageUpload(key=key, upload=None)
+
+    upload = storage.presign_put(
+        key,
+        content_type=content_type,
+        size=size,
+        # S3 checksum headers carry the digest base64-encoded
+        sha256_b64=base64.b64encode(bytes.fromhex(sha256)).decode(),
+        expires_in=settings.UPLOAD_PRESIGN_EXPIRES_SECONDS,
+    )
+    return PresignedImageUpload(key=key, upload=upload)
+
+
+async def confirm_image_upload(subfolder: str, key: str) -> ImageUpload:
+    """Verify a directly uploaded image before its key is recorded.
+
+    Checks the key is a content-addressed original under ``subfolder``,
+    that the object exists and is within the size limit, and that its
+    magic bytes match its extension. Invalid objects are deleted. No bytes
+    beyond the signature are read and no derivatives are rendered.
+
+    Args:
+        subfolder: Key prefix the upload was presigned under.
+        key: Key returned by ``create_presigned_image_upload``.
+
+    Returns:
+        The key and URL (variants None).
+
+    Raises:
+        BusinessRuleError: If the key is invalid, the object is missing, or
+            it isn't an allowed image within the size limit.
+    """
+    prefix, _, name = key.rpartition("/")
+    extension = Path(name).suffix
+    if (
+        prefix != subfolder
+        or not CONTENT_ORIGINAL_PATTERN.match(name)
+        or extension not in EXTENSION_CONTENT_TYPES
+    ):
+        raise BusinessRuleError(INVALID_UPLOAD_KEY_MSG)
+
+    storage = get_storage()
+    info = await storage.stat(key)
+    if info is None:
+        raise BusinessRuleError(UPLOAD_NOT_FOUND_MSG)
+
+    try:
+        if info.size > MAX_FILE_SIZE_BYTES:
+            raise BusinessRuleError(FILE_TOO_LARGE_MSG)
+        if _sniff_content_type(await storage.read_head(key, SNIFF_LENGTH)) != (
+            EXTENSION_CONTENT_TYPES[extension]
+        ):
+            raise BusinessRuleError(INVALID_FILE_TYPE_MSG)
+    except BusinessRuleError:
+        # Content-addressed, so nothing valid can be referencing these bytes
+        await storage.delete(key)
+        raise
+
+    return ImageUpload(key=key, url=storage.url_for(key), variants=None)
+
+
+def get_image_pool() -> ProcessPoolExecutor:
+    """Return the image process pool, creating it on first use.
+
+    Workers are spawned rather than forked so they don't inherit the event
+    loop, open sockets or threads of the API process.
+    """
+    global _image_pool  # noqa: PLW0603
+    if _image_pool is None:
+        _image_pool = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _image_pool
+
+
+def shutdown_image_pool() -> None:
+    """Stop the image process pool, abandoning queued (not running) jobs."""
+    global _image_pool  # noqa: PLW0603
+    if _image_pool is not None:
+        _image_pool.shutdown(wait=True, cancel_futures=True)
+        _image_pool = None
+
+
+async def remove_upload_files(key: str, older_than: float) -> bool:
+    """Delete an unreferenced upload and its derivatives from storage.
+
+    Objects touched since ``older_than`` are kept: an upload that just
+    deduplicated against them may be about to take a reference.
+
+    Args:
+        key: Storage key of the original (e.g., "venues/<sha256>.png").
+        older_than: UNIX time; only objects last modified before it are removed.
+
+    Returns:
+        True if the objects were removed (or were already gone).
+    """
+    storage = get_storage()
+    info = await storage.stat(key)
+    if info is not None and info.last_modified >= older_than:
+        return False
+    # Derivatives share the original's "<subfolder>/<sha256>" prefix
+    stem = key.rsplit(".", 1)[0]
+    async for stored in storage.list_objects(prefix=stem):
+        await storage.delete(stored.key)
+    return True
+
+
+async def find_unclaimed_uploads(older_than: float) -> list[str]:
+    """List content-addressed originals last modified before ``older_than``.
+
+    Legacy (UUID-named) uploads are never listed.
+
+    Args:
+        older_than: UNIX time cut-off.
+
+    Returns:
+        Storage keys of the matching originals.
+    """
+    return [
+        info.key
+        async for info in get_storage().list_objects()
+        if info.last_modified < older_than
+        and CONTENT_ORIGINAL_PATTERN.match(info.key.rpartition("/")[2])
+    ]
+
+
+def sweep_staging_files(older_than: float) -> int:
+    """Delete staged files abandoned by crashed uploads (blocking I/O).
+
+    Args:
+        older_than: UNIX time; only files last modified before it are removed.
+
+    Returns:
+        Number of files removed.
+    """
+    staging_dir = get_storage().staging_dir
+    removed = 0
+    for path in staging_dir.glob(f"{TEMP_FILE_PREFIX}*{TEMP_FILE_SUFFIX}"):
+        try:
+            if path.stat().st_mtime < older_than:
+                path.unlink(missing_ok=True)
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+def _render_derivatives(source: str, output_dir: str) -> dict[str, dict[str, Any]]:
+    """Render every derivative of an image (runs in the process pool).
+
+    Each file is written to its own staging file in ``output_dir``.
+
+    Args:
+        source: Path of the staged original.
+        output_dir: Directory to write the derivatives to.
+
+    Returns:
+        Per size name: width, height and the staged path of each format.
+
+    Raises:
+        ValueError: If the file can't be decoded as an image (or is too large
+            in pixels); raised as a plain ValueError so it pickles cleanly.
+    """
+    Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+    try:
+        with Image.open(source) as opened:
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+    except (OSError, Image.DecompressionBombError) as exc:
+        raise ValueError(str(exc)) from None
+
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    rendered: dict[str, dict[str, Any]] = {}
+    for size_name, edge in IMAGE_DERIVATIVE_SIZES.items():
+        resized = image.copy()
+        resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+        variant: dict[str, Any] = {"width": resized.width, "height": resized.height}
+        for format_key, (pil_format, extension, quality) in IMAGE_DERIVATIVE_FORMATS.items():
+            output = resized
+            if pil_format == "JPEG" and has_alpha:
+                output = Image.new("RGB", resized.size, JPEG_BACKGROUND)
+                output.paste(resized, mask=resized.getchannel("A"))
+            with tempfile.NamedTemporaryFile(
+                dir=output_dir,
+                prefix=TEMP_FILE_PREFIX,
+                suffix=f"{extension}{TEMP_FILE_SUFFIX}",
+                delete=False,
+            ) as staged:
+                output.save(staged, pil_format, quality=quality, optimize=True)
+            variant[format_key] = staged.name
+        rendered[size_name] = variant
+    return rendered
+
+
+async def _stage_upload(file: UploadFile, staging_dir: Path) -> _StagedUpload:
+    """Stream an uploaded file into a local staging file.
+
+    Reads the upload in UPLOAD_CHUNK_SIZE chunks, so memory use stays flat
+    however large the file is, and aborts as soon as MAX_FILE_SIZE_BYTES is
+    exceeded. The type is sniffed from the first chunk. Chunks are hashed
+    and written to a staging file (off the event loop); the storage backend
+    moves or copies it to its content-addressed key only once complete, so
+    a partial file is never visible under a final key.
+
+    Args:
+        file: The uploaded file from the request.
+        staging_dir: Directory to stage the file in.
+
+    Returns:
+        The staging file, its SHA-256 hex digest and its detected type.
+
+    Raises:
+        BusinessRuleError: If file type is invalid or file is too large.
+    """
+    # Reject early when the multipart parser already knows the size
+    if file.size is not None and file.size > MAX_FILE_SIZE_BYTES:
         raise BusinessRuleError(FILE_TOO_LARGE_MSG)
 
-    # Generate unique filename and build path
-    filename = _generate_unique_filename(content_type)
-    target_dir = Path(UPLOAD_DIR) / subfolder
-    file_path = target_dir / filename
+    head = await file.read(UPLOAD_CHUNK_SIZE)
+    if not head:
+        raise BusinessRuleError(EMPTY_FILE_MSG)
+
+    content_type = _sniff_content_type(head)
 
-    # Perform blocking I/O off the async event loop
     try:
-        await asyncio.to_thread(target_dir.mkdir, parents=True, exist_ok=True)
-        await asyncio.to_thread(file_path.write_bytes, content)
+        temp_file = await asyncio.to_thread(_open_temp_file, staging_dir)
+    except OSError as exc:
+        raise BusinessRuleError(SAVE_FAILED_MSG) from exc
+
+    try:
+        digest = hashlib.sha256()
+        size = 0
+        chunk = head
+        while chunk:
+            size += len(chunk)
+            if size > MAX_FILE_SIZE_BYTES:
+                raise BusinessRuleError(FILE_TOO_LARGE_MSG)
+            await asyncio.to_thread(_write_chunk, temp_file, digest, chunk)
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+
+        await asyncio.to_thread(_close_staged, temp_file)
     except OSError as exc:
-        msg = "Failed to save the uploaded file. Please try again."
-        raise BusinessRuleError(msg) from exc
+        await asyncio.to_thread(_discard, temp_file)
+        raise BusinessRuleError(SAVE_FAILED_MSG) from exc
+    except BaseException:
+        await asyncio.to_thread(_discard, temp_file)
+        raise
 
-    return f"/{UPLOAD_DIR}/{subfolder}/{filename}"
+    return _StagedUpload(
+        path=Path(temp_file.name),
+        digest=digest.hexdigest(),
+        content_type=content_type,
+    )
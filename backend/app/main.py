@@ -1,30 +1,41 @@
 """FastAPI application entry point for VenueLink backend."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from pathlib import Path
+from typing import Any
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
 from sqlalchemy import text
 
+from app.core.admin import require_admin_token
 from app.core.config import settings
-from app.core.database import engine
+from app.core.database import engine, read_engine, slow_query_log
+from app.core.database.pool import pool_status
+from app.core.database.query_stats import QueryStatsMiddleware
 from app.core.exceptions import (
     AuthorizationError,
     BusinessRuleError,
     ConflictError,
+    ExternalServiceError,
     ResourceNotFoundError,
 )
-from app.core.uploads import UPLOAD_DIR
+from app.core.http_client import close_http_client, start_http_client
+from app.core.static_files import ImmutableStaticFiles
+from app.core.uploads import UPLOAD_DIR, get_image_pool, shutdown_image_pool
+from app.modules.auth.dependencies import claims_cache
+from app.modules.auth.jwks import jwks_provider
 from app.modules.auth.router import router as auth_router
 from app.modules.bookings.router import router as bookings_router
 from app.modules.organizations.router import router as organizations_router
 from app.modules.prerelease.router import router as prerelease_router
 from app.modules.venues.router import router as venues_router
 from app.modules.webhooks.router import router as webhooks_router
+from app.modules.webhooks.worker import webhook_worker
 
 
 @asynccontextmanager
@@ -35,9 +46,15 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     Startup:
     - Test database connection with a simple query
     - Log connection status
+    - Open the shared HTTP client and load JWKS signing keys
+    - Start the webhook inbox worker (if enabled)
+    - Create the image-resizing process pool
 
     Shutdown:
-    - Dispose database engine connection pool
+    - Stop the webhook worker, letting in-flight events finish
+    - Shut down the image process pool
+    - Stop JWKS refresh and close the shared HTTP client
+    - Dispose database engine connection pools (primary and replica)
     - Clean up resources
 
     Args:
@@ -55,10 +72,23 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         print(f"✗ Database connection failed: {e}")
         print("  App will start anyway — DB may become available later")
 
+    await start_http_client()
+    await jwks_provider.start()
+    if settings.WEBHOOK_WORKER_ENABLED:
+        await webhook_worker.start()
+    get_image_pool()
+
     yield  # Application runs here
 
+    await webhook_worker.stop()
+    await asyncio.to_thread(shutdown_image_pool)
+    await jwks_provider.stop()
+    await close_http_client()
+
     # Shutdown: Clean up database connection pool
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
     print("✓ Database connection pool disposed")
 
 
@@ -97,6 +127,12 @@ async def conflict_handler(_request: Request, exc: ConflictError) -> JSONRespons
     return JSONResponse(status_code=409, content={"error": exc.message, "code": exc.code})
 
 
+@app.exception_handler(ExternalServiceError)
+async def external_service_handler(_request: Request, exc: ExternalServiceError) -> JSONResponse:
+    """Convert ExternalServiceError to a 502 JSON response."""
+    return JSONResponse(status_code=502, content={"error": exc.message, "code": exc.code})
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(_request: Request, _exc: Exception) -> JSONResponse:
     """Catch-all for unhandled exceptions.
@@ -120,12 +156,13 @@ app.include_router(prerelease_router, prefix="/api/v1")
 app.include_router(venues_router, prefix="/api/v1")
 app.include_router(webhooks_router, prefix="/webhooks")
 
-# Serve uploaded files (logos, etc.) as static assets.
+# Serve uploaded files (logos, etc.) as static assets. Uploads are
+# content-addressed and never change, so they are served as immutable.
 # The directory is created lazily by the upload utility; ensure it exists
 # here so StaticFiles does not raise on startup.
 uploads_path = Path(UPLOAD_DIR)
 uploads_path.mkdir(parents=True, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_path)), name="uploads")
+app.mount("/uploads", ImmutableStaticFiles(directory=str(uploads_path)), name="uploads")
 
 # CORS middleware configuration
 # Allows configured frontend origins with production-safe method/header restrictions
@@ -137,6 +174,14 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type", "Accept"],
 )
 
+# Per-request SQL statement counts, DB time and N+1 warnings (Server-Timing
+# header and logs); off in production unless QUERY_STATS_ENABLED is set
+if settings.query_stats_enabled:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        n_plus_one_threshold=settings.QUERY_STATS_N_PLUS_ONE_THRESHOLD,
+    )
+
 
 @app.get("/api/health")
 async def health_check() -> dict[str, str]:
@@ -149,6 +194,61 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "service": "venuelink-api"}
 
 
+@app.get("/api/metrics/db", dependencies=[Depends(require_admin_token)])
+async def database_metrics() -> dict[str, Any]:
+    """
+    Connection pool metrics for this worker process.
+
+    Reports each engine's pool size, connections in use (checked_out) and
+    idle (checked_in), overflow in use, and checkout wait counters
+    (total, max and a cumulative histogram), for sizing DB_POOL_SIZE and
+    DB_MAX_OVERFLOW from real traffic. Requires the ADMIN_API_TOKEN bearer
+    token.
+
+    Returns:
+        dict: Pool status for the primary and, if configured, the replica
+    """
+    return {
+        "primary": pool_status(engine.pool),
+        "replica": pool_status(read_engine.pool) if read_engine is not None else None,
+    }
+
+
+@app.get("/api/metrics/auth", dependencies=[Depends(require_admin_token)])
+async def auth_metrics() -> dict[str, Any]:
+    """
+    Verified-token claims cache metrics for this worker process.
+
+    Reports hits, misses, evictions, expirations, size and hit ratio, for
+    judging whether AUTH_CLAIMS_CACHE_MAX_ENTRIES fits real traffic.
+    Requires the ADMIN_API_TOKEN bearer token.
+
+    Returns:
+        dict: Claims cache counters
+    """
+    stats = claims_cache.stats()
+    return {"claims_cache": {**asdict(stats), "hit_ratio": stats.hit_ratio}}
+
+
+@app.get("/api/admin/slow-queries", dependencies=[Depends(require_admin_token)])
+async def slow_queries() -> dict[str, Any]:
+    """
+    Recent slow SQL statements in this worker process, newest first.
+
+    Lists statements slower than SLOW_QUERY_THRESHOLD_MS (the last
+    SLOW_QUERY_LOG_MAX_ENTRIES of them), each with its duration and, when
+    it was sampled, its EXPLAIN (ANALYZE, BUFFERS) plan. Requires the
+    ADMIN_API_TOKEN bearer token.
+
+    Returns:
+        dict: The threshold and the buffered slow statements
+    """
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "entries": [asdict(entry) for entry in reversed(slow_query_log.entries())],
+    }
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """
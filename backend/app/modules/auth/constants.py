@@ -8,6 +8,12 @@ STUDENT_EMAIL_REGEX = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.edu$"
 # JWT Claims
 CLERK_ISSUER = "https://clerk.venuelink.com"  # Placeholder, should be env var
 ROLE_CLAIM_KEY = "role"  # Key in JWT metadata
+JWT_ALGORITHM = "RS256"  # Clerk session tokens are RS256-signed
+
+# JWKS key resolution
+JWKS_REFRESH_MARGIN_SECONDS = 60  # Refresh this long before the key set expires
+JWKS_RETRY_SECONDS = 30  # Background retry delay after a failed refresh
+JWKS_MIN_REFETCH_SECONDS = 30  # Unknown kids can't trigger fetches more often than this
 
 
 class AuthError(str, Enum):
@@ -21,3 +27,5 @@ class AuthError(str, Enum):
     INVALID_ROLE = "Invalid user role."
     STUDENT_EMAIL_REQUIRED = "Student organizations must use a .edu email address."
     FORBIDDEN = "You do not have permission to access this resource."
+    UNKNOWN_SIGNING_KEY = "Token signing key is not recognized."
+    USER_PROVISIONING_CONFLICT = "User changed during sign-in; please retry."
@@ -1,53 +1,130 @@
 """FastAPI dependencies for authentication."""
 
+import hashlib
 import os
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import ExpiringLRUCache
+from app.core.config import settings
 from app.core.constants.enums import UserRole
 from app.core.database.session import get_db
-from app.modules.auth.constants import ROLE_CLAIM_KEY, AuthError
-from app.modules.auth.schemas import UserCreate
+from app.modules.auth.constants import JWT_ALGORITHM, ROLE_CLAIM_KEY, AuthError
+from app.modules.auth.jwks import jwks_provider
+from app.modules.auth.schemas import AuthenticatedUser, UserCreate
 from app.modules.auth.services import auth_service
-from app.modules.users.models import User
 
 # Initialize security scheme
 security = HTTPBearer()
 
-# Configuration (should be in env vars)
+# Static PEM key, used when no JWKS URL is configured
 CLERK_PEM_PUBLIC_KEY = os.getenv("CLERK_PEM_PUBLIC_KEY")
-# If PEM is not provided, we might need to fetch JWKS or skip sig check in dev
-# IN PRODUCTION: Fetch from https://<your-clerk-domain>/.well-known/jwks.json
+# Parsed once instead of on every decode
+_pem_key: Key | None = (
+    jwk.construct(CLERK_PEM_PUBLIC_KEY, JWT_ALGORITHM) if CLERK_PEM_PUBLIC_KEY else None
+)
 
+# Verified claims keyed by SHA-256 of the raw token, each kept until the token's
+# exp. A session token is re-sent on every request until it expires, so this
+# skips the RS256 signature check for all but the first presentation.
+claims_cache: ExpiringLRUCache[str, dict[str, Any]] = ExpiringLRUCache(
+    max_entries=settings.AUTH_CLAIMS_CACHE_MAX_ENTRIES,
+)
 
-async def get_current_user(
+
+async def _get_verification_key(token: str) -> Key | None:
+    """
+    Pick the key that should verify ``token``.
+
+    Prefers the JWKS provider (by the token's ``kid``, from memory unless the
+    kid is new), then the static PEM key. Returns None when neither is
+    configured (dev mode).
+
+    Raises:
+        JWTError: If the token's kid can't be resolved to a JWKS key.
+    """
+    if jwks_provider.enabled:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = jwks_provider.get_key(kid) if kid else None
+        if key is None and kid:
+            key = await jwks_provider.resolve(kid)
+        if key is None:
+            raise JWTError(AuthError.UNKNOWN_SIGNING_KEY.value)
+        return key
+    return _pem_key
+
+
+async def decode_token_claims(token: str) -> dict[str, Any]:
+    """
+    Verify a session token and return its claims, using the claims cache.
+
+    Only signature-verified claims are cached; the unverified dev fallback
+    is never stored. The returned dict may be shared between requests and
+    must not be mutated.
+
+    Args:
+        token: Raw bearer token.
+
+    Returns:
+        dict: Token claims.
+
+    Raises:
+        JWTError: If the token is invalid, expired or signed by an unknown key.
+    """
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = claims_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    key = await _get_verification_key(token)
+    if key is None:
+        # Fallback for dev/testing without keys (Security Risk Warning)
+        return jwt.get_unverified_claims(token)
+
+    claims = jwt.decode(
+        token,
+        key,
+        algorithms=[JWT_ALGORITHM],
+        options={"verify_aud": False},
+    )
+    expires_at = claims.get("exp")
+    if isinstance(expires_at, int | float):
+        claims_cache.set(cache_key, claims, expires_at=float(expires_at))
+    return claims
+
+
+async def get_token_claims(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+) -> dict[str, Any]:
+    """Verify the bearer token and return its claims (no database access)."""
+    try:
+        return await decode_token_claims(credentials.credentials)
+    except JWTError as err:
+        msg = f"{AuthError.INVALID_TOKEN} {err!s}"
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=msg,
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from err
+
+
+async def get_current_user(
+    payload_dict: Annotated[dict[str, Any], Depends(get_token_claims)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> AuthenticatedUser:
     """
     Authenticate the current user via JWT.
 
-    Verifies the token, extracts claims, and synchronizes the user to
-    the local database.
+    Uses the verified token claims and synchronizes the user to
+    the local database. Returns the compact cached identity rather than
+    the ORM User, so most requests never query the users table.
     """
-    token = credentials.credentials
-
     try:
-        if CLERK_PEM_PUBLIC_KEY:
-            payload_dict = jwt.decode(
-                token,
-                CLERK_PEM_PUBLIC_KEY,
-                algorithms=["RS256"],
-                options={"verify_aud": False},
-            )
-        else:
-            # Fallback for dev/testing without keys (Security Risk Warning)
-            payload_dict = jwt.get_unverified_claims(token)
-
         # Extract core fields
         sub = payload_dict.get("sub")
         # Clerk puts the email at "email" in the default session token and in
@@ -80,7 +157,7 @@ async def get_current_user(
         # Sync user to DB
         return await auth_service.get_or_create_user(db, user_create)
 
-    except (JWTError, ValueError) as err:
+    except ValueError as err:
         msg = f"{AuthError.INVALID_TOKEN} {err!s}"
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -93,8 +170,8 @@ def require_role(required_role: UserRole) -> object:
     """Dependency factory for role-based access control."""
 
     def role_checker(
-        user: Annotated[User, Depends(get_current_user)],
-    ) -> User:
+        user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    ) -> AuthenticatedUser:
         if user.role != required_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
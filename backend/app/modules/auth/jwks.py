@@ -0,0 +1,201 @@
+"""JWKS signing-key provider for Clerk session tokens.
+
+Keys are fetched from the configured JWKS endpoint with the shared HTTP
+client and cached in memory by ``kid``. A background task refreshes the key
+set shortly before it expires, so token verification reads keys from memory
+and never waits on the network in steady state.
+
+When a token presents an unknown ``kid`` (e.g. right after a key rotation),
+one refresh is triggered and all concurrent callers await that same fetch
+(single-flight). Such refreshes are rate limited so random ``kid`` values
+can't be used to hammer the JWKS endpoint.
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+import time
+from typing import Any
+
+import httpx
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.modules.auth.constants import (
+    JWKS_MIN_REFETCH_SECONDS,
+    JWKS_REFRESH_MARGIN_SECONDS,
+    JWKS_RETRY_SECONDS,
+    JWT_ALGORITHM,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class JWKSFetchError(Exception):
+    """Raised when the JWKS endpoint returns no usable signing keys."""
+
+
+class JWKSProvider:
+    """
+    In-memory, self-refreshing cache of JWKS signing keys.
+
+    Usage:
+        provider = JWKSProvider(url, refresh_interval=3600)
+        await provider.start()          # initial fetch + background refresh
+        key = provider.get_key(kid) or await provider.resolve(kid)
+        await provider.stop()
+    """
+
+    def __init__(
+        self,
+        url: str,
+        refresh_interval: float,
+        min_refetch_interval: float = JWKS_MIN_REFETCH_SECONDS,
+    ) -> None:
+        """
+        Configure the provider (no network access until ``start``/``resolve``).
+
+        Args:
+            url: JWKS endpoint URL (empty disables the provider)
+            refresh_interval: Max seconds to trust a key set when the endpoint
+                sends no Cache-Control max-age
+            min_refetch_interval: Minimum seconds between unknown-kid refreshes
+        """
+        self.url = url
+        self.refresh_interval = refresh_interval
+        self.min_refetch_interval = min_refetch_interval
+        self._keys: dict[str, Key] = {}
+        self._expires_at = 0.0
+        self._last_fetch_at = float("-inf")
+        self._inflight: asyncio.Task[None] | None = None
+        self._refresher: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a JWKS URL is configured."""
+        return bool(self.url)
+
+    @property
+    def kids(self) -> tuple[str, ...]:
+        """Key IDs currently cached."""
+        return tuple(self._keys)
+
+    def get_key(self, kid: str) -> Key | None:
+        """Return a cached key without any network access."""
+        return self._keys.get(kid)
+
+    async def resolve(self, kid: str) -> Key | None:
+        """
+        Return the key for ``kid``, refreshing once if it isn't cached yet.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            The signing key, or None if it is still unknown after a refresh
+            (or a refresh happened too recently to try again)
+        """
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        # Join a refresh already in flight (it may bring the new key); the rate
+        # limit only governs starting a new one
+        fetch_running = self._inflight is not None and not self._inflight.done()
+        if not fetch_running and time.monotonic() - self._last_fetch_at < self.min_refetch_interval:
+            return None
+
+        try:
+            await self.refresh()
+        except (httpx.HTTPError, JWKSFetchError, ValueError):
+            logger.warning("JWKS refresh for unknown kid %s failed", kid, exc_info=True)
+            return None
+        return self._keys.get(kid)
+
+    async def refresh(self) -> None:
+        """Fetch the key set, sharing one in-flight request among concurrent callers."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._fetch())
+        # Shield so a cancelled caller doesn't cancel the fetch others are awaiting
+        await asyncio.shield(self._inflight)
+
+    async def start(self) -> None:
+        """Load the key set (non-fatal on failure) and start background refresh."""
+        if not self.enabled or self._refresher is not None:
+            return
+        try:
+            await self.refresh()
+        except (httpx.HTTPError, JWKSFetchError, ValueError):
+            logger.warning("Initial JWKS fetch from %s failed", self.url, exc_info=True)
+            self._expires_at = time.monotonic() + JWKS_RETRY_SECONDS + JWKS_REFRESH_MARGIN_SECONDS
+        self._refresher = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Cancel background refresh."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresher
+            self._refresher = None
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the key set ahead of expiry, retrying on failure."""
+        while True:
+            delay = self._expires_at - time.monotonic() - JWKS_REFRESH_MARGIN_SECONDS
+            await asyncio.sleep(max(delay, 0))
+            try:
+                await self.refresh()
+            except (httpx.HTTPError, JWKSFetchError, ValueError):
+                # Keep serving the current keys and try again shortly
+                logger.warning("Background JWKS refresh failed", exc_info=True)
+                self._expires_at = (
+                    time.monotonic() + JWKS_RETRY_SECONDS + JWKS_REFRESH_MARGIN_SECONDS
+                )
+
+    async def _fetch(self) -> None:
+        """Download, parse and atomically swap in the key set."""
+        self._last_fetch_at = time.monotonic()
+        response = await get_http_client().get(self.url)
+        response.raise_for_status()
+
+        keys = _parse_jwks(response.json())
+        if not keys:
+            msg = f"No usable signing keys at {self.url}"
+            raise JWKSFetchError(msg)
+
+        self._keys = keys
+        self._expires_at = time.monotonic() + self._ttl(response.headers.get("cache-control"))
+
+    def _ttl(self, cache_control: str | None) -> float:
+        """Key set lifetime: the endpoint's max-age, capped at refresh_interval."""
+        match = MAX_AGE_PATTERN.search(cache_control or "")
+        if match is None:
+            return self.refresh_interval
+        return min(float(match.group(1)), self.refresh_interval)
+
+
+def _parse_jwks(document: dict[str, Any]) -> dict[str, Key]:
+    """Build verification keys from a JWKS document, skipping unusable entries."""
+    keys: dict[str, Key] = {}
+    for key_data in document.get("keys", []):
+        kid = key_data.get("kid")
+        if not kid or key_data.get("use", "sig") != "sig":
+            continue
+        try:
+            keys[kid] = jwk.construct(key_data, key_data.get("alg", JWT_ALGORITHM))
+        except JWKError:
+            logger.warning("Skipping unusable JWKS key %s", kid)
+    return keys
+
+
+# Process-wide provider, started and stopped by the application lifespan
+jwks_provider = JWKSProvider(
+    url=settings.CLERK_JWKS_URL,
+    refresh_interval=settings.CLERK_JWKS_REFRESH_SECONDS,
+)
@@ -5,15 +5,14 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from app.modules.auth.dependencies import get_current_user
-from app.modules.auth.schemas import UserCreate
-from app.modules.users.models import User
+from app.modules.auth.schemas import AuthenticatedUser, UserCreate
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.get("/me", response_model=UserCreate)
 async def get_my_profile(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> UserCreate:
     """
     Get the current authenticated user's profile.
@@ -1,5 +1,7 @@
 """Pydantic schemas for authentication."""
 
+from uuid import UUID
+
 from pydantic import BaseModel, EmailStr
 
 from app.core.constants.enums import UserRole
@@ -28,3 +30,28 @@ class AuthResponse(BaseModel):
 
     access_token: str
     token_type: str = "bearer"
+
+
+class AuthenticatedUser(BaseModel):
+    """Request principal: the authenticated caller and what they own.
+
+    Built once per request by ``get_current_user`` (usually from the identity
+    cache) so services can authorize without re-querying ownership.
+    Immutable because a single instance is shared by concurrent requests.
+
+    Ownership may lag a change made by another worker by up to the cache
+    TTL, so services treat a negative ownership check as a hint and confirm
+    it against the database before rejecting.
+    """
+
+    id: UUID
+    email: str
+    role: UserRole
+    organization_id: UUID | None = None  # Owned organization (student_org)
+    venue_ids: tuple[UUID, ...] = ()  # Active owned venues, oldest first (venue_admin)
+
+    model_config = {"frozen": True}
+
+    def owns_venue(self, venue_id: UUID) -> bool:
+        """Whether the venue is among the caller's active venues."""
+        return venue_id in self.venue_ids
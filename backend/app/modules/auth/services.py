@@ -1,13 +1,30 @@
 """Authentication business logic."""
 
-from sqlalchemy import select
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import Row, and_, false, select, true, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import ExpiringLRUCache
+from app.core.config import settings
 from app.core.constants.enums import UserRole
+from app.core.exceptions import ConflictError
 from app.modules.auth.constants import AuthError
-from app.modules.auth.schemas import UserCreate
+from app.modules.auth.schemas import AuthenticatedUser, UserCreate
 from app.modules.auth.utils import is_valid_student_email
+from app.modules.organizations.models import Organization
 from app.modules.users.models import User
+from app.modules.venues.models import Venue
+
+# email -> AuthenticatedUser, so authenticated requests skip the users query
+identity_cache: ExpiringLRUCache[str, AuthenticatedUser] = ExpiringLRUCache(
+    max_entries=settings.AUTH_IDENTITY_CACHE_MAX_ENTRIES,
+)
 
 
 class AuthService:
@@ -17,44 +34,176 @@ class AuthService:
     async def get_or_create_user(
         db: AsyncSession,
         user_data: UserCreate,
-    ) -> User:
+    ) -> AuthenticatedUser:
         """
         Get an existing user or create a new one based on auth provider data.
 
+        Served from the identity cache when possible. On a miss, a single
+        INSERT ... ON CONFLICT (email) DO NOTHING statement both creates a
+        missing user and returns the (new or existing) user with their
+        ownership, so concurrent first requests and the user.created
+        webhook can't race each other into a unique violation. Only a newly
+        created user is committed here; the existing-user path is one round
+        trip with no commit.
+
         Args:
             db: Database session.
             user_data: User data from auth provider.
 
         Returns:
-            User: The authenticated user.
+            AuthenticatedUser: Compact identity of the authenticated user.
 
         Raises:
             ValueError: If validation fails (e.g. non-edu email for student org).
+            ConflictError: If the user vanished between the conflict and the re-read.
         """
         # 1. Validate constraints
         if user_data.role == UserRole.student_org and not is_valid_student_email(user_data.email):
             raise ValueError(AuthError.STUDENT_EMAIL_REQUIRED)
 
-        # 2. Check if user exists
-        stmt = select(User).where(User.email == user_data.email)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
+        # 2. Check the identity cache
+        cached = identity_cache.get(user_data.email)
+        if cached is not None:
+            return cached
+
+        # 3. Create the user if missing and load the identity in one statement
+        rows = await AuthService._upsert_identity(db, user_data)
+        if rows:
+            if rows[0].created:
+                # Make the new user visible to other requests before caching its id
+                await db.commit()
+            identity = _collapse_identity(rows)
+        else:
+            # A concurrent insert committed after this statement's snapshot:
+            # the conflict suppressed our insert but the row wasn't visible
+            # yet. A fresh statement sees it.
+            identity = await AuthService._load_identity(db, user_data.email)
+            if identity is None:
+                raise ConflictError(AuthError.USER_PROVISIONING_CONFLICT)
+
+        identity_cache.set(
+            user_data.email,
+            identity,
+            expires_at=time.time() + settings.AUTH_IDENTITY_CACHE_TTL_SECONDS,
+        )
+        return identity
+
+    @staticmethod
+    def invalidate_user(email: str) -> None:
+        """
+        Drop a user's cached identity after their org/venue ownership changes.
+
+        Args:
+            email: Email of the user whose identity changed.
+        """
+        identity_cache.discard(email)
+
+    @staticmethod
+    async def _upsert_identity(
+        db: AsyncSession,
+        user_data: UserCreate,
+    ) -> Sequence[Row[Any]]:
+        """
+        Insert the user unless the email exists, returning identity rows.
+
+        The inserted row (from RETURNING) and the pre-existing row (from the
+        statement snapshot) are mutually exclusive, so UNION ALL yields the
+        user exactly once, outer joined to their org and active venues.
+
+        Returns:
+            Rows of (id, email, role, created, organization_id, venue_id);
+            empty only when a concurrent insert won the race
+        """
+        now = datetime.now(UTC)
+        inserted = (
+            pg_insert(User)
+            .values(
+                id=uuid4(),
+                email=user_data.email,
+                role=user_data.role,
+                email_verified=True,  # Assumed verified by Clerk
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id, User.email, User.role)
+            .cte("inserted_user")
+        )
+        candidate = union_all(
+            select(
+                inserted.c.id,
+                inserted.c.email,
+                inserted.c.role,
+                true().label("created"),
+            ),
+            select(
+                User.id,
+                User.email,
+                User.role,
+                false().label("created"),
+            ).where(User.email == user_data.email),
+        ).subquery("candidate_user")
 
-        if user:
-            return user
+        stmt = (
+            select(
+                candidate.c.id,
+                candidate.c.email,
+                candidate.c.role,
+                candidate.c.created,
+                Organization.id.label("organization_id"),
+                Venue.id.label("venue_id"),
+            )
+            .outerjoin(Organization, Organization.owner_id == candidate.c.id)
+            .outerjoin(
+                Venue,
+                and_(Venue.owner_id == candidate.c.id, Venue.deleted_at.is_(None)),
+            )
+            .order_by(Organization.created_at.asc(), Venue.created_at.asc())
+        )
+        result = await db.execute(stmt)
+        return result.all()
 
-        # 3. Create new user if not exists
-        new_user = User(
-            email=user_data.email,
-            role=user_data.role,
-            email_verified=True,  # Assumed verified by Clerk
+    @staticmethod
+    async def _load_identity(
+        db: AsyncSession,
+        email: str,
+    ) -> AuthenticatedUser | None:
+        """Load a user with their owned org and active venue ids in one joined query."""
+        stmt = (
+            select(
+                User.id,
+                User.email,
+                User.role,
+                false().label("created"),
+                Organization.id.label("organization_id"),
+                Venue.id.label("venue_id"),
+            )
+            .outerjoin(Organization, Organization.owner_id == User.id)
+            .outerjoin(
+                Venue,
+                and_(Venue.owner_id == User.id, Venue.deleted_at.is_(None)),
+            )
+            .where(User.email == email)
+            .order_by(Organization.created_at.asc(), Venue.created_at.asc())
         )
+        result = await db.execute(stmt)
+        rows = result.all()
+        return _collapse_identity(rows) if rows else None
 
-        db.add(new_user)
-        await db.commit()
-        await db.refresh(new_user)
 
-        return new_user
+def _collapse_identity(rows: Sequence[Row[Any]]) -> AuthenticatedUser:
+    """Fold (user x org x venue) join rows into a single identity."""
+    first = rows[0]
+    # dict.fromkeys de-duplicates (orgs x venues) while keeping created_at order
+    org_ids = list(dict.fromkeys(r.organization_id for r in rows if r.organization_id))
+    venue_ids = tuple(dict.fromkeys(r.venue_id for r in rows if r.venue_id))
+    return AuthenticatedUser(
+        id=first.id,
+        email=first.email,
+        role=first.role,
+        organization_id=org_ids[0] if org_ids else None,
+        venue_ids=venue_ids,
+    )
 
 
 auth_service = AuthService()
@@ -17,4 +17,4 @@ class BookingError(str, Enum):
     VENUE_ADMIN_REQUIRED = "Only venue administrators can perform this action."
     VENUE_NOT_FOUND = "Venue not found."
     TIME_CONFLICT = "This time slot conflicts with an existing booking."
-    END_BEFORE_START = "Event end time must be after start time."
+    END_BEFORE_START = "Event end must be after its start."
@@ -9,7 +9,7 @@ GUEST_COUNT_MIN = 10
 
 # Event duration constraints (in minutes)
 EVENT_DURATION_MIN_MINUTES = 30
-EVENT_DURATION_MAX_MINUTES = 720  # 12 hours
+EVENT_DURATION_MAX_MINUTES = 4320  # 3 days (overnight and multi-day events)
 
 # Special requests constraints
 SPECIAL_REQUESTS_MAX_LENGTH = 500
@@ -7,9 +7,10 @@ BookingStatus enum.
 Database constraints:
 - Overlap detection via has_time_conflict (application-level, status-aware)
 - Guest count must meet minimum group size (>= 10)
-- Event end time must be after start time
+- Event end (end date + end time) must be after start (date + start time)
 - Foreign keys restrict deletion to preserve historical data
 - Event date indexed for date range queries
+- Generated event_period range (GiST-indexed) for overlap queries across midnight
 
 Booking workflow:
     PENDING -> CONFIRMED (venue accepts)
@@ -19,12 +20,13 @@ Booking workflow:
     PENDING -> CANCELLED (org cancels before confirmation)
 """
 
-from datetime import date, time, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from sqlalchemy import (
     CheckConstraint,
+    Computed,
     Date,
     Enum,
     ForeignKey,
@@ -34,6 +36,7 @@ from sqlalchemy import (
     Text,
     Time,
 )
+from sqlalchemy.dialects.postgresql import TSRANGE, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.constants.enums import BookingStatus
@@ -44,6 +47,11 @@ if TYPE_CHECKING:
     from app.modules.organizations.models import Organization
     from app.modules.venues.models import Venue
 
+# Half-open wall-clock period of the event, generated by PostgreSQL
+EVENT_PERIOD_EXPRESSION = (
+    "tsrange(event_date + event_start_time, event_end_date + event_end_time, '[)')"
+)
+
 
 class Booking(BaseModel, UUIDMixin, TimestampMixin):
     """
@@ -56,7 +64,7 @@ class Booking(BaseModel, UUIDMixin, TimestampMixin):
     Business rules:
     - One venue can only have one booking per date/time slot
     - Guest count must meet minimum group size (>= 10)
-    - Event end time must be after start time
+    - Event must end after it starts (overnight and multi-day events allowed)
     - Event date must not be in the past (enforced in BookingCreate schema)
     - Bookings cannot be deleted, only cancelled (audit trail)
 
@@ -64,9 +72,11 @@ class Booking(BaseModel, UUIDMixin, TimestampMixin):
         id: UUID primary key
         venue_id: Foreign key to venue being booked
         organization_id: Foreign key to organization making booking
-        event_date: Date of the event
+        event_date: Date the event starts
+        event_end_date: Date the event ends (later than event_date for overnight events)
         event_start_time: Start time of the event
         event_end_time: End time of the event
+        event_period: Generated [start, end) timestamp range used for overlap checks
         event_duration: Computed duration of the event
         guest_count: Expected number of guests (must be > 0)
         status: Booking workflow state (PENDING, CONFIRMED, etc.)
@@ -77,6 +87,9 @@ class Booking(BaseModel, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "bookings"
+    # event_period is generated by the database; fetch it with RETURNING on
+    # flush instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}  # noqa: RUF012
 
     # Foreign keys
     venue_id: Mapped[UUID] = mapped_column(
@@ -98,6 +111,11 @@ class Booking(BaseModel, UUIDMixin, TimestampMixin):
         index=True,  # Index for date range queries (e.g., "bookings this month")
     )
 
+    event_end_date: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+
     event_start_time: Mapped[time] = mapped_column(
         Time,
         nullable=False,
@@ -108,6 +126,12 @@ class Booking(BaseModel, UUIDMixin, TimestampMixin):
         nullable=False,
     )
 
+    # Generated by the database; never written by the application
+    event_period: Mapped[Range[datetime]] = mapped_column(
+        TSRANGE,
+        Computed(EVENT_PERIOD_EXPRESSION, persisted=True),
+    )
+
     guest_count: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
@@ -151,36 +175,26 @@ class Booking(BaseModel, UUIDMixin, TimestampMixin):
         CheckConstraint("length(event_name) > 0", name="booking_event_name_not_empty"),
         # Guest count must meet minimum group size
         CheckConstraint("guest_count >= 10", name="booking_guest_count_positive_check"),
-        # Event end time must be after start time
-        # Note: overnight events (crossing midnight) not supported in MVP
+        # Event must end after it starts (may cross midnight or span days)
         CheckConstraint(
-            "event_end_time > event_start_time",
+            "event_end_date + event_end_time > event_date + event_start_time",
             name="booking_end_after_start_check",
         ),
-        # Composite index for venue availability queries
+        # GiST index for venue availability queries (needs btree_gist for venue_id)
         Index(
-            "ix_bookings_venue_date_time",
+            "ix_bookings_venue_event_period",
             "venue_id",
-            "event_date",
-            "event_start_time",
-            "event_end_time",
+            "event_period",
+            postgresql_using="gist",
         ),
     )
 
     @property
     def event_duration(self) -> timedelta:
-        """Calculate the duration of the event from start and end times."""
-        start_seconds = (
-            self.event_start_time.hour * 3600
-            + self.event_start_time.minute * 60
-            + self.event_start_time.second
-        )
-        end_seconds = (
-            self.event_end_time.hour * 3600
-            + self.event_end_time.minute * 60
-            + self.event_end_time.second
-        )
-        return timedelta(seconds=end_seconds - start_seconds)
+        """Calculate the duration of the event from its start and end datetimes."""
+        starts_at = datetime.combine(self.event_date, self.event_start_time)
+        ends_at = datetime.combine(self.event_end_date, self.event_end_time)
+        return ends_at - starts_at
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -1,15 +1,30 @@
 """Booking data access layer (Repository pattern)."""
 
-from datetime import date, time
+from datetime import date, datetime
 from typing import TypedDict
 from uuid import UUID
 
-from sqlalchemy import Interval, and_, case, extract, func, select, type_coerce
+from sqlalchemy import (
+    ColumnElement,
+    Exists,
+    Interval,
+    and_,
+    case,
+    exists,
+    extract,
+    func,
+    select,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import Range
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core.constants.enums import BookingStatus
 from app.modules.bookings.models import Booking
 from app.modules.bookings.schemas import BookingCreate, BookingFilters
+from app.modules.bookings.utils import month_bounds
+from app.modules.organizations.models import Organization
 from app.modules.venues.models import Venue
 
 
@@ -24,6 +39,31 @@ class OrgSummaryDict(TypedDict):
 # Statuses that count toward budget
 BUDGET_STATUSES = {BookingStatus.confirmed, BookingStatus.completed}
 
+# Statuses that hold a venue's time slot
+BLOCKING_STATUSES = [BookingStatus.pending, BookingStatus.confirmed]
+
+
+def overlapping_booking_exists(
+    venue_id: UUID | ColumnElement[UUID],
+    starts_at: datetime,
+    ends_at: datetime,
+) -> Exists:
+    """
+    Build an EXISTS clause for active bookings overlapping a time period.
+
+    Shared by the single-venue conflict check and the venue availability
+    search so both use the same predicate. Compares the generated
+    ``event_period`` range with ``&&``, so events crossing midnight are
+    matched without per-day splitting, using the (venue_id, event_period)
+    GiST index. Passing ``Venue.id`` as venue_id produces a correlated
+    subquery suitable for a NOT EXISTS anti-join.
+    """
+    return exists().where(
+        Booking.venue_id == venue_id,
+        Booking.status.in_(BLOCKING_STATUSES),
+        Booking.event_period.overlaps(Range(starts_at, ends_at, bounds="[)")),
+    )
+
 
 class BookingRepository:
     """Repository for booking data access operations."""
@@ -33,13 +73,23 @@ class BookingRepository:
         db: AsyncSession,
         booking_data: BookingCreate,
         organization_id: UUID,
+        venue: Venue,
     ) -> Booking:
-        """Create a new booking record."""
+        """
+        Create a new booking record.
+
+        The caller's already-loaded venue is attached as the relationship,
+        and the organization is taken from the identity map or fetched by
+        primary key without its own relationships, so the response can be
+        built without refreshing the new row.
+        """
+        organization = await db.get(Organization, organization_id, options=[raiseload("*")])
         booking = Booking(
-            venue_id=booking_data.venue_id,
-            organization_id=organization_id,
+            venue=venue,
+            organization=organization,
             event_name=booking_data.event_name,
             event_date=booking_data.event_date,
+            event_end_date=booking_data.event_end_date,
             event_start_time=booking_data.event_start_time,
             event_end_time=booking_data.event_end_time,
             guest_count=booking_data.guest_count,
@@ -47,8 +97,7 @@ class BookingRepository:
             status=BookingStatus.pending,
         )
         db.add(booking)
-        await db.commit()
-        await db.refresh(booking)
+        await db.flush()
         return booking
 
     @staticmethod
@@ -65,22 +114,13 @@ class BookingRepository:
     async def has_time_conflict(
         db: AsyncSession,
         venue_id: UUID,
-        event_date: date,
-        start_time: time,
-        end_time: time,
+        starts_at: datetime,
+        ends_at: datetime,
     ) -> bool:
-        """Check if a time slot conflicts with existing bookings."""
-        query = select(func.count()).where(
-            and_(
-                Booking.venue_id == venue_id,
-                Booking.event_date == event_date,
-                Booking.status.in_([BookingStatus.pending, BookingStatus.confirmed]),
-                Booking.event_start_time < end_time,
-                Booking.event_end_time > start_time,
-            )
-        )
+        """Check if a time period conflicts with existing bookings."""
+        query = select(overlapping_booking_exists(venue_id, starts_at, ends_at))
         result = await db.execute(query)
-        return result.scalar_one() > 0
+        return bool(result.scalar_one())
 
     @staticmethod
     async def get_by_venue_id(
@@ -215,12 +255,13 @@ class BookingRepository:
         year: int,
         month: int,
     ) -> int:
-        """Count all bookings for a venue in a given month."""
+        """Count all bookings for a venue starting in a given month."""
+        first_day, next_month = month_bounds(year, month)
         query = select(func.count()).where(
             and_(
                 Booking.venue_id == venue_id,
-                extract("year", Booking.event_date) == year,
-                extract("month", Booking.event_date) == month,
+                Booking.event_date >= first_day,
+                Booking.event_date < next_month,
             )
         )
         result = await db.execute(query)
@@ -233,7 +274,8 @@ class BookingRepository:
         year: int,
         month: int,
     ) -> int:
-        """Sum total_cost_cents for confirmed/completed bookings this month."""
+        """Sum total_cost_cents for confirmed/completed bookings starting this month."""
+        first_day, next_month = month_bounds(year, month)
         query = (
             select(func.coalesce(func.sum(Venue.base_price_cents), 0))
             .select_from(Booking)
@@ -242,8 +284,8 @@ class BookingRepository:
                 and_(
                     Booking.venue_id == venue_id,
                     Booking.status.in_(BUDGET_STATUSES),
-                    extract("year", Booking.event_date) == year,
-                    extract("month", Booking.event_date) == month,
+                    Booking.event_date >= first_day,
+                    Booking.event_date < next_month,
                 )
             )
         )
@@ -257,11 +299,21 @@ class BookingRepository:
         year: int,
         month: int,
     ) -> float:
-        """Sum booked hours for confirmed/completed bookings this month."""
-        duration_interval = type_coerce(
-            Booking.event_end_time - Booking.event_start_time,
-            Interval(),
+        """
+        Sum booked hours for confirmed/completed bookings within a month.
+
+        Each booking's event_period is clipped to the month with a range
+        intersection, so events spanning a month boundary contribute only
+        the hours that fall inside the requested month.
+        """
+        first_day, next_month = month_bounds(year, month)
+        month_period = Range(
+            datetime.combine(first_day, datetime.min.time()),
+            datetime.combine(next_month, datetime.min.time()),
+            bounds="[)",
         )
+        in_month = Booking.event_period.intersection(month_period)
+        duration_interval = type_coerce(func.upper(in_month) - func.lower(in_month), Interval())
         query = select(
             func.coalesce(
                 func.sum(extract("epoch", duration_interval) / 3600.0),
@@ -271,8 +323,7 @@ class BookingRepository:
             and_(
                 Booking.venue_id == venue_id,
                 Booking.status.in_(BUDGET_STATUSES),
-                extract("year", Booking.event_date) == year,
-                extract("month", Booking.event_date) == month,
+                Booking.event_period.overlaps(month_period),
             )
         )
         result = await db.execute(query)
@@ -286,6 +337,5 @@ class BookingRepository:
     ) -> Booking:
         """Update a booking's status."""
         booking.status = new_status
-        await db.commit()
-        await db.refresh(booking)
+        await db.flush()
         return booking
@@ -8,8 +8,9 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants.enums import BookingStatus
-from app.core.database.session import get_db
+from app.core.database.session import get_db, get_read_db
 from app.modules.auth.dependencies import get_current_user
+from app.modules.auth.schemas import AuthenticatedUser
 from app.modules.bookings.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MIN_PAGE
 from app.modules.bookings.schemas import (
     BookingCreate,
@@ -21,7 +22,6 @@ from app.modules.bookings.schemas import (
 from app.modules.bookings.services import booking_service
 from app.modules.ratings.schemas import RatingCreate, RatingResponse
 from app.modules.ratings.services import rating_service
-from app.modules.users.models import User
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
@@ -49,8 +49,8 @@ def parse_booking_filters(
     summary="Get booking summary for my organization",
 )
 async def get_my_summary(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> BookingSummaryResponse:
     """Get booking summary stats for the current user's org."""
     return await booking_service.get_my_summary(
@@ -65,8 +65,8 @@ async def get_my_summary(
     summary="List my organization's bookings",
 )
 async def list_my_bookings(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     filters: Annotated[BookingFilters, Depends(parse_booking_filters)],
 ) -> BookingListResponse:
     """List bookings for the current user's organization."""
@@ -86,7 +86,7 @@ async def list_my_bookings(
 async def create_booking(
     booking_data: BookingCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> BookingResponse:
     """Create a new booking request (student org only)."""
     return await booking_service.create_booking(
@@ -104,7 +104,7 @@ async def create_booking(
 async def cancel_booking(
     booking_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> BookingResponse:
     """Cancel a pending or confirmed booking (org owner only)."""
     return await booking_service.cancel_booking(
@@ -122,7 +122,7 @@ async def cancel_booking(
 async def accept_booking(
     booking_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> BookingResponse:
     """Accept a pending booking request (venue owner only)."""
     return await booking_service.accept_booking(
@@ -140,7 +140,7 @@ async def accept_booking(
 async def decline_booking(
     booking_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> BookingResponse:
     """Decline a pending booking request (venue owner only)."""
     return await booking_service.decline_booking(
@@ -160,7 +160,7 @@ async def rate_booking(
     booking_id: UUID,
     rating_data: RatingCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> RatingResponse:
     """Rate a completed booking (org owner only)."""
     return await rating_service.create_rating(
@@ -18,6 +18,7 @@ from app.modules.bookings.constants import (
     MIN_PAGE,
     SPECIAL_REQUESTS_MAX_LENGTH,
 )
+from app.modules.bookings.utils import event_period_bounds, resolve_event_end_date
 
 
 class BookingCreate(BaseModel):
@@ -30,6 +31,13 @@ class BookingCreate(BaseModel):
         max_length=EVENT_NAME_MAX_LENGTH,
     )
     event_date: date
+    event_end_date: date | None = Field(
+        default=None,
+        description=(
+            "Date the event ends. Defaults to event_date, or the next day when "
+            "event_end_time is not after event_start_time (overnight events)."
+        ),
+    )
     event_start_time: time
     event_end_time: time
     guest_count: int = Field(..., ge=GUEST_COUNT_MIN)
@@ -49,13 +57,23 @@ class BookingCreate(BaseModel):
 
     @model_validator(mode="after")
     def validate_time_range(self) -> "BookingCreate":
-        """Validate end > start and duration is within allowed range."""
-        if self.event_end_time <= self.event_start_time:
-            msg = "Event end time must be after start time."
+        """Resolve the end date, then validate end > start and the duration range."""
+        self.event_end_date = resolve_event_end_date(
+            self.event_date,
+            self.event_start_time,
+            self.event_end_time,
+            self.event_end_date,
+        )
+        starts_at, ends_at = event_period_bounds(
+            self.event_date,
+            self.event_start_time,
+            self.event_end_time,
+            self.event_end_date,
+        )
+        if ends_at <= starts_at:
+            msg = "Event end must be after its start."
             raise ValueError(msg)
-        start_mins = self.event_start_time.hour * 60 + self.event_start_time.minute
-        end_mins = self.event_end_time.hour * 60 + self.event_end_time.minute
-        duration = end_mins - start_mins
+        duration = int((ends_at - starts_at).total_seconds() // 60)
         if duration < EVENT_DURATION_MIN_MINUTES:
             msg = f"Event must be at least {EVENT_DURATION_MIN_MINUTES} minutes."
             raise ValueError(msg)
@@ -73,6 +91,7 @@ class BookingResponse(BaseModel):
     organization_id: UUID
     event_name: str
     event_date: date
+    event_end_date: date
     event_start_time: time
     event_end_time: time
     event_duration_minutes: int = Field(..., ge=EVENT_DURATION_MIN_MINUTES)
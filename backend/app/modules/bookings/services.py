@@ -14,6 +14,8 @@ from app.core.exceptions import (
     ResourceNotFoundError,
 )
 from app.core.resource_names import BOOKING_RESOURCE, ORG_RESOURCE, VENUE_RESOURCE
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.auth.services import auth_service
 from app.modules.bookings.constants import BookingError
 from app.modules.bookings.models import Booking
 from app.modules.bookings.repository import BookingRepository
@@ -24,36 +26,48 @@ from app.modules.bookings.schemas import (
     BookingResponse,
     BookingSummaryResponse,
 )
-from app.modules.organizations.models import Organization
+from app.modules.bookings.utils import event_period_bounds
 from app.modules.organizations.repository import OrganizationRepository
-from app.modules.users.models import User
-from app.modules.venues.models import Venue
 from app.modules.venues.repository import VenueRepository
 
 # Statuses that can be cancelled
 CANCELLABLE_STATUSES = {BookingStatus.pending, BookingStatus.confirmed}
 
 
-async def _require_student_org(db: AsyncSession, user: User) -> Organization:
-    """Verify user is student org and return their organization."""
+async def _require_student_org(db: AsyncSession, user: AuthenticatedUser) -> UUID:
+    """Verify user is student org and return their organization ID.
+
+    Answered from the request principal; the database is only consulted
+    when the principal has no organization (it may predate its creation).
+    """
     if user.role != UserRole.student_org:
         raise AuthorizationError(BookingError.STUDENT_ORG_REQUIRED)
+    if user.organization_id is not None:
+        return user.organization_id
     org = await OrganizationRepository.get_by_owner_id(db, user.id)
     if not org:
         raise ResourceNotFoundError(ORG_RESOURCE, BookingError.NO_ORGANIZATION)
-    return org
+    auth_service.invalidate_user(user.email)
+    return org.id
+
 
+async def _require_venue_owner(db: AsyncSession, user: AuthenticatedUser, venue_id: UUID) -> None:
+    """Verify user is venue admin and owns the venue.
 
-async def _require_venue_owner(db: AsyncSession, user: User, venue_id: UUID) -> Venue:
-    """Verify user is venue admin and owns the venue."""
+    The venue's owner is always read from the database (one column by
+    primary key): the principal's cached venue_ids may still list a venue
+    that another worker has since soft-deleted. A venue owned by the user
+    but missing from the principal means the cached identity is stale.
+    """
     if user.role != UserRole.venue_admin:
         raise AuthorizationError(BookingError.VENUE_ADMIN_REQUIRED)
-    venue = await VenueRepository.get_by_id(db, venue_id)
-    if not venue:
+    owner_id = await VenueRepository.get_active_owner_id(db, venue_id)
+    if owner_id is None:
         raise ResourceNotFoundError(VENUE_RESOURCE, BookingError.VENUE_NOT_FOUND)
-    if venue.owner_id != user.id:
+    if owner_id != user.id:
         raise AuthorizationError(BookingError.NOT_VENUE_OWNER)
-    return venue
+    if not user.owns_venue(venue_id):
+        auth_service.invalidate_user(user.email)
 
 
 async def _get_booking_or_raise(db: AsyncSession, booking_id: UUID) -> Booking:
@@ -73,6 +87,7 @@ def _to_booking_response(booking: Booking) -> BookingResponse:
         organization_id=booking.organization_id,
         event_name=booking.event_name,
         event_date=booking.event_date,
+        event_end_date=booking.event_end_date,
         event_start_time=booking.event_start_time,
         event_end_time=booking.event_end_time,
         event_duration_minutes=duration_minutes,
@@ -92,23 +107,23 @@ class BookingService:
     @staticmethod
     async def get_my_summary(
         db: AsyncSession,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> BookingSummaryResponse:
         """Get booking summary stats for the current user's org."""
-        org = await _require_student_org(db, current_user)
+        org_id = await _require_student_org(db, current_user)
         today = datetime.now(tz=UTC).date()
-        stats = await BookingRepository.get_org_summary(db, org.id, today)
+        stats = await BookingRepository.get_org_summary(db, org_id, today)
         return BookingSummaryResponse(**stats)
 
     @staticmethod
     async def list_my_bookings(
         db: AsyncSession,
-        current_user: User,
+        current_user: AuthenticatedUser,
         filters: BookingFilters,
     ) -> BookingListResponse:
         """List bookings for the current user's organization."""
-        org = await _require_student_org(db, current_user)
-        bookings, total = await BookingRepository.get_by_org_id(db, org.id, filters)
+        org_id = await _require_student_org(db, current_user)
+        bookings, total = await BookingRepository.get_by_org_id(db, org_id, filters)
         total_pages = ceil(total / filters.page_size) if total > 0 else 0
         return BookingListResponse(
             items=[_to_booking_response(b) for b in bookings],
@@ -122,12 +137,12 @@ class BookingService:
     async def cancel_booking(
         db: AsyncSession,
         booking_id: UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> BookingResponse:
         """Cancel a booking (org owner only, pending/confirmed only)."""
-        org = await _require_student_org(db, current_user)
+        org_id = await _require_student_org(db, current_user)
         booking = await _get_booking_or_raise(db, booking_id)
-        if org.id != booking.organization_id:
+        if org_id != booking.organization_id:
             raise AuthorizationError(BookingError.NOT_ORG_OWNER)
         if booking.status not in CANCELLABLE_STATUSES:
             raise BusinessRuleError(BookingError.CANNOT_CANCEL_STATUS)
@@ -138,30 +153,35 @@ class BookingService:
     async def create_booking(
         db: AsyncSession,
         booking_data: BookingCreate,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> BookingResponse:
         """Create a new booking request (student org only)."""
-        org = await _require_student_org(db, current_user)
+        org_id = await _require_student_org(db, current_user)
         venue = await VenueRepository.get_by_id(db, booking_data.venue_id)
         if not venue:
             raise ResourceNotFoundError(VENUE_RESOURCE, BookingError.VENUE_NOT_FOUND)
-        has_conflict = await BookingRepository.has_time_conflict(
-            db,
-            booking_data.venue_id,
+        starts_at, ends_at = event_period_bounds(
             booking_data.event_date,
             booking_data.event_start_time,
             booking_data.event_end_time,
+            booking_data.event_end_date,
+        )
+        has_conflict = await BookingRepository.has_time_conflict(
+            db,
+            booking_data.venue_id,
+            starts_at,
+            ends_at,
         )
         if has_conflict:
             raise ConflictError(BookingError.TIME_CONFLICT)
-        booking = await BookingRepository.create(db, booking_data, org.id)
+        booking = await BookingRepository.create(db, booking_data, org_id, venue)
         return _to_booking_response(booking)
 
     @staticmethod
     async def accept_booking(
         db: AsyncSession,
         booking_id: UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> BookingResponse:
         """Accept a pending booking (venue owner only)."""
         booking = await _get_booking_or_raise(db, booking_id)
@@ -175,7 +195,7 @@ class BookingService:
     async def decline_booking(
         db: AsyncSession,
         booking_id: UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> BookingResponse:
         """Decline a pending booking (venue owner only)."""
         booking = await _get_booking_or_raise(db, booking_id)
@@ -189,7 +209,7 @@ class BookingService:
     async def list_venue_bookings(
         db: AsyncSession,
         venue_id: UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
         filters: BookingFilters,
     ) -> BookingListResponse:
         """List bookings for a venue with pagination (venue owner only)."""
@@ -0,0 +1,63 @@
+"""Booking utility functions.
+
+Pure helpers for turning a booking's date and wall-clock times into the
+half-open ``[start, end)`` period used for overlap checks and stats.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+DECEMBER = 12
+
+
+def resolve_event_end_date(
+    event_date: date,
+    start_time: time,
+    end_time: time,
+    event_end_date: date | None = None,
+) -> date:
+    """
+    Resolve the calendar date on which an event ends.
+
+    An explicit end date wins (multi-day events). Otherwise an end time at or
+    before the start time means the event runs past midnight into the next day.
+
+    Args:
+        event_date: Date the event starts.
+        start_time: Wall-clock start time.
+        end_time: Wall-clock end time.
+        event_end_date: Explicit end date, if the caller provided one.
+
+    Returns:
+        The date the event ends.
+    """
+    if event_end_date is not None:
+        return event_end_date
+    if end_time <= start_time:
+        return event_date + timedelta(days=1)
+    return event_date
+
+
+def event_period_bounds(
+    event_date: date,
+    start_time: time,
+    end_time: time,
+    event_end_date: date | None = None,
+) -> tuple[datetime, datetime]:
+    """
+    Build the (start, end) wall-clock datetimes for an event.
+
+    Mirrors the generated ``bookings.event_period`` column so Python-side
+    checks and SQL range comparisons agree.
+
+    Returns:
+        Tuple of naive (starts_at, ends_at) datetimes in venue-local time.
+    """
+    end_date = resolve_event_end_date(event_date, start_time, end_time, event_end_date)
+    return datetime.combine(event_date, start_time), datetime.combine(end_date, end_time)
+
+
+def month_bounds(year: int, month: int) -> tuple[date, date]:
+    """Return the first day of the month and the first day of the next month."""
+    first_day = date(year, month, 1)
+    next_month = date(year + 1, 1, 1) if month == DECEMBER else date(year, month + 1, 1)
+    return first_day, next_month
@@ -6,6 +6,7 @@ multiple bookings.
 
 Database constraints:
 - Must have a valid owner (FK to users table)
+- At most one organization per owner (unique owner_id, the upsert target)
 - Name is required
 - Type and university are optional (can be completed after signup)
 
@@ -15,10 +16,11 @@ Relationships:
 - Deletion restricted if organization has bookings
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import CheckConstraint, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.constants.enums import OrganizationType
@@ -104,10 +106,14 @@ class Organization(BaseModel, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
+    # Resized derivatives of the logo (see app.core.uploads.ImageVariants)
+    logo_variants: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+
     # Foreign keys
     owner_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False,
+        unique=True,  # One organization per owner; ON CONFLICT target
         index=True,  # Index for owner lookup
     )
 
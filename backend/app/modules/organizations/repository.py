@@ -1,13 +1,18 @@
 """Organization data access layer (Repository pattern)."""
 
-from uuid import UUID
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants.enums import OrganizationType
+from app.core.uploads import upload_key
 from app.modules.organizations.models import Organization
 from app.modules.organizations.schemas import OrganizationUpdate
+from app.modules.uploads.repository import UploadBlobRepository
 
 
 class OrganizationRepository:
@@ -20,9 +25,12 @@ class OrganizationRepository:
         owner_id: UUID,
         org_type: OrganizationType | None = None,
         university: str | None = None,
-    ) -> Organization:
+    ) -> Organization | None:
         """
-        Create a new organization.
+        Create a new organization unless the owner already has one.
+
+        A single INSERT ... ON CONFLICT (owner_id) DO NOTHING RETURNING, so
+        concurrent creates for the same owner can't both succeed.
 
         Args:
             db: Database session.
@@ -32,20 +40,69 @@ class OrganizationRepository:
             university: University name (optional).
 
         Returns:
-            Created organization.
+            Created organization, or None if the owner already has one.
         """
-        org = Organization(
-            name=name,
-            owner_id=owner_id,
-            type=org_type,
-            university=university,
+        now = datetime.now(UTC)
+        stmt = (
+            pg_insert(Organization)
+            .values(
+                id=uuid4(),
+                name=name,
+                owner_id=owner_id,
+                type=org_type,
+                university=university,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=[Organization.owner_id])
+            .returning(Organization)
         )
 
-        db.add(org)
-        await db.commit()
-        await db.refresh(org)
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
 
-        return org
+    @staticmethod
+    async def bulk_create(
+        db: AsyncSession,
+        orgs: list[tuple[UUID, str]],
+    ) -> int:
+        """
+        Create organizations for many owners in one multi-row upsert.
+
+        Owners that already have an organization are skipped via
+        ON CONFLICT (owner_id) DO NOTHING. Does not commit; the caller owns
+        the transaction.
+
+        Args:
+            db: Database session.
+            orgs: (owner_id, name) pairs.
+
+        Returns:
+            Number of organizations created.
+        """
+        if not orgs:
+            return 0
+
+        now = datetime.now(UTC)
+        stmt = (
+            pg_insert(Organization)
+            .values(
+                [
+                    {
+                        "id": uuid4(),
+                        "name": name,
+                        "owner_id": owner_id,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for owner_id, name in orgs
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[Organization.owner_id])
+            .returning(Organization.id)
+        )
+        result = await db.execute(stmt)
+        return len(result.all())
 
     @staticmethod
     async def get_by_id(
@@ -79,9 +136,7 @@ class OrganizationRepository:
         for field, value in update_dict.items():
             setattr(org, field, value)
 
-        await db.commit()
-        await db.refresh(org)
-
+        await db.flush()
         return org
 
     @staticmethod
@@ -89,11 +144,23 @@ class OrganizationRepository:
         db: AsyncSession,
         org: Organization,
         logo_url: str,
+        logo_variants: dict[str, Any] | None = None,
     ) -> Organization:
-        """Update the logo URL for an organization."""
-        org.logo_url = logo_url
+        """
+        Update the logo URL (and its resized derivatives) for an organization.
 
-        await db.commit()
-        await db.refresh(org)
+        The row is locked first so concurrent logo changes serialize, then
+        the upload reference moves from the old logo to the new one in the
+        same transaction.
+        """
+        await db.refresh(org, with_for_update=True)
+        await UploadBlobRepository.swap_reference(
+            db,
+            old_key=upload_key(org.logo_url),
+            new_key=upload_key(logo_url),
+        )
+        org.logo_url = logo_url
+        org.logo_variants = logo_variants
 
+        await db.flush()
         return org
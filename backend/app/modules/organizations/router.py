@@ -6,15 +6,20 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, File, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database.session import get_db
+from app.core.database.session import get_db, get_primary_read_db, get_read_db
 from app.modules.auth.dependencies import get_current_user
+from app.modules.auth.schemas import AuthenticatedUser
 from app.modules.organizations.schemas import (
     OrganizationCreate,
     OrganizationResponse,
     OrganizationUpdate,
 )
 from app.modules.organizations.services import organization_service
-from app.modules.users.models import User
+from app.modules.uploads.schemas import (
+    DirectUploadRequest,
+    DirectUploadResponse,
+    UploadConfirmRequest,
+)
 
 router = APIRouter(prefix="/organizations", tags=["Organizations"])
 
@@ -28,7 +33,7 @@ router = APIRouter(prefix="/organizations", tags=["Organizations"])
 async def create_organization(
     create_data: OrganizationCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> OrganizationResponse:
     """Create a new organization for the current user (student_org only)."""
     return await organization_service.create_org(
@@ -44,8 +49,8 @@ async def create_organization(
     summary="Get current user's organization",
 )
 async def get_my_organization(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> OrganizationResponse:
     """Get the authenticated user's organization."""
     return await organization_service.get_my_org(
@@ -61,8 +66,8 @@ async def get_my_organization(
 )
 async def get_organization(
     org_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> OrganizationResponse:
     """Get a single organization by ID (owner only)."""
     return await organization_service.get_org_by_id(
@@ -81,7 +86,7 @@ async def update_organization(
     org_id: UUID,
     update_data: OrganizationUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> OrganizationResponse:
     """Update an organization profile (owner only)."""
     return await organization_service.update_org(
@@ -101,7 +106,7 @@ async def upload_organization_logo(
     org_id: UUID,
     file: Annotated[UploadFile, File()],
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> OrganizationResponse:
     """Upload a logo image for an organization (owner only)."""
     return await organization_service.upload_logo(
@@ -110,3 +115,43 @@ async def upload_organization_logo(
         file=file,
         current_user=current_user,
     )
+
+
+@router.post(
+    "/{org_id}/logo/presign",
+    response_model=DirectUploadResponse,
+    summary="Presign a direct organization logo upload",
+)
+async def presign_organization_logo(
+    org_id: UUID,
+    request: DirectUploadRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+) -> DirectUploadResponse:
+    """Presign a direct-to-storage logo upload for an organization (owner only)."""
+    return await organization_service.presign_logo(
+        db=db,
+        org_id=org_id,
+        request=request,
+        current_user=current_user,
+    )
+
+
+@router.post(
+    "/{org_id}/logo/confirm",
+    response_model=OrganizationResponse,
+    summary="Confirm a direct organization logo upload",
+)
+async def confirm_organization_logo(
+    org_id: UUID,
+    request: UploadConfirmRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+) -> OrganizationResponse:
+    """Set a directly uploaded logo for an organization (owner only)."""
+    return await organization_service.confirm_logo(
+        db=db,
+        org_id=org_id,
+        request=request,
+        current_user=current_user,
+    )
@@ -1,6 +1,7 @@
 """Pydantic schemas for organization management API."""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -81,6 +82,7 @@ class OrganizationResponse(BaseModel):
     member_count: int | None = None
     website_url: str | None = None
     logo_url: str | None = None
+    logo_variants: dict[str, dict[str, Any]] | None = None
     created_at: datetime
     updated_at: datetime
 
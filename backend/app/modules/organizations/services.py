@@ -7,7 +7,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants.enums import UserRole
 from app.core.exceptions import AuthorizationError, ConflictError, ResourceNotFoundError
-from app.core.uploads import save_upload
+from app.core.uploads import confirm_image_upload, save_image_upload
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.auth.services import auth_service
 from app.modules.organizations.constants import OrgError
 from app.modules.organizations.models import Organization
 from app.modules.organizations.repository import OrganizationRepository
@@ -16,7 +18,12 @@ from app.modules.organizations.schemas import (
     OrganizationResponse,
     OrganizationUpdate,
 )
-from app.modules.users.models import User
+from app.modules.uploads.schemas import (
+    DirectUploadRequest,
+    DirectUploadResponse,
+    UploadConfirmRequest,
+)
+from app.modules.uploads.services import upload_service
 
 ORG_RESOURCE = "Organization"
 ORG_UPLOAD_SUBFOLDER = "organizations"
@@ -43,16 +50,13 @@ class OrganizationService:
     async def create_org(
         db: AsyncSession,
         create_data: OrganizationCreate,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> OrganizationResponse:
         """Create a new organization for the current user (student_org only)."""
         if current_user.role != UserRole.student_org:
             raise AuthorizationError(OrgError.STUDENT_ORG_REQUIRED)
 
-        existing = await OrganizationRepository.get_by_owner_id(db, current_user.id)
-        if existing:
-            raise ConflictError(OrgError.ALREADY_HAS_ORGANIZATION)
-
+        # The unique owner_id upsert settles "already has one" in the same statement
         org = await OrganizationRepository.create(
             db=db,
             name=create_data.name,
@@ -60,13 +64,18 @@ class OrganizationService:
             org_type=create_data.type,
             university=create_data.university,
         )
+        if org is None:
+            raise ConflictError(OrgError.ALREADY_HAS_ORGANIZATION)
+
+        # Cached identity still says "no organization"
+        auth_service.invalidate_user(current_user.email)
         return OrganizationResponse.model_validate(org)
 
     @staticmethod
     async def get_org_by_id(
         db: AsyncSession,
         org_id: UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> OrganizationResponse:
         """Retrieve a single organization by ID (owner only)."""
         org = await _require_org_owner(db, org_id, current_user.id)
@@ -75,7 +84,7 @@ class OrganizationService:
     @staticmethod
     async def get_my_org(
         db: AsyncSession,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> OrganizationResponse:
         """Retrieve the current user's organization (student_org only)."""
         if current_user.role != UserRole.student_org:
@@ -96,7 +105,7 @@ class OrganizationService:
         db: AsyncSession,
         org_id: UUID,
         update_data: OrganizationUpdate,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> OrganizationResponse:
         """Update an organization profile (owner only)."""
         org = await _require_org_owner(db, org_id, current_user.id)
@@ -114,17 +123,50 @@ class OrganizationService:
         db: AsyncSession,
         org_id: UUID,
         file: UploadFile,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> OrganizationResponse:
         """Upload and set a logo for an organization (owner only)."""
         org = await _require_org_owner(db, org_id, current_user.id)
 
-        logo_url = await save_upload(file, ORG_UPLOAD_SUBFOLDER)
+        logo = await save_image_upload(file, ORG_UPLOAD_SUBFOLDER)
+
+        updated_org = await OrganizationRepository.update_logo_url(
+            db=db,
+            org=org,
+            logo_url=logo.url,
+            logo_variants=logo.variants,
+        )
+
+        return OrganizationResponse.model_validate(updated_org)
+
+    @staticmethod
+    async def presign_logo(
+        db: AsyncSession,
+        org_id: UUID,
+        request: DirectUploadRequest,
+        current_user: AuthenticatedUser,
+    ) -> DirectUploadResponse:
+        """Presign a direct-to-storage logo upload for an organization (owner only)."""
+        await _require_org_owner(db, org_id, current_user.id)
+        return await upload_service.presign_image(ORG_UPLOAD_SUBFOLDER, request)
+
+    @staticmethod
+    async def confirm_logo(
+        db: AsyncSession,
+        org_id: UUID,
+        request: UploadConfirmRequest,
+        current_user: AuthenticatedUser,
+    ) -> OrganizationResponse:
+        """Set a directly uploaded logo for an organization by its storage key (owner only)."""
+        org = await _require_org_owner(db, org_id, current_user.id)
+
+        logo = await confirm_image_upload(ORG_UPLOAD_SUBFOLDER, request.key)
 
         updated_org = await OrganizationRepository.update_logo_url(
             db=db,
             org=org,
-            logo_url=logo_url,
+            logo_url=logo.url,
+            logo_variants=logo.variants,
         )
 
         return OrganizationResponse.model_validate(updated_org)
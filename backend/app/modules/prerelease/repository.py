@@ -34,6 +34,5 @@ class PrereleaseRepository:
             personal_note=data.personal_note,
         )
         db.add(response)
-        await db.commit()
-        await db.refresh(response)
+        await db.flush()
         return response
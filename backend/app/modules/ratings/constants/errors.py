@@ -16,3 +16,4 @@ class RatingError(str, Enum):
     STUDENT_ORG_REQUIRED = "Only student organization users can rate venues."
     NO_ORGANIZATION = "You do not have an organization."
     VENUE_NOT_FOUND = "Venue not found."
+    INVALID_CURSOR = "Invalid pagination cursor."
@@ -11,9 +11,11 @@ from app.modules.ratings.schemas import RatingFilters
 def parse_rating_filters(
     page: Annotated[int, Query(ge=MIN_PAGE)] = MIN_PAGE,
     page_size: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[str | None, Query()] = None,
 ) -> RatingFilters:
     """Parse and validate rating filtering query parameters."""
     return RatingFilters(
         page=page,
         page_size=page_size,
+        cursor=cursor,
     )
@@ -22,9 +22,11 @@ from uuid import UUID
 from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -76,10 +78,10 @@ class Rating(BaseModel, UUIDMixin):
         index=True,
     )
 
+    # Indexed together with created_at below for the venue ratings listing
     venue_id: Mapped[UUID] = mapped_column(
         ForeignKey("venues.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
     )
 
     # Rating fields
@@ -122,6 +124,13 @@ class Rating(BaseModel, UUIDMixin):
             name="rating_score_range_check",
         ),
         UniqueConstraint("booking_id", name="rating_one_per_booking"),
+        # Keyset pagination for a venue's ratings (newest first, id tie-breaker)
+        Index(
+            "ix_ratings_venue_created_at",
+            "venue_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,12 +1,21 @@
 """Rating data access layer (Repository pattern)."""
 
-from uuid import UUID
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, exists, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.constants.enums import BookingStatus
+from app.modules.bookings.models import Booking
+from app.modules.organizations.models import Organization
+from app.modules.ratings.constants import SCORE_MAX, SCORE_MIN
 from app.modules.ratings.models import Rating
 from app.modules.ratings.schemas import RatingCreate, RatingFilters
+from app.modules.venues.models import Venue
 
 
 class RatingRepository:
@@ -18,51 +27,220 @@ class RatingRepository:
         rating_data: RatingCreate,
         booking_id: UUID,
         organization_id: UUID,
-        venue_id: UUID,
-    ) -> Rating:
-        """Create a new rating record."""
-        rating = Rating(
-            booking_id=booking_id,
-            organization_id=organization_id,
-            venue_id=venue_id,
-            score=rating_data.score,
-            comment=rating_data.comment,
+    ) -> Row[Any] | None:
+        """
+        Create a rating for a completed booking in a single statement.
+
+        Runs one INSERT ... SELECT FROM bookings that only produces a row when
+        the booking exists, belongs to ``organization_id`` and is completed.
+        ON CONFLICT (booking_id) DO NOTHING lets the unique constraint settle
+        concurrent duplicates. A data-modifying CTE folds
+        the new score into the venue's rating aggregates in the same
+        statement, and the organization name is joined onto the result.
+
+        Args:
+            db: Database session
+            rating_data: Score and optional comment
+            booking_id: Booking being rated
+            organization_id: Organization that must have made the booking
+
+        Returns:
+            Row with the RatingResponse fields, or None if nothing was
+            inserted (see ``get_create_eligibility`` for why)
+        """
+        score = rating_data.score
+        eligible_booking = select(
+            literal(uuid4(), Rating.id.type),
+            Booking.id,
+            Booking.organization_id,
+            Booking.venue_id,
+            literal(score, Rating.score.type),
+            literal(rating_data.comment, Rating.comment.type),
+            literal(datetime.now(UTC), Rating.created_at.type),
+        ).where(
+            Booking.id == booking_id,
+            Booking.organization_id == organization_id,
+            Booking.status == BookingStatus.completed,
+        )
+        inserted = (
+            pg_insert(Rating)
+            .from_select(
+                [
+                    Rating.id,
+                    Rating.booking_id,
+                    Rating.organization_id,
+                    Rating.venue_id,
+                    Rating.score,
+                    Rating.comment,
+                    Rating.created_at,
+                ],
+                eligible_booking,
+            )
+            .on_conflict_do_nothing(index_elements=[Rating.booking_id])
+            .returning(
+                Rating.id,
+                Rating.booking_id,
+                Rating.organization_id,
+                Rating.venue_id,
+                Rating.score,
+                Rating.comment,
+                Rating.created_at,
+            )
+            .cte("inserted_rating")
+        )
+        # Relative increments so concurrent ratings never lose updates
+        venue_aggregates = (
+            update(Venue)
+            .where(Venue.id == inserted.c.venue_id)
+            .values(
+                {
+                    Venue.rating_count: Venue.rating_count + 1,
+                    Venue.rating_sum: Venue.rating_sum + score,
+                    Venue.rating_histogram[score]: Venue.rating_histogram[score] + 1,
+                    # Ratings don't edit the listing, so leave updated_at alone
+                    Venue.updated_at: Venue.updated_at,
+                }
+            )
+            .returning(Venue.id)
+            .cte("venue_aggregates")
         )
-        db.add(rating)
-        await db.commit()
-        await db.refresh(rating)
-        return rating
+        query = (
+            select(
+                inserted,
+                Organization.name.label("organization_name"),
+            )
+            .join(Organization, Organization.id == inserted.c.organization_id)
+            .add_cte(venue_aggregates)
+        )
+
+        result = await db.execute(query)
+        return result.one_or_none()
 
     @staticmethod
-    async def get_by_booking_id(
+    async def get_create_eligibility(
         db: AsyncSession,
         booking_id: UUID,
-    ) -> Rating | None:
-        """Retrieve a rating by booking ID."""
-        query = select(Rating).where(Rating.booking_id == booking_id)
+    ) -> Row[Any]:
+        """
+        Explain why ``create`` inserted nothing, in one query.
+
+        Args:
+            db: Database session
+            booking_id: Booking that was being rated
+
+        Returns:
+            Row with organization_id and status (both None if the booking
+            doesn't exist) and already_rated
+        """
+        query = select(
+            select(Booking.organization_id)
+            .where(Booking.id == booking_id)
+            .scalar_subquery()
+            .label("organization_id"),
+            select(Booking.status)
+            .where(Booking.id == booking_id)
+            .scalar_subquery()
+            .label("status"),
+            exists().where(Rating.booking_id == booking_id).label("already_rated"),
+        )
         result = await db.execute(query)
-        return result.scalar_one_or_none()
+        return result.one()
 
     @staticmethod
     async def get_by_venue_id(
         db: AsyncSession,
         venue_id: UUID,
         filters: RatingFilters,
-    ) -> tuple[list[Rating], int]:
-        """Retrieve ratings for a venue with pagination."""
-        query = select(Rating).where(Rating.venue_id == venue_id)
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[Row[Any]]:
+        """
+        Retrieve one page of a venue's ratings, newest first.
 
-        # Get total count before pagination
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
+        Selects only the rating columns plus the organization name, so none of
+        Rating's joined relationships are loaded. With ``after`` set, pages by
+        keyset on (created_at, id); otherwise falls back to the page offset.
+        Both are served by ix_ratings_venue_created_at. One extra row is
+        fetched so callers can tell whether another page exists.
 
-        # Apply pagination and ordering
-        offset = (filters.page - 1) * filters.page_size
-        query = query.order_by(Rating.created_at.desc())
-        query = query.offset(offset).limit(filters.page_size)
+        Args:
+            db: Database session
+            venue_id: Venue UUID
+            filters: Pagination params
+            after: (created_at, id) of the last rating already returned
+
+        Returns:
+            Up to page_size + 1 rows exposing the RatingResponse fields
+        """
+        query = (
+            select(
+                Rating.id,
+                Rating.booking_id,
+                Rating.organization_id,
+                Rating.venue_id,
+                Rating.score,
+                Rating.comment,
+                Rating.created_at,
+                Organization.name.label("organization_name"),
+            )
+            .join(Organization, Organization.id == Rating.organization_id)
+            .where(Rating.venue_id == venue_id)
+            .order_by(Rating.created_at.desc(), Rating.id.desc())
+            .limit(filters.page_size + 1)
+        )
+
+        if after is not None:
+            query = query.where(tuple_(Rating.created_at, Rating.id) < tuple_(*after))
+        else:
+            query = query.offset((filters.page - 1) * filters.page_size)
 
         result = await db.execute(query)
-        ratings = list(result.scalars().all())
+        return list(result.all())
+
+    @staticmethod
+    async def rebuild_venue_aggregates(db: AsyncSession) -> int:
+        """
+        Recompute every venue's rating aggregates from the ratings table.
+
+        Used to backfill or repair the denormalized counters. All venues are
+        reset first, then rated venues are filled from one grouped scan of
+        ratings, all inside a single transaction.
 
-        return ratings, total
+        Returns:
+            Number of venues that have at least one rating
+        """
+        histogram = array(
+            [func.count().filter(Rating.score == s) for s in range(SCORE_MIN, SCORE_MAX + 1)]
+        )
+        aggregates = (
+            select(
+                Rating.venue_id,
+                func.count().label("rating_count"),
+                func.sum(Rating.score).label("rating_sum"),
+                histogram.label("rating_histogram"),
+            )
+            .group_by(Rating.venue_id)
+            .subquery()
+        )
+
+        await db.execute(
+            update(Venue)
+            .values(
+                rating_count=0,
+                rating_sum=0,
+                rating_histogram=[0] * (SCORE_MAX - SCORE_MIN + 1),
+                updated_at=Venue.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(
+            update(Venue)
+            .where(Venue.id == aggregates.c.venue_id)
+            .values(
+                rating_count=aggregates.c.rating_count,
+                rating_sum=aggregates.c.rating_sum,
+                rating_histogram=aggregates.c.rating_histogram,
+                updated_at=Venue.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
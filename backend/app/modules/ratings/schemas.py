@@ -54,10 +54,18 @@ class RatingListResponse(BaseModel):
     page: int = Field(..., ge=MIN_PAGE)
     page_size: int = Field(..., ge=1, le=MAX_PAGE_SIZE)
     total_pages: int
+    next_cursor: str | None = Field(
+        None,
+        description="Pass as ?cursor= to fetch the next page; null on the last page",
+    )
 
 
 class RatingFilters(BaseModel):
-    """Schema for rating filtering and pagination query parameters."""
+    """Schema for rating filtering and pagination query parameters.
+
+    ``cursor`` (keyset) takes precedence over ``page`` (offset) when both are given.
+    """
 
     page: int = Field(MIN_PAGE, ge=MIN_PAGE)
     page_size: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: str | None = Field(None, description="Opaque cursor from a previous page")
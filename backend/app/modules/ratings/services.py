@@ -13,10 +13,10 @@ from app.core.exceptions import (
     ResourceNotFoundError,
 )
 from app.core.resource_names import BOOKING_RESOURCE, ORG_RESOURCE, VENUE_RESOURCE
-from app.modules.bookings.repository import BookingRepository
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.auth.services import auth_service
 from app.modules.organizations.repository import OrganizationRepository
 from app.modules.ratings.constants import RatingError
-from app.modules.ratings.models import Rating
 from app.modules.ratings.repository import RatingRepository
 from app.modules.ratings.schemas import (
     RatingCreate,
@@ -24,24 +24,10 @@ from app.modules.ratings.schemas import (
     RatingListResponse,
     RatingResponse,
 )
-from app.modules.users.models import User
+from app.modules.ratings.utils import decode_cursor, encode_cursor
 from app.modules.venues.repository import VenueRepository
 
 
-def _to_rating_response(rating: Rating) -> RatingResponse:
-    """Convert a Rating model to RatingResponse."""
-    return RatingResponse(
-        id=rating.id,
-        booking_id=rating.booking_id,
-        organization_id=rating.organization_id,
-        venue_id=rating.venue_id,
-        score=rating.score,
-        comment=rating.comment,
-        created_at=rating.created_at,
-        organization_name=(rating.organization.name if rating.organization else ""),
-    )
-
-
 class RatingService:
     """Service layer for rating business logic."""
 
@@ -50,47 +36,55 @@ class RatingService:
         db: AsyncSession,
         booking_id: UUID,
         rating_data: RatingCreate,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> RatingResponse:
-        """Create a rating for a completed booking (org owner only)."""
+        """
+        Create a rating for a completed booking (org owner only).
+
+        The happy path is a single INSERT ... SELECT round trip; ownership,
+        status and uniqueness are enforced by the statement itself, so
+        concurrent duplicate submissions can't both succeed.
+        """
         if current_user.role != UserRole.student_org:
             raise AuthorizationError(RatingError.STUDENT_ORG_REQUIRED)
 
-        org = await OrganizationRepository.get_by_owner_id(
-            db,
-            current_user.id,
+        organization_id = current_user.organization_id
+        if organization_id is None:
+            # Principal may predate the org; confirm before rejecting
+            org = await OrganizationRepository.get_by_owner_id(db, current_user.id)
+            if not org:
+                raise ResourceNotFoundError(
+                    ORG_RESOURCE,
+                    RatingError.NO_ORGANIZATION,
+                )
+            auth_service.invalidate_user(current_user.email)
+            organization_id = org.id
+
+        row = await RatingRepository.create(
+            db=db,
+            rating_data=rating_data,
+            booking_id=booking_id,
+            organization_id=organization_id,
         )
-        if not org:
-            raise ResourceNotFoundError(
-                ORG_RESOURCE,
-                RatingError.NO_ORGANIZATION,
-            )
+        if row is not None:
+            return RatingResponse.model_validate(row)
 
-        booking = await BookingRepository.get_by_id(db, booking_id)
-        if not booking:
+        # Nothing inserted: one follow-up query works out which rule failed
+        booking = await RatingRepository.get_create_eligibility(db, booking_id)
+        if booking.status is None:
             raise ResourceNotFoundError(
                 BOOKING_RESOURCE,
                 RatingError.BOOKING_NOT_FOUND,
             )
 
-        if booking.organization_id != org.id:
+        if booking.organization_id != organization_id:
             raise AuthorizationError(RatingError.NOT_BOOKING_OWNER)
 
         if booking.status != BookingStatus.completed:
             raise BusinessRuleError(RatingError.BOOKING_NOT_COMPLETED)
 
-        existing = await RatingRepository.get_by_booking_id(db, booking_id)
-        if existing:
-            raise ConflictError(RatingError.ALREADY_RATED)
-
-        rating = await RatingRepository.create(
-            db=db,
-            rating_data=rating_data,
-            booking_id=booking_id,
-            organization_id=org.id,
-            venue_id=booking.venue_id,
-        )
-        return _to_rating_response(rating)
+        # Completed, owned and not inserted: the unique booking_id constraint fired
+        raise ConflictError(RatingError.ALREADY_RATED)
 
     @staticmethod
     async def list_venue_ratings(
@@ -98,26 +92,41 @@ class RatingService:
         venue_id: UUID,
         filters: RatingFilters,
     ) -> RatingListResponse:
-        """List ratings for a venue (public, paginated)."""
-        venue = await VenueRepository.get_by_id(db=db, venue_id=venue_id)
-        if not venue:
+        """List ratings for a venue (public, keyset or offset paginated)."""
+        after = None
+        if filters.cursor:
+            try:
+                after = decode_cursor(filters.cursor)
+            except ValueError as e:
+                raise BusinessRuleError(RatingError.INVALID_CURSOR) from e
+
+        total = await VenueRepository.get_rating_count(db=db, venue_id=venue_id)
+        if total is None:
             raise ResourceNotFoundError(
                 VENUE_RESOURCE,
                 RatingError.VENUE_NOT_FOUND,
             )
 
-        ratings, total = await RatingRepository.get_by_venue_id(
+        rows = await RatingRepository.get_by_venue_id(
             db,
             venue_id,
             filters,
+            after=after,
         )
+        page_rows = rows[: filters.page_size]
+        next_cursor = None
+        if len(rows) > filters.page_size:
+            last = page_rows[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
         total_pages = ceil(total / filters.page_size) if total > 0 else 0
         return RatingListResponse(
-            items=[_to_rating_response(r) for r in ratings],
+            items=[RatingResponse.model_validate(row) for row in page_rows],
             total=total,
             page=filters.page,
             page_size=filters.page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
 
@@ -0,0 +1,47 @@
+"""Rating utility functions."""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+CURSOR_SEPARATOR = "|"
+
+
+def encode_cursor(created_at: datetime, rating_id: UUID) -> str:
+    """
+    Encode a rating's keyset position as an opaque URL-safe cursor.
+
+    Args:
+        created_at: Creation timestamp of the last rating on the page.
+        rating_id: ID of the last rating on the page (tie-breaker).
+
+    Returns:
+        str: Base64url cursor without padding.
+    """
+    raw = f"{created_at.isoformat()}{CURSOR_SEPARATOR}{rating_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Opaque cursor from a previous page.
+
+    Returns:
+        tuple: (created_at, rating_id) of the last rating already returned.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        msg = "Malformed cursor"
+        raise ValueError(msg) from e
+
+    created_at, _, rating_id = raw.partition(CURSOR_SEPARATOR)
+    return datetime.fromisoformat(created_at), UUID(rating_id)
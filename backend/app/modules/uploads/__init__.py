@@ -0,0 +1,5 @@
+"""Upload bookkeeping module (content-addressed blob reference counts)."""
+
+from app.modules.uploads.models import UploadBlob
+
+__all__ = ["UploadBlob"]
@@ -0,0 +1,67 @@
+"""Upload blob model for reference-counting content-addressed files.
+
+Uploaded files are stored under the hash of their bytes (see
+app.core.uploads), so one file can back any number of logos. Each row
+counts how many database values currently point at a stored file.
+
+Database constraints:
+- One row per storage key (unique key)
+- Reference counts are never negative
+
+Garbage collection:
+- A blob whose count drops to zero is an orphan; the collector deletes its
+  row and files once it has stayed unreferenced for the grace period
+- updated_at records the last count change, which starts that period
+"""
+
+from sqlalchemy import CheckConstraint, Index, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import BaseModel, TimestampMixin, UUIDMixin
+
+# Constants for column constraints
+KEY_MAX_LENGTH = 255
+
+
+class UploadBlob(BaseModel, UUIDMixin, TimestampMixin):
+    """
+    A stored upload and the number of references to it.
+
+    Attributes:
+        id: UUID primary key
+        key: Path of the original under the uploads directory
+            (e.g. "venues/<sha256>.png"); derivatives share its stem
+        ref_count: Number of rows currently referencing the file
+        created_at: When the blob was first referenced (UTC)
+        updated_at: Last reference count change (UTC)
+    """
+
+    __tablename__ = "upload_blobs"
+
+    key: Mapped[str] = mapped_column(
+        String(KEY_MAX_LENGTH),
+        nullable=False,
+        unique=True,  # ON CONFLICT target for reference upserts
+    )
+
+    ref_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    # Table-level constraints and indexes
+    __table_args__ = (
+        CheckConstraint("ref_count >= 0", name="upload_blob_ref_count_check"),
+        # The collector scans only orphans, oldest first
+        Index(
+            "ix_upload_blobs_orphaned",
+            "updated_at",
+            postgresql_where=text("ref_count = 0"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"<UploadBlob(id={self.id}, key={self.key}, ref_count={self.ref_count})>"
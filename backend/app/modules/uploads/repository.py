@@ -0,0 +1,114 @@
+"""Upload blob data access layer (Repository pattern)."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.uploads.models import UploadBlob
+
+
+class UploadBlobRepository:
+    """Repository for upload reference counting."""
+
+    @staticmethod
+    async def swap_reference(
+        db: AsyncSession,
+        old_key: str | None,
+        new_key: str | None,
+    ) -> None:
+        """
+        Move one reference from ``old_key`` to ``new_key``.
+
+        The new blob is upserted with its count incremented; the old one is
+        decremented (never below zero). Keys that are None (no upload, or a
+        URL outside the uploads directory) are skipped, as is a swap to the
+        same key. Does not commit; call it in the transaction that changes
+        the referencing row.
+
+        Args:
+            db: Database session.
+            old_key: Key the row referenced before.
+            new_key: Key the row references now.
+        """
+        if old_key == new_key:
+            return
+
+        now = datetime.now(UTC)
+        if new_key is not None:
+            stmt = pg_insert(UploadBlob).values(
+                id=uuid4(),
+                key=new_key,
+                ref_count=1,
+                created_at=now,
+                updated_at=now,
+            )
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[UploadBlob.key],
+                    set_={
+                        "ref_count": UploadBlob.ref_count + 1,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+            )
+        if old_key is not None:
+            await db.execute(
+                update(UploadBlob)
+                .where(UploadBlob.key == old_key, UploadBlob.ref_count > 0)
+                .values(ref_count=UploadBlob.ref_count - 1, updated_at=now)
+            )
+
+    @staticmethod
+    async def delete_orphans(
+        db: AsyncSession,
+        unreferenced_before: datetime,
+        limit: int,
+    ) -> list[str]:
+        """
+        Delete up to ``limit`` blobs unreferenced since before a cut-off.
+
+        Rows are locked with FOR UPDATE SKIP LOCKED, so a concurrent upload
+        taking a reference either wins (and the row is skipped) or waits and
+        re-creates the row after this commit.
+
+        Args:
+            db: Database session.
+            unreferenced_before: Only blobs whose count hit zero before this go.
+            limit: Maximum number of blobs to delete.
+
+        Returns:
+            Keys of the deleted blobs (their files are the caller's to remove).
+        """
+        orphans = (
+            select(UploadBlob.id)
+            .where(UploadBlob.ref_count == 0, UploadBlob.updated_at < unreferenced_before)
+            .order_by(UploadBlob.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            delete(UploadBlob).where(UploadBlob.id.in_(orphans)).returning(UploadBlob.key)
+        )
+        keys = list(result.scalars().all())
+        await db.commit()
+        return keys
+
+    @staticmethod
+    async def get_existing_keys(db: AsyncSession, keys: list[str]) -> set[str]:
+        """
+        Return which of ``keys`` have a blob row (referenced or not).
+
+        Args:
+            db: Database session.
+            keys: Storage keys to look up.
+
+        Returns:
+            The subset of keys that are tracked.
+        """
+        if not keys:
+            return set()
+        result = await db.execute(select(UploadBlob.key).where(UploadBlob.key.in_(keys)))
+        return set(result.scalars().all())
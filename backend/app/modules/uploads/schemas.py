@@ -0,0 +1,48 @@
+"""Pydantic schemas for direct-to-storage uploads."""
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.modules.uploads.models import KEY_MAX_LENGTH
+
+SHA256_HEX_LENGTH = 64
+
+
+class DirectUploadRequest(BaseModel):
+    """Schema for requesting a presigned direct upload of an image."""
+
+    content_type: str = Field(..., description="MIME type: image/png, image/jpeg or image/webp")
+    size: int = Field(..., gt=0, description="Exact size of the file in bytes")
+    sha256: str = Field(
+        ...,
+        min_length=SHA256_HEX_LENGTH,
+        max_length=SHA256_HEX_LENGTH,
+        description="SHA-256 of the file, hex-encoded",
+    )
+
+    @field_validator("sha256")
+    @classmethod
+    def lowercase_sha256(cls, v: str) -> str:
+        """Normalize the checksum to lowercase hex."""
+        return v.lower()
+
+
+class DirectUploadResponse(BaseModel):
+    """Schema for a presigned direct upload.
+
+    PUT the file to ``upload_url`` with exactly ``headers``, then confirm
+    ``key``. When ``already_stored`` is true the bytes are already in
+    storage: skip the PUT and confirm straight away.
+    """
+
+    key: str
+    already_stored: bool = False
+    upload_url: str | None = None
+    method: str = "PUT"
+    headers: dict[str, str] = Field(default_factory=dict)
+    expires_in: int | None = Field(None, description="Seconds until upload_url expires")
+
+
+class UploadConfirmRequest(BaseModel):
+    """Schema for recording a directly uploaded file by its storage key."""
+
+    key: str = Field(..., min_length=1, max_length=KEY_MAX_LENGTH)
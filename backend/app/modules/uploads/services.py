@@ -0,0 +1,122 @@
+"""Upload business logic: direct uploads and garbage collection (Service pattern)."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.uploads import (
+    create_presigned_image_upload,
+    find_unclaimed_uploads,
+    remove_upload_files,
+    sweep_staging_files,
+)
+from app.modules.uploads.repository import UploadBlobRepository
+from app.modules.uploads.schemas import DirectUploadRequest, DirectUploadResponse
+
+# Blobs deleted per transaction, and keys looked up per query, while collecting
+GC_BATCH_SIZE = 500
+
+
+@dataclass
+class GarbageReport:
+    """
+    Outcome of one garbage collection run.
+
+    Attributes:
+        orphans_deleted: Unreferenced blob rows deleted
+        files_removed: Originals (with their derivatives) deleted from disk
+        files_kept: Orphaned originals kept because they were touched recently
+        staged_removed: Staging files abandoned by interrupted uploads
+    """
+
+    orphans_deleted: int = 0
+    files_removed: int = 0
+    files_kept: int = 0
+    staged_removed: int = 0
+
+
+class UploadService:
+    """Service layer for direct uploads and upload storage maintenance."""
+
+    @staticmethod
+    async def presign_image(
+        subfolder: str,
+        request: DirectUploadRequest,
+    ) -> DirectUploadResponse:
+        """Presign a direct-to-storage image upload under ``subfolder``."""
+        presigned = await create_presigned_image_upload(
+            subfolder,
+            content_type=request.content_type,
+            size=request.size,
+            sha256=request.sha256,
+        )
+        if presigned.upload is None:
+            return DirectUploadResponse(key=presigned.key, already_stored=True)
+        return DirectUploadResponse(
+            key=presigned.key,
+            upload_url=presigned.upload.url,
+            headers=presigned.upload.headers,
+            expires_in=presigned.upload.expires_in,
+        )
+
+    @staticmethod
+    async def collect_garbage(
+        db: AsyncSession,
+        grace_seconds: float,
+    ) -> GarbageReport:
+        """
+        Delete uploads that nothing has referenced for ``grace_seconds``.
+
+        Two passes:
+        1. Blob rows whose count has been zero for the grace period are
+           deleted, then their files.
+        2. Content-addressed files with no blob row at all (the upload's
+           transaction never committed) are deleted once older than the
+           grace period. Legacy, UUID-named uploads are left alone.
+
+        Staging files left behind by interrupted uploads are removed too.
+
+        In both passes a file modified within the grace period is kept,
+        since an upload may have just deduplicated against it.
+
+        Args:
+            db: Database session.
+            grace_seconds: How long an unreferenced file is kept.
+
+        Returns:
+            Counts of what was removed.
+        """
+        report = GarbageReport()
+        cutoff = time.time() - grace_seconds
+        unreferenced_before = datetime.now(UTC) - timedelta(seconds=grace_seconds)
+
+        while keys := await UploadBlobRepository.delete_orphans(
+            db, unreferenced_before, GC_BATCH_SIZE
+        ):
+            report.orphans_deleted += len(keys)
+            await UploadService._remove_files(keys, cutoff, report)
+
+        candidates = await find_unclaimed_uploads(cutoff)
+        for start in range(0, len(candidates), GC_BATCH_SIZE):
+            batch = candidates[start : start + GC_BATCH_SIZE]
+            tracked = await UploadBlobRepository.get_existing_keys(db, batch)
+            untracked = [key for key in batch if key not in tracked]
+            await UploadService._remove_files(untracked, cutoff, report)
+
+        report.staged_removed = await asyncio.to_thread(sweep_staging_files, cutoff)
+        return report
+
+    @staticmethod
+    async def _remove_files(keys: list[str], cutoff: float, report: GarbageReport) -> None:
+        """Remove each key's files unless modified after ``cutoff``."""
+        for key in keys:
+            if await remove_upload_files(key, cutoff):
+                report.files_removed += 1
+            else:
+                report.files_kept += 1
+
+
+upload_service = UploadService()
@@ -9,7 +9,7 @@ Database constraints:
 - Email verification status tracked for future email confirmation flow
 
 Relationships:
-- One user can own multiple organizations (role=STUDENT_ORG)
+- One user can own one organization (role=STUDENT_ORG, unique owner_id)
 - One user can own multiple venues (role=VENUE_ADMIN)
 - Deletion is restricted if user owns organizations or venues
 """
@@ -0,0 +1,72 @@
+"""User data access layer (Repository pattern)."""
+
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import Row, false, select, true, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants.enums import UserRole
+from app.modules.users.models import User
+
+
+class UserRepository:
+    """Repository for user data access operations."""
+
+    @staticmethod
+    async def bulk_get_or_create(
+        db: AsyncSession,
+        users: list[tuple[str, UserRole]],
+    ) -> list[Row[Any]]:
+        """
+        Create missing users and return every requested user, in one statement.
+
+        A multi-row INSERT ... ON CONFLICT (email) DO NOTHING RETURNING is
+        unioned with the users that already existed, so each email comes
+        back exactly once (with its stored role, which wins over the
+        requested one). Does not commit; the caller owns the transaction.
+
+        Args:
+            db: Database session.
+            users: (email, role) pairs with unique emails.
+
+        Returns:
+            Rows of (id, email, role, created) for every email that exists
+            afterwards. An email missing from the result was inserted
+            concurrently by another transaction after this statement began.
+        """
+        if not users:
+            return []
+
+        now = datetime.now(UTC)
+        emails = [email for email, _ in users]
+        inserted = (
+            pg_insert(User)
+            .values(
+                [
+                    {
+                        "id": uuid4(),
+                        "email": email,
+                        "role": role,
+                        "email_verified": True,  # Assumed verified by Clerk
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for email, role in users
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id, User.email, User.role)
+            .cte("inserted_users")
+        )
+        stmt = union_all(
+            select(inserted.c.id, inserted.c.email, inserted.c.role, true().label("created")),
+            select(User.id, User.email, User.role, false().label("created")).where(
+                User.email.in_(emails)
+            ),
+        )
+
+        result = await db.execute(stmt)
+        return list(result.all())
@@ -28,6 +28,9 @@ class VenueError(str, Enum):
     INVALID_PAGE_SIZE = "Page size must be between 1 and {max}."
     INVALID_PAGE = "Page must be at least 1."
     SEARCH_TOO_SHORT = "Search query must be at least {min} characters."
+    INCOMPLETE_AVAILABILITY_WINDOW = (
+        "Availability search requires event_date, start_time and end_time together."
+    )
 
     # Business logic errors
     CANNOT_UPDATE_DELETED = "Cannot update a deleted venue."
@@ -4,18 +4,19 @@ Dependencies handle cross-cutting concerns like authentication, authorization,
 and request validation. They can be composed for complex requirements.
 """
 
-from typing import Annotated
+from datetime import date, time
+from typing import Annotated, Literal
 
 from fastapi import Depends, Query
 
 from app.core.constants.enums import UserRole, VenueType
 from app.modules.auth.dependencies import require_role
-from app.modules.users.models import User
+from app.modules.auth.schemas import AuthenticatedUser
 from app.modules.venues.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MIN_PAGE
 from app.modules.venues.schemas import VenueFilters
 
 # Create venue admin dependency using role factory
-get_venue_admin = Annotated[User, Depends(require_role(UserRole.venue_admin))]
+get_venue_admin = Annotated[AuthenticatedUser, Depends(require_role(UserRole.venue_admin))]
 
 
 def parse_venue_filters(  # noqa: PLR0913
@@ -24,6 +25,10 @@ def parse_venue_filters(  # noqa: PLR0913
     max_capacity: Annotated[int | None, Query(ge=1)] = None,
     max_price_cents: Annotated[int | None, Query(ge=0)] = None,
     search: Annotated[str | None, Query()] = None,
+    event_date: Annotated[date | None, Query()] = None,
+    start_time: Annotated[time | None, Query()] = None,
+    end_time: Annotated[time | None, Query()] = None,
+    sort: Annotated[Literal["newest", "rating"], Query()] = "newest",
     page: Annotated[int, Query(ge=MIN_PAGE)] = MIN_PAGE,
     page_size: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
 ) -> VenueFilters:
@@ -36,6 +41,10 @@ def parse_venue_filters(  # noqa: PLR0913
         max_capacity: Maximum capacity filter
         max_price_cents: Maximum price filter (in cents)
         search: Search query for name/address
+        event_date: Only include venues free on this date
+        start_time: Start of the requested availability window
+        end_time: End of the requested availability window
+        sort: Result ordering ("newest" or "rating")
         page: Page number (1-indexed)
         page_size: Items per page
 
@@ -48,6 +57,10 @@ def parse_venue_filters(  # noqa: PLR0913
         max_capacity=max_capacity,
         max_price_cents=max_price_cents,
         search=search,
+        event_date=event_date,
+        start_time=start_time,
+        end_time=end_time,
+        sort=sort,
         page=page,
         page_size=page_size,
     )
@@ -10,6 +10,8 @@ Database constraints:
 - Capacity must be positive when set (> 0)
 - Base price must be non-negative when set (>= 0)
 - Soft delete pattern preserves booking references
+- Rating aggregates (count, sum, 1-5 histogram) are denormalized from ratings
+  and kept in step by RatingRepository.create; rating_average is generated
 
 Relationships:
 - Belongs to one user (owner with VENUE_ADMIN role)
@@ -17,10 +19,21 @@ Relationships:
 - Deletion is soft (deleted_at timestamp) to preserve historical bookings
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    CheckConstraint,
+    Computed,
+    Double,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.constants.enums import VenueType
@@ -39,6 +52,12 @@ ADDRESS_STATE_MAX_LENGTH = 2  # Two-letter state code (e.g., "CA", "NY")
 ADDRESS_ZIP_MAX_LENGTH = 10  # ZIP+4 format (e.g., "94720-1234")
 LOGO_URL_MAX_LENGTH = 500
 
+# Rating aggregates: one histogram bucket per score (1-5), averaged in the database
+RATING_HISTOGRAM_EMPTY = "{0,0,0,0,0}"
+RATING_AVERAGE_EXPRESSION = (
+    "CASE WHEN rating_count > 0 THEN rating_sum::double precision / rating_count END"
+)
+
 
 class Venue(BaseModel, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     """
@@ -65,6 +84,10 @@ class Venue(BaseModel, UUIDMixin, TimestampMixin, SoftDeleteMixin):
         address_state: Two-letter state code (optional)
         address_zip: ZIP code (optional)
         owner_id: Foreign key to user who manages this venue
+        rating_count: Number of ratings received
+        rating_sum: Sum of all rating scores
+        rating_histogram: Rating counts per score, index 1-5 (Postgres arrays are 1-based)
+        rating_average: Generated rating_sum / rating_count (NULL when unrated)
         created_at: Venue listing creation timestamp (UTC)
         updated_at: Last modification timestamp (UTC)
         deleted_at: Soft delete timestamp (NULL if active)
@@ -73,6 +96,9 @@ class Venue(BaseModel, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     """
 
     __tablename__ = "venues"
+    # Rating counters and rating_average are filled in by the database; fetch
+    # them with RETURNING on flush instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}  # noqa: RUF012
 
     # Core fields
     name: Mapped[str] = mapped_column(
@@ -122,6 +148,36 @@ class Venue(BaseModel, UUIDMixin, TimestampMixin, SoftDeleteMixin):
         nullable=True,
     )
 
+    # Resized derivatives of the logo (see app.core.uploads.ImageVariants)
+    logo_variants: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+
+    # Rating aggregates (denormalized from ratings, see RatingRepository.create)
+    rating_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    rating_sum: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    rating_histogram: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer),
+        nullable=False,
+        default=lambda: [0, 0, 0, 0, 0],
+        server_default=RATING_HISTOGRAM_EMPTY,
+    )
+
+    rating_average: Mapped[float | None] = mapped_column(
+        Double,
+        Computed(RATING_AVERAGE_EXPRESSION, persisted=True),
+    )
+
     # Foreign keys
     owner_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -154,6 +210,13 @@ class Venue(BaseModel, UUIDMixin, TimestampMixin, SoftDeleteMixin):
             "base_price_cents IS NULL OR base_price_cents >= 0",
             name="venue_price_non_negative_check",
         ),
+        # Backs the sort=rating listing (unrated venues last, newest first on ties)
+        Index(
+            "ix_venues_rating_average",
+            text("rating_average DESC NULLS LAST"),
+            text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
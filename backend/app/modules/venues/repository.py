@@ -4,14 +4,25 @@ All database queries are isolated here. Repository methods return domain models,
 not raw database rows. This layer has no business logic.
 """
 
-from uuid import UUID
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import String, Uuid, and_, column, exists, func, literal, or_, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.uploads import upload_key
+from app.modules.bookings.repository import overlapping_booking_exists
+from app.modules.bookings.utils import event_period_bounds
+from app.modules.uploads.repository import UploadBlobRepository
 from app.modules.venues.models import Venue
 from app.modules.venues.schemas import VenueCreate, VenueFilters, VenueUpdate
 
+# First key of the advisory lock taken while provisioning a signup venue
+# (second key: hash of the owner id). Spells "VENU" so it is easy to spot in pg_locks.
+SIGNUP_VENUE_LOCK_CLASS = 0x56454E55
+
 
 class VenueRepository:
     """Repository for venue data access operations."""
@@ -41,6 +52,53 @@ class VenueRepository:
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_active_owner_id(
+        db: AsyncSession,
+        venue_id: UUID,
+    ) -> UUID | None:
+        """
+        Retrieve the owner of a venue that has not been soft-deleted.
+
+        A primary-key lookup of one column, for ownership checks that don't
+        need the venue itself.
+
+        Args:
+            db: Database session
+            venue_id: Venue UUID
+
+        Returns:
+            Owner's user UUID, or None if the venue is missing or deleted
+        """
+        query = select(Venue.owner_id).where(
+            Venue.id == venue_id,
+            Venue.deleted_at.is_(None),
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_rating_count(
+        db: AsyncSession,
+        venue_id: UUID,
+    ) -> int | None:
+        """
+        Retrieve an active venue's denormalized rating count.
+
+        Args:
+            db: Database session
+            venue_id: Venue UUID
+
+        Returns:
+            Rating count, or None if the venue doesn't exist or is deleted
+        """
+        query = select(Venue.rating_count).where(
+            Venue.id == venue_id,
+            Venue.deleted_at.is_(None),
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_all(
         db: AsyncSession,
@@ -49,6 +107,11 @@ class VenueRepository:
         """
         Retrieve venues with filtering and pagination.
 
+        When the filters carry a full availability window (date, start, end),
+        venues with an overlapping pending or confirmed booking are excluded
+        in the same query via a correlated NOT EXISTS. ``sort="rating"`` orders
+        by the denormalized rating average, unrated venues last.
+
         Args:
             db: Database session
             filters: Query filters and pagination params
@@ -84,6 +147,12 @@ class VenueRepository:
                 )
             )
 
+        # Apply availability filter: anti-join against overlapping active bookings
+        window = filters.availability_window
+        if window:
+            starts_at, ends_at = event_period_bounds(*window)
+            query = query.where(~overlapping_booking_exists(Venue.id, starts_at, ends_at))
+
         # Get total count before pagination
         count_query = select(func.count()).select_from(query.subquery())
         total_result = await db.execute(count_query)
@@ -93,7 +162,9 @@ class VenueRepository:
         offset = (filters.page - 1) * filters.page_size
         query = query.offset(offset).limit(filters.page_size)
 
-        # Order by created_at descending (newest first)
+        # Order by rating (served by ix_venues_rating_average) or newest first
+        if filters.sort == "rating":
+            query = query.order_by(Venue.rating_average.desc().nulls_last())
         query = query.order_by(Venue.created_at.desc())
 
         # Execute query
@@ -137,31 +208,138 @@ class VenueRepository:
         db: AsyncSession,
         name: str,
         owner_id: UUID,
-    ) -> Venue:
+    ) -> Venue | None:
         """
-        Create a new venue with minimal required fields.
+        Create the owner's first venue with minimal fields, unless they have one.
 
         Used during signup when only name is provided. Users can
         complete their profile (type, capacity, etc.) later.
 
+        Venue admins may list several venues, so there is no per-owner unique
+        key to upsert on. Instead a transaction-scoped advisory lock on the
+        owner serializes concurrent signups, and the following
+        INSERT ... SELECT WHERE NOT EXISTS ... RETURNING runs on a fresh
+        snapshot that sees any venue a competing transaction committed. The
+        lock is held until the caller commits.
+
         Args:
             db: Database session.
             name: Venue name.
             owner_id: Owner user ID.
 
         Returns:
-            Created venue.
+            Created venue, or None if the owner already has an active venue.
         """
-        venue = Venue(
-            name=name,
-            owner_id=owner_id,
+        await db.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    SIGNUP_VENUE_LOCK_CLASS,
+                    func.hashtext(str(owner_id)),
+                )
+            )
         )
 
-        db.add(venue)
-        await db.commit()
-        await db.refresh(venue)
+        now = datetime.now(UTC)
+        no_active_venue = select(
+            literal(uuid4(), Venue.id.type),
+            literal(name, Venue.name.type),
+            literal(owner_id, Venue.owner_id.type),
+            literal(now, Venue.created_at.type),
+            literal(now, Venue.updated_at.type),
+        ).where(
+            ~exists().where(
+                Venue.owner_id == owner_id,
+                Venue.deleted_at.is_(None),
+            )
+        )
+        stmt = (
+            pg_insert(Venue)
+            .from_select(
+                [Venue.id, Venue.name, Venue.owner_id, Venue.created_at, Venue.updated_at],
+                no_active_venue,
+            )
+            .returning(Venue)
+        )
 
-        return venue
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def bulk_create_minimal(
+        db: AsyncSession,
+        venues: list[tuple[UUID, str]],
+    ) -> int:
+        """
+        Create a signup venue for each owner that has no active venue yet.
+
+        Bulk counterpart of ``create_minimal``: one statement takes the same
+        per-owner advisory locks (in a fixed order, so concurrent backfills
+        can't deadlock), then one INSERT ... SELECT FROM (VALUES ...) WHERE
+        NOT EXISTS creates the missing venues. Does not commit; the caller
+        owns the transaction.
+
+        Args:
+            db: Database session.
+            venues: (owner_id, name) pairs with unique owners.
+
+        Returns:
+            Number of venues created.
+        """
+        if not venues:
+            return 0
+
+        owner_keys = (
+            values(column("owner_key", String), name="signup_owners")
+            .data([(str(owner_id),) for owner_id, _ in venues])
+            .alias("signup_owners")
+        )
+        ordered_keys = (
+            select(func.hashtext(owner_keys.c.owner_key).label("lock_key"))
+            .distinct()
+            .order_by("lock_key")
+            .subquery("ordered_keys")
+        )
+        await db.execute(
+            select(
+                func.count(
+                    func.pg_advisory_xact_lock(SIGNUP_VENUE_LOCK_CLASS, ordered_keys.c.lock_key)
+                )
+            )
+        )
+
+        now = datetime.now(UTC)
+        signups = (
+            values(
+                column("id", Uuid),
+                column("name", String),
+                column("owner_id", Uuid),
+                name="signups",
+            )
+            .data([(uuid4(), name, owner_id) for owner_id, name in venues])
+            .alias("signups")
+        )
+        missing = select(
+            signups.c.id,
+            signups.c.name,
+            signups.c.owner_id,
+            literal(now, Venue.created_at.type),
+            literal(now, Venue.updated_at.type),
+        ).where(
+            ~exists().where(
+                Venue.owner_id == signups.c.owner_id,
+                Venue.deleted_at.is_(None),
+            )
+        )
+        stmt = (
+            pg_insert(Venue)
+            .from_select(
+                [Venue.id, Venue.name, Venue.owner_id, Venue.created_at, Venue.updated_at],
+                missing,
+            )
+            .returning(Venue.id)
+        )
+        result = await db.execute(stmt)
+        return len(result.all())
 
     @staticmethod
     async def create(
@@ -193,9 +371,7 @@ class VenueRepository:
         )
 
         db.add(venue)
-        await db.commit()
-        await db.refresh(venue)
-
+        await db.flush()
         return venue
 
     @staticmethod
@@ -221,9 +397,7 @@ class VenueRepository:
         for field, value in update_dict.items():
             setattr(venue, field, value)
 
-        await db.commit()
-        await db.refresh(venue)
-
+        await db.flush()
         return venue
 
     @staticmethod
@@ -241,21 +415,32 @@ class VenueRepository:
         from datetime import UTC, datetime
 
         venue.deleted_at = datetime.now(UTC)
-
-        await db.commit()
+        await db.flush()
 
     @staticmethod
     async def update_logo_url(
         db: AsyncSession,
         venue: Venue,
         logo_url: str,
+        logo_variants: dict[str, Any] | None = None,
     ) -> Venue:
-        """Update the logo URL for a venue."""
-        venue.logo_url = logo_url
+        """
+        Update the logo URL (and its resized derivatives) for a venue.
 
-        await db.commit()
-        await db.refresh(venue)
+        The row is locked first so concurrent logo changes serialize, then
+        the upload reference moves from the old logo to the new one in the
+        same transaction.
+        """
+        await db.refresh(venue, with_for_update=True)
+        await UploadBlobRepository.swap_reference(
+            db,
+            old_key=upload_key(venue.logo_url),
+            new_key=upload_key(logo_url),
+        )
+        venue.logo_url = logo_url
+        venue.logo_variants = logo_variants
 
+        await db.flush()
         return venue
 
     @staticmethod
@@ -10,15 +10,20 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, File, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database.session import get_db
+from app.core.database.session import get_db, get_primary_read_db, get_read_db
 from app.modules.auth.dependencies import get_current_user
+from app.modules.auth.schemas import AuthenticatedUser
 from app.modules.bookings.router import parse_booking_filters
 from app.modules.bookings.schemas import BookingFilters, BookingListResponse
 from app.modules.bookings.services import booking_service
 from app.modules.ratings.dependencies import parse_rating_filters
 from app.modules.ratings.schemas import RatingFilters, RatingListResponse
 from app.modules.ratings.services import rating_service
-from app.modules.users.models import User
+from app.modules.uploads.schemas import (
+    DirectUploadRequest,
+    DirectUploadResponse,
+    UploadConfirmRequest,
+)
 from app.modules.venues.dependencies import parse_venue_filters
 from app.modules.venues.schemas import (
     VenueCreate,
@@ -43,7 +48,7 @@ router = APIRouter(prefix="/venues", tags=["Venues"])
 async def create_venue(
     venue_data: VenueCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VenueResponse:
     """Create a new venue (venue admin only)."""
     return await venue_service.create_venue(
@@ -60,8 +65,8 @@ async def create_venue(
     description="Retrieve the venue owned by the authenticated user.",
 )
 async def get_my_venue(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VenueResponse:
     """Get the current user's venue."""
     return await venue_service.get_my_venue(db=db, current_user=current_user)
@@ -75,8 +80,8 @@ async def get_my_venue(
 )
 async def get_venue_stats(
     venue_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VenueStatsResponse:
     """Get venue performance stats (owner only)."""
     return await venue_service.get_venue_stats(
@@ -94,8 +99,8 @@ async def get_venue_stats(
 )
 async def get_venue(
     venue_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    _current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VenueResponse:
     """Get a single venue by ID.
 
@@ -112,13 +117,15 @@ async def get_venue(
     summary="List venues with filters",
     description=(
         "List all venues with optional filtering by type, capacity, "
-        "price, and search query. Supports pagination."
+        "price, and search query. Passing event_date, start_time and end_time "
+        "restricts results to venues free for that window. sort=rating orders by "
+        "average rating (unrated venues last). Supports pagination."
     ),
 )
 async def list_venues(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     filters: Annotated[VenueFilters, Depends(parse_venue_filters)],
-    _current_user: Annotated[User, Depends(get_current_user)],
+    _current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VenueListResponse:
     """List venues with filtering and pagination."""
     return await venue_service.list_venues(db=db, filters=filters)
@@ -136,7 +143,7 @@ async def update_venue(
     venue_id: UUID,
     update_data: VenueUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VenueResponse:
     """Update a venue (owner only)."""
     return await venue_service.update_venue(
@@ -157,7 +164,7 @@ async def upload_venue_logo(
     venue_id: UUID,
     file: Annotated[UploadFile, File()],
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> VenueResponse:
     """Upload a logo image for a venue (owner only)."""
     return await venue_service.upload_logo(
@@ -168,6 +175,51 @@ async def upload_venue_logo(
     )
 
 
+@router.post(
+    "/{venue_id}/logo/presign",
+    response_model=DirectUploadResponse,
+    summary="Presign a direct venue logo upload",
+    description=(
+        "Get a URL to PUT a logo image directly to storage, bound to its type, "
+        "size and SHA-256. Confirm the returned key afterwards. Requires ownership."
+    ),
+)
+async def presign_venue_logo(
+    venue_id: UUID,
+    request: DirectUploadRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+) -> DirectUploadResponse:
+    """Presign a direct-to-storage logo upload for a venue (owner only)."""
+    return await venue_service.presign_logo(
+        db=db,
+        venue_id=venue_id,
+        request=request,
+        current_user=current_user,
+    )
+
+
+@router.post(
+    "/{venue_id}/logo/confirm",
+    response_model=VenueResponse,
+    summary="Confirm a direct venue logo upload",
+    description="Set the venue logo to a directly uploaded image. Requires ownership.",
+)
+async def confirm_venue_logo(
+    venue_id: UUID,
+    request: UploadConfirmRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+) -> VenueResponse:
+    """Set a directly uploaded logo for a venue (owner only)."""
+    return await venue_service.confirm_logo(
+        db=db,
+        venue_id=venue_id,
+        request=request,
+        current_user=current_user,
+    )
+
+
 @router.delete(
     "/{venue_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -180,7 +232,7 @@ async def upload_venue_logo(
 async def delete_venue(
     venue_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
 ) -> None:
     """Soft delete a venue (owner only)."""
     await venue_service.delete_venue(
@@ -198,8 +250,8 @@ async def delete_venue(
 )
 async def list_venue_bookings(
     venue_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     filters: Annotated[BookingFilters, Depends(parse_booking_filters)],
 ) -> BookingListResponse:
     """List bookings for a venue with pagination (owner only)."""
@@ -215,11 +267,14 @@ async def list_venue_bookings(
     "/{venue_id}/ratings",
     response_model=RatingListResponse,
     summary="List venue ratings",
-    description="List ratings for a venue with pagination. Public endpoint.",
+    description=(
+        "List ratings for a venue, newest first. Pass the returned next_cursor "
+        "as ?cursor= to fetch the next page. Public endpoint."
+    ),
 )
 async def list_venue_ratings(
     venue_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     filters: Annotated[RatingFilters, Depends(parse_rating_filters)],
 ) -> RatingListResponse:
     """List ratings for a venue (public, paginated)."""
@@ -4,7 +4,8 @@ Defines request and response models with comprehensive validation.
 Follows the pattern: Base → Create/Update → Response hierarchy.
 """
 
-from datetime import datetime
+from datetime import date, datetime, time
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -171,6 +172,13 @@ class VenueResponse(BaseModel):
     address_state: str | None = None
     address_zip: str | None = None
     logo_url: str | None = None
+    logo_variants: dict[str, dict[str, Any]] | None = None
+    rating_count: int = 0
+    rating_average: float | None = Field(None, description="Mean score, null when unrated")
+    rating_histogram: list[int] = Field(
+        default_factory=lambda: [0, 0, 0, 0, 0],
+        description="Number of ratings per score, index 0 = 1 star ... index 4 = 5 stars",
+    )
     created_at: datetime
     updated_at: datetime
     deleted_at: datetime | None = None
@@ -226,6 +234,25 @@ class VenueFilters(BaseModel):
         max_length=SEARCH_MAX_LENGTH,
         description="Search venue name and address (case-insensitive)",
     )
+    event_date: date | None = Field(
+        None,
+        description="Only return venues free on this date (requires start/end time)",
+    )
+    start_time: time | None = Field(
+        None,
+        description="Start of the requested availability window",
+    )
+    end_time: time | None = Field(
+        None,
+        description=(
+            "End of the requested availability window "
+            "(at or before start_time means the window runs past midnight)"
+        ),
+    )
+    sort: Literal["newest", "rating"] = Field(
+        "newest",
+        description="Order by newest listing or highest average rating (unrated last)",
+    )
     page: int = Field(
         MIN_PAGE,
         ge=MIN_PAGE,
@@ -237,3 +264,16 @@ class VenueFilters(BaseModel):
         le=MAX_PAGE_SIZE,
         description=f"Items per page (max {MAX_PAGE_SIZE})",
     )
+
+    @property
+    def availability_window(self) -> tuple[date, time, time] | None:
+        """Return (date, start, end) when a full availability window was requested."""
+        if self.event_date and self.start_time and self.end_time:
+            return self.event_date, self.start_time, self.end_time
+        return None
+
+    @property
+    def has_partial_availability_window(self) -> bool:
+        """Whether only some of the availability window fields were provided."""
+        provided = (self.event_date, self.start_time, self.end_time)
+        return any(v is not None for v in provided) and self.availability_window is None
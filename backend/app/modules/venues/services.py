@@ -14,9 +14,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants.enums import UserRole
 from app.core.exceptions import AuthorizationError, BusinessRuleError, ResourceNotFoundError
-from app.core.uploads import save_upload
+from app.core.uploads import confirm_image_upload, save_image_upload
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.auth.services import auth_service
 from app.modules.bookings.repository import BookingRepository
-from app.modules.users.models import User
+from app.modules.uploads.schemas import (
+    DirectUploadRequest,
+    DirectUploadResponse,
+    UploadConfirmRequest,
+)
+from app.modules.uploads.services import upload_service
 from app.modules.venues.constants import VENUE_RESOURCE, VenueError
 from app.modules.venues.models import Venue
 from app.modules.venues.repository import VenueRepository
@@ -60,7 +67,7 @@ class VenueService:
     async def create_venue(
         db: AsyncSession,
         venue_data: VenueCreate,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> VenueResponse:
         """
         Create a new venue listing.
@@ -86,13 +93,15 @@ class VenueService:
             venue_data=venue_data,
             owner_id=current_user.id,
         )
+        # Cached identity may still point at no (or an older) venue
+        auth_service.invalidate_user(current_user.email)
 
         return VenueResponse.model_validate(venue)
 
     @staticmethod
     async def get_my_venue(
         db: AsyncSession,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> VenueResponse:
         """
         Retrieve the venue owned by the current user.
@@ -160,7 +169,13 @@ class VenueService:
 
         Returns:
             Paginated venue list response
+
+        Raises:
+            BusinessRuleError: If the availability window is only partially given.
         """
+        if filters.has_partial_availability_window:
+            raise BusinessRuleError(VenueError.INCOMPLETE_AVAILABILITY_WINDOW)
+
         venues, total = await VenueRepository.get_all(db=db, filters=filters)
 
         # Calculate total pages
@@ -179,7 +194,7 @@ class VenueService:
         db: AsyncSession,
         venue_id: UUID,
         update_data: VenueUpdate,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> VenueResponse:
         """
         Update an existing venue.
@@ -229,10 +244,16 @@ class VenueService:
     async def get_venue_stats(
         db: AsyncSession,
         venue_id: UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> VenueStatsResponse:
         """Get performance stats for a venue (owner only)."""
-        await _require_venue_owner(db, venue_id, current_user.id)
+        # Checked against the database, not the principal's cached venue_ids,
+        # which may still list a venue another worker has soft-deleted
+        owner_id = await VenueRepository.get_active_owner_id(db, venue_id)
+        if owner_id is None:
+            raise ResourceNotFoundError(VENUE_RESOURCE, VenueError.VENUE_NOT_FOUND)
+        if owner_id != current_user.id:
+            raise AuthorizationError(VenueError.NOT_VENUE_OWNER)
 
         now = datetime.now(UTC)
         year, month = now.year, now.month
@@ -256,7 +277,7 @@ class VenueService:
     async def delete_venue(
         db: AsyncSession,
         venue_id: UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> None:
         """
         Soft delete a venue.
@@ -291,23 +312,57 @@ class VenueService:
 
         # Soft delete
         await VenueRepository.soft_delete(db=db, venue=venue)
+        auth_service.invalidate_user(current_user.email)
 
     @staticmethod
     async def upload_logo(
         db: AsyncSession,
         venue_id: UUID,
         file: UploadFile,
-        current_user: User,
+        current_user: AuthenticatedUser,
     ) -> VenueResponse:
         """Upload and set a logo for a venue (owner only)."""
         venue = await _require_venue_owner(db, venue_id, current_user.id)
 
-        logo_url = await save_upload(file, VENUE_UPLOAD_SUBFOLDER)
+        logo = await save_image_upload(file, VENUE_UPLOAD_SUBFOLDER)
+
+        updated_venue = await VenueRepository.update_logo_url(
+            db=db,
+            venue=venue,
+            logo_url=logo.url,
+            logo_variants=logo.variants,
+        )
+
+        return VenueResponse.model_validate(updated_venue)
+
+    @staticmethod
+    async def presign_logo(
+        db: AsyncSession,
+        venue_id: UUID,
+        request: DirectUploadRequest,
+        current_user: AuthenticatedUser,
+    ) -> DirectUploadResponse:
+        """Presign a direct-to-storage logo upload for a venue (owner only)."""
+        await _require_venue_owner(db, venue_id, current_user.id)
+        return await upload_service.presign_image(VENUE_UPLOAD_SUBFOLDER, request)
+
+    @staticmethod
+    async def confirm_logo(
+        db: AsyncSession,
+        venue_id: UUID,
+        request: UploadConfirmRequest,
+        current_user: AuthenticatedUser,
+    ) -> VenueResponse:
+        """Set a directly uploaded logo for a venue by its storage key (owner only)."""
+        venue = await _require_venue_owner(db, venue_id, current_user.id)
+
+        logo = await confirm_image_upload(VENUE_UPLOAD_SUBFOLDER, request.key)
 
         updated_venue = await VenueRepository.update_logo_url(
             db=db,
             venue=venue,
-            logo_url=logo_url,
+            logo_url=logo.url,
+            logo_variants=logo.variants,
         )
 
         return VenueResponse.model_validate(updated_venue)
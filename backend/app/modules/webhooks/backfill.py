@@ -0,0 +1,270 @@
+"""Bulk user backfill from an identity-provider export.
+
+Onboarding a campus creates thousands of Clerk users at once. Replaying
+each through the user.created webhook costs several queries and a Clerk
+call per user. This module ingests a Clerk export instead:
+
+- Users, organizations and signup venues are created in batches of
+  multi-row upserts (one transaction per batch)
+- Clerk role syncs are queued as soon as a batch commits and drained by a
+  bounded pool of concurrent tasks while the next batches load
+
+The result is the same as if every user.created webhook had been handled,
+so webhooks that arrive later for these users are no-ops.
+
+Export formats:
+- JSON: a list of Clerk user objects (``id``, ``email_addresses``,
+  ``unsafe_metadata``), optionally wrapped as ``{"data": [...]}``
+- CSV: columns ``id``, ``email`` (or ``primary_email_address``), ``role``
+  and optionally ``org_name``
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import UUID
+
+from app.core.constants.enums import UserRole
+from app.core.database import AsyncSessionLocal
+from app.core.exceptions import ExternalServiceError
+from app.modules.auth.utils import is_valid_student_email
+from app.modules.organizations.repository import OrganizationRepository
+from app.modules.users.repository import UserRepository
+from app.modules.venues.repository import VenueRepository
+from app.modules.webhooks.clerk_client import clerk_client
+from app.modules.webhooks.constants import ORG_NAME_METADATA_KEY, ROLE_METADATA_KEY
+from app.modules.webhooks.schemas import ClerkEmailAddress, ClerkUserData
+
+DEFAULT_BATCH_SIZE = 500
+# Keeps each batch's statements under asyncpg's 32,767 bind parameters; the
+# user upsert binds 7 per record (6 columns plus the email in its IN list)
+MAX_BATCH_SIZE = 4000
+DEFAULT_SYNC_CONCURRENCY = 8
+
+# CSV column names accepted for the email address
+CSV_EMAIL_COLUMNS = ("email", "primary_email_address", "email_address")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackfillReport:
+    """
+    Outcome and throughput of a backfill run.
+
+    Attributes:
+        rows: Records read from the export
+        skipped: Records rejected (missing email/role, invalid role, non-.edu
+            student) or repeating an earlier email
+        users_created: Users inserted (the rest already existed)
+        orgs_created: Organizations inserted
+        venues_created: Signup venues inserted
+        synced: Clerk role syncs that succeeded
+        sync_failed: Clerk user ids whose role sync failed (safe to re-run)
+        db_seconds: Time spent loading the database
+        elapsed_seconds: Total wall time, including draining Clerk syncs
+    """
+
+    rows: int = 0
+    skipped: int = 0
+    users_created: int = 0
+    orgs_created: int = 0
+    venues_created: int = 0
+    synced: int = 0
+    sync_failed: list[str] = field(default_factory=list)
+    db_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """End-to-end throughput over all records read."""
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def db_rows_per_second(self) -> float:
+        """Database load throughput, excluding the Clerk sync tail."""
+        return self.rows / self.db_seconds if self.db_seconds else 0.0
+
+
+@dataclass(frozen=True)
+class _Signup:
+    """A validated export record."""
+
+    clerk_id: str
+    email: str
+    role: UserRole
+    org_name: str | None
+
+
+def load_export(path: Path) -> list[ClerkUserData]:
+    """
+    Read a JSON or CSV user export (format chosen by file extension).
+
+    Args:
+        path: Export file
+
+    Returns:
+        Records in the webhook payload shape
+    """
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            return [_csv_record(row) for row in csv.DictReader(f)]
+
+    document = json.loads(path.read_text(encoding="utf-8"))
+    records = document["data"] if isinstance(document, dict) else document
+    return [ClerkUserData.model_validate(record) for record in records]
+
+
+def _csv_record(row: dict[str, str]) -> ClerkUserData:
+    """Map one CSV row onto the webhook payload shape."""
+    email = next((row[c] for c in CSV_EMAIL_COLUMNS if row.get(c)), None)
+    metadata = {
+        ROLE_METADATA_KEY: row.get("role", ""),
+        ORG_NAME_METADATA_KEY: row.get("org_name", ""),
+    }
+    return ClerkUserData(
+        id=row["id"],
+        email_addresses=[ClerkEmailAddress(email_address=email)] if email else [],
+        unsafe_metadata={k: v for k, v in metadata.items() if v},
+    )
+
+
+def _validate(record: ClerkUserData) -> _Signup | None:
+    """Apply the webhook's validation rules; None if the record can't be provisioned."""
+    email = record.primary_email
+    role_str = record.unsafe_metadata.get(ROLE_METADATA_KEY)
+    if not email or not role_str:
+        return None
+    try:
+        role = UserRole(role_str)
+    except ValueError:
+        return None
+    if role == UserRole.student_org and not is_valid_student_email(email):
+        return None
+    return _Signup(
+        clerk_id=record.id,
+        email=email,
+        role=role,
+        org_name=record.unsafe_metadata.get(ORG_NAME_METADATA_KEY) or None,
+    )
+
+
+def _batches(items: list[_Signup], size: int) -> Iterator[list[_Signup]]:
+    """Split items into lists of at most ``size``."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+async def backfill_users(
+    records: Iterable[ClerkUserData],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    sync_concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+    sync_clerk: bool = True,
+) -> BackfillReport:
+    """
+    Provision users (and their org or signup venue) from export records.
+
+    Args:
+        records: Export records in the webhook payload shape
+        batch_size: Records per database transaction (1 to MAX_BATCH_SIZE)
+        sync_concurrency: Maximum concurrent Clerk role syncs (at least 1)
+        sync_clerk: Whether to sync roles to Clerk public metadata
+
+    Returns:
+        Counts and throughput for the run
+
+    Raises:
+        ValueError: If batch_size or sync_concurrency is out of range
+    """
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        msg = f"batch_size must be between 1 and {MAX_BATCH_SIZE}, got {batch_size}"
+        raise ValueError(msg)
+    # With no drainers, waiting for the sync queue would never return
+    if sync_concurrency < 1:
+        msg = f"sync_concurrency must be at least 1, got {sync_concurrency}"
+        raise ValueError(msg)
+
+    report = BackfillReport()
+    started = time.perf_counter()
+
+    # Later duplicates of an email are ignored, like a redelivered webhook
+    signups: dict[str, _Signup] = {}
+    for record in records:
+        report.rows += 1
+        signup = _validate(record)
+        if signup is not None:
+            signups.setdefault(signup.email, signup)
+    report.skipped = report.rows - len(signups)
+
+    sync_queue: asyncio.Queue[_Signup] = asyncio.Queue()
+    syncers = [
+        asyncio.create_task(_drain_syncs(sync_queue, report))
+        for _ in range(sync_concurrency if sync_clerk else 0)
+    ]
+
+    for batch in _batches(list(signups.values()), batch_size):
+        await _load_batch(batch, report)
+        for signup in batch:
+            if sync_clerk:
+                sync_queue.put_nowait(signup)
+    report.db_seconds = time.perf_counter() - started
+
+    await sync_queue.join()
+    for syncer in syncers:
+        syncer.cancel()
+    await asyncio.gather(*syncers, return_exceptions=True)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+async def _load_batch(batch: list[_Signup], report: BackfillReport) -> None:
+    """Upsert one batch of users, orgs and venues in a single transaction."""
+    async with AsyncSessionLocal() as db:
+        users = await UserRepository.bulk_get_or_create(
+            db, [(signup.email, signup.role) for signup in batch]
+        )
+        report.users_created += sum(1 for user in users if user.created)
+
+        # The stored role wins: an existing user keeps what they signed up as
+        stored = {user.email: user for user in users}
+        orgs: list[tuple[UUID, str]] = []
+        venues: list[tuple[UUID, str]] = []
+        for signup in batch:
+            user = stored.get(signup.email)
+            if user is None or not signup.org_name:
+                continue
+            if user.role == UserRole.student_org:
+                orgs.append((user.id, signup.org_name))
+            elif user.role == UserRole.venue_admin:
+                venues.append((user.id, signup.org_name))
+
+        report.orgs_created += await OrganizationRepository.bulk_create(db, orgs)
+        report.venues_created += await VenueRepository.bulk_create_minimal(db, venues)
+        await db.commit()
+
+
+async def _drain_syncs(queue: asyncio.Queue[_Signup], report: BackfillReport) -> None:
+    """Sync queued roles to Clerk until cancelled."""
+    while True:
+        signup = await queue.get()
+        try:
+            await clerk_client.update_user_metadata(
+                signup.clerk_id,
+                {ROLE_METADATA_KEY: signup.role.value},
+            )
+            report.synced += 1
+        except ExternalServiceError:
+            report.sync_failed.append(signup.clerk_id)
+        except Exception:
+            # Anything else fails this sync too; ending the loop would leave
+            # the queue undrained and the import waiting forever
+            logger.warning("Clerk sync for %s failed", signup.clerk_id, exc_info=True)
+            report.sync_failed.append(signup.clerk_id)
+        finally:
+            queue.task_done()
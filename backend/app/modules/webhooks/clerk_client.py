@@ -0,0 +1,146 @@
+"""Clerk Backend API client.
+
+All Clerk API calls go through the shared pooled HTTP client (keep-alive,
+timeouts from the HTTP_* settings) and are guarded by:
+- a bounded retry with exponential backoff for transient failures
+  (network errors, timeouts, 429 and 5xx responses)
+- a circuit breaker, so during a Clerk outage calls fail immediately
+  instead of each one waiting out timeouts and retries
+
+Failures surface as ExternalServiceError; ``retryable`` is False when
+Clerk rejected the request itself (other 4xx responses).
+"""
+
+import asyncio
+from typing import Any
+
+import httpx
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.config import settings
+from app.core.exceptions import ExternalServiceError
+from app.core.http_client import get_http_client
+from app.modules.webhooks.constants import (
+    CLERK_RETRYABLE_STATUS_CODES,
+    CLERK_SERVICE_NAME,
+    WebhookError,
+)
+
+
+class ClerkClient:
+    """Thin, resilient wrapper over the Clerk Backend API endpoints we use."""
+
+    def __init__(
+        self,
+        base_url: str,
+        secret_key: str,
+        breaker: CircuitBreaker,
+        max_retries: int,
+        retry_backoff: float,
+    ) -> None:
+        """
+        Configure the client.
+
+        Args:
+            base_url: Clerk Backend API base URL (e.g. https://api.clerk.com/v1)
+            secret_key: Clerk secret key, sent as a bearer token
+            breaker: Circuit breaker shared by all Clerk calls in this process
+            max_retries: Extra attempts after a transient failure
+            retry_backoff: Delay before the first retry (doubles each retry)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.secret_key = secret_key
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    async def update_user_metadata(
+        self,
+        user_id: str,
+        public_metadata: dict[str, Any],
+    ) -> None:
+        """
+        Merge ``public_metadata`` into a Clerk user's public metadata.
+
+        Args:
+            user_id: Clerk user ID.
+            public_metadata: Keys to set.
+
+        Raises:
+            ExternalServiceError: If the update fails or Clerk is unavailable.
+        """
+        await self._request(
+            "PATCH",
+            f"/users/{user_id}/metadata",
+            json={"public_metadata": public_metadata},
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Send a request with retries, guarded by the circuit breaker."""
+        error: Exception | None = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError as e:
+                raise ExternalServiceError(
+                    CLERK_SERVICE_NAME,
+                    WebhookError.CLERK_UNAVAILABLE,
+                ) from e
+
+            try:
+                response = await get_http_client().request(
+                    method,
+                    f"{self.base_url}{path}",
+                    headers={"Authorization": f"Bearer {self.secret_key}"},
+                    json=json,
+                )
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                error = e
+                continue
+
+            if response.status_code in CLERK_RETRYABLE_STATUS_CODES:
+                self.breaker.record_failure()
+                error = httpx.HTTPStatusError(
+                    f"Clerk API returned {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+                continue
+
+            # Clerk answered, so it is healthy even if it rejected the request
+            self.breaker.record_success()
+            if response.is_error:
+                raise ExternalServiceError(
+                    CLERK_SERVICE_NAME,
+                    WebhookError.CLERK_REQUEST_REJECTED,
+                    retryable=False,
+                )
+            return response
+
+        raise ExternalServiceError(
+            CLERK_SERVICE_NAME,
+            WebhookError.CLERK_SYNC_FAILED,
+        ) from error
+
+
+# Process-wide client; its breaker is shared by every Clerk call in the process
+clerk_client = ClerkClient(
+    base_url=settings.CLERK_API_BASE,
+    secret_key=settings.CLERK_SECRET_KEY,
+    breaker=CircuitBreaker(
+        CLERK_SERVICE_NAME,
+        failure_threshold=settings.CLERK_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=settings.CLERK_BREAKER_RESET_SECONDS,
+    ),
+    max_retries=settings.CLERK_API_MAX_RETRIES,
+    retry_backoff=settings.CLERK_API_RETRY_BACKOFF_SECONDS,
+)
@@ -1,17 +1,31 @@
 """Webhook constants barrel exports."""
 
 from app.modules.webhooks.constants.clerk import (
-    CLERK_API_BASE,
+    CLERK_RETRYABLE_STATUS_CODES,
+    CLERK_SERVICE_NAME,
     EVENT_USER_CREATED,
     ORG_NAME_METADATA_KEY,
     ROLE_METADATA_KEY,
 )
 from app.modules.webhooks.constants.errors import WebhookError
+from app.modules.webhooks.constants.inbox import (
+    HANDLED_EVENT_TYPES,
+    LAST_ERROR_MAX_LENGTH,
+    SVIX_ID_HEADER,
+    WEBHOOK_LEASE_SECONDS,
+    WEBHOOK_RETRY_JITTER,
+)
 
 __all__ = [
     "WebhookError",
-    "CLERK_API_BASE",
+    "CLERK_RETRYABLE_STATUS_CODES",
+    "CLERK_SERVICE_NAME",
     "EVENT_USER_CREATED",
     "ORG_NAME_METADATA_KEY",
     "ROLE_METADATA_KEY",
+    "HANDLED_EVENT_TYPES",
+    "LAST_ERROR_MAX_LENGTH",
+    "SVIX_ID_HEADER",
+    "WEBHOOK_LEASE_SECONDS",
+    "WEBHOOK_RETRY_JITTER",
 ]
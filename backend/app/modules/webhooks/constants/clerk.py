@@ -3,8 +3,11 @@
 Centralized constants for Clerk integration to prevent magic strings.
 """
 
-# Clerk API configuration
-CLERK_API_BASE = "https://api.clerk.com/v1"
+# Clerk API configuration (base URL is the CLERK_API_BASE setting)
+CLERK_SERVICE_NAME = "Clerk"
+
+# Responses worth retrying: rate limited, or a server-side failure
+CLERK_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
 # Webhook event types
 EVENT_USER_CREATED = "user.created"
@@ -12,11 +12,18 @@ class WebhookError(str, Enum):
 
     # Verification errors
     INVALID_SIGNATURE = "Invalid webhook signature."
+    MISSING_DELIVERY_ID = "Webhook delivery id (svix-id header) is missing."
 
     # Processing errors
     MISSING_EMAIL = "User email not found in webhook payload."
     MISSING_ROLE = "User role not found in webhook metadata."
     INVALID_ROLE = "Invalid user role in webhook metadata."
+    ABANDONED = (
+        "Dead-lettered at claim time: every attempt was claimed but none "
+        "finished (worker crash or lease overrun)."
+    )
 
     # Clerk API errors
     CLERK_SYNC_FAILED = "Failed to sync metadata to Clerk."
+    CLERK_UNAVAILABLE = "Clerk API is temporarily unavailable."
+    CLERK_REQUEST_REJECTED = "Clerk API rejected the request."
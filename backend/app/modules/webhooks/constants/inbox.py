@@ -0,0 +1,19 @@
+"""Webhook inbox and worker constants."""
+
+from app.modules.webhooks.constants.clerk import EVENT_USER_CREATED
+
+# Svix delivery id header; stable across redeliveries of the same event
+SVIX_ID_HEADER = "svix-id"
+
+# Only these event types are stored; anything else is acknowledged and dropped
+HANDLED_EVENT_TYPES = frozenset({EVENT_USER_CREATED})
+
+# How long a claimed event stays invisible to other workers before it is
+# considered abandoned and reclaimed
+WEBHOOK_LEASE_SECONDS = 300
+
+# Fraction of each retry delay that is randomized so failures don't retry in lockstep
+WEBHOOK_RETRY_JITTER = 0.2
+
+# Truncate stored error text so a huge traceback can't bloat the row
+LAST_ERROR_MAX_LENGTH = 2000
@@ -0,0 +1,109 @@
+"""Webhook inbox model for durable, asynchronous event processing.
+
+Verified webhook deliveries are stored here and acknowledged immediately;
+the webhook worker then processes them in the background with retries.
+
+Database constraints:
+- One row per delivery id (unique svix_id), so provider redeliveries are
+  stored once
+- Attempts are never negative
+
+Claiming:
+- Workers claim due rows with FOR UPDATE SKIP LOCKED, so any number of
+  worker processes can share the table without double-processing
+- next_attempt_at doubles as the lease expiry while a row is processing:
+  a row whose worker died becomes due again once it passes
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import CheckConstraint, DateTime, Enum, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.constants.enums import WebhookEventStatus
+from app.core.database import BaseModel, TimestampMixin, UUIDMixin
+
+# Constants for column constraints
+SVIX_ID_MAX_LENGTH = 255
+EVENT_TYPE_MAX_LENGTH = 100
+
+
+class WebhookEvent(BaseModel, UUIDMixin, TimestampMixin):
+    """
+    A verified webhook delivery awaiting (or done with) processing.
+
+    Attributes:
+        id: UUID primary key
+        svix_id: Provider delivery id (svix-id header), the de-duplication key
+        event_type: Event type (e.g. "user.created")
+        payload: Verified JSON payload
+        status: Processing state (see WebhookEventStatus)
+        attempts: Number of times a worker has claimed the event
+        next_attempt_at: When the event is next due (lease expiry while processing)
+        last_error: Error from the most recent failed attempt
+        processed_at: When the event succeeded or was dead-lettered
+        created_at: When the delivery was received (UTC)
+        updated_at: Last state change (UTC)
+    """
+
+    __tablename__ = "webhook_events"
+
+    svix_id: Mapped[str] = mapped_column(
+        String(SVIX_ID_MAX_LENGTH),
+        nullable=False,
+        unique=True,  # De-duplicates redeliveries; ON CONFLICT target
+    )
+
+    event_type: Mapped[str] = mapped_column(
+        String(EVENT_TYPE_MAX_LENGTH),
+        nullable=False,
+    )
+
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    status: Mapped[WebhookEventStatus] = mapped_column(
+        Enum(WebhookEventStatus, name="webhook_event_status", native_enum=True),
+        nullable=False,
+        default=WebhookEventStatus.pending,
+        server_default=WebhookEventStatus.pending.value,
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    processed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Table-level constraints and indexes
+    __table_args__ = (
+        CheckConstraint("attempts >= 0", name="webhook_event_attempts_check"),
+        # Workers scan only unfinished events, oldest due first
+        Index(
+            "ix_webhook_events_due",
+            "next_attempt_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"<WebhookEvent(id={self.id}, svix_id={self.svix_id}, "
+            f"type={self.event_type}, status={self.status}, attempts={self.attempts})>"
+        )
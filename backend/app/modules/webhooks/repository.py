@@ -0,0 +1,186 @@
+"""Webhook inbox data access layer (Repository pattern)."""
+
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants.enums import WebhookEventStatus
+from app.modules.webhooks.constants import WebhookError
+from app.modules.webhooks.models import WebhookEvent
+
+# Statuses a worker may still pick up
+UNFINISHED_STATUSES = (WebhookEventStatus.pending, WebhookEventStatus.processing)
+
+
+class WebhookEventRepository:
+    """Repository for webhook inbox operations."""
+
+    @staticmethod
+    async def enqueue(
+        db: AsyncSession,
+        svix_id: str,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> bool:
+        """
+        Store a verified delivery unless its svix_id was already stored.
+
+        Args:
+            db: Database session.
+            svix_id: Provider delivery id.
+            event_type: Event type.
+            payload: Verified JSON payload.
+
+        Returns:
+            True if the event was stored, False if it was a redelivery.
+        """
+        stmt = (
+            pg_insert(WebhookEvent)
+            .values(svix_id=svix_id, event_type=event_type, payload=payload)
+            .on_conflict_do_nothing(index_elements=[WebhookEvent.svix_id])
+            .returning(WebhookEvent.id)
+        )
+        result = await db.execute(stmt)
+        stored = result.scalar_one_or_none() is not None
+        await db.commit()
+        return stored
+
+    @staticmethod
+    async def claim_due(
+        db: AsyncSession,
+        limit: int,
+        lease_seconds: float,
+        max_attempts: int,
+    ) -> list[Row[Any]]:
+        """
+        Claim up to ``limit`` due events for processing.
+
+        Due rows are locked with FOR UPDATE SKIP LOCKED, so concurrent
+        workers claim disjoint batches, then marked processing with their
+        attempt counted and next_attempt_at pushed out by the lease.
+
+        A handler failure is dead-lettered by ``mark_failed``, but an attempt
+        that never finishes (the worker crashed or overran its lease) records
+        nothing, and its event comes back due when the lease expires. So due
+        events that have already used ``max_attempts`` claims are
+        dead-lettered here, in the same transaction, instead of being claimed
+        again. Without this, one poison event would keep crashing workers.
+
+        Args:
+            db: Database session.
+            limit: Maximum number of events to claim.
+            lease_seconds: How long the claim lasts before the event is reclaimable.
+            max_attempts: Claims after which an unfinished event is dead-lettered.
+
+        Returns:
+            Claimed rows of (id, svix_id, event_type, payload, attempts).
+        """
+        exhausted = (
+            select(WebhookEvent.id)
+            .where(
+                WebhookEvent.status.in_(UNFINISHED_STATUSES),
+                WebhookEvent.next_attempt_at <= func.now(),
+                WebhookEvent.attempts >= max_attempts,
+            )
+            .with_for_update(skip_locked=True)
+        )
+        await db.execute(
+            update(WebhookEvent)
+            .where(WebhookEvent.id.in_(exhausted.scalar_subquery()))
+            .values(
+                status=WebhookEventStatus.dead,
+                processed_at=func.now(),
+                # Keep the last recorded handler error, if any, after the reason
+                last_error=func.concat_ws(
+                    " Last recorded error: ", WebhookError.ABANDONED.value, WebhookEvent.last_error
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        due = (
+            select(WebhookEvent.id)
+            .where(
+                WebhookEvent.status.in_(UNFINISHED_STATUSES),
+                WebhookEvent.next_attempt_at <= func.now(),
+                WebhookEvent.attempts < max_attempts,
+            )
+            .order_by(WebhookEvent.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(WebhookEvent)
+            .where(WebhookEvent.id.in_(due.scalar_subquery()))
+            .values(
+                status=WebhookEventStatus.processing,
+                attempts=WebhookEvent.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=lease_seconds),
+            )
+            .returning(
+                WebhookEvent.id,
+                WebhookEvent.svix_id,
+                WebhookEvent.event_type,
+                WebhookEvent.payload,
+                WebhookEvent.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        rows = list(result.all())
+        await db.commit()
+        return rows
+
+    @staticmethod
+    async def mark_succeeded(db: AsyncSession, event_id: UUID) -> None:
+        """Record that an event was handled."""
+        await db.execute(
+            update(WebhookEvent)
+            .where(WebhookEvent.id == event_id)
+            .values(
+                status=WebhookEventStatus.succeeded,
+                last_error=None,
+                processed_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def mark_failed(
+        db: AsyncSession,
+        event_id: UUID,
+        error: str,
+        retry_in_seconds: float | None,
+    ) -> None:
+        """
+        Record a failed attempt, scheduling a retry or dead-lettering the event.
+
+        Args:
+            db: Database session.
+            event_id: Event that failed.
+            error: Error description to keep for inspection.
+            retry_in_seconds: Delay before the next attempt, or None to dead-letter.
+        """
+        if retry_in_seconds is None:
+            values = {
+                "status": WebhookEventStatus.dead,
+                "processed_at": func.now(),
+            }
+        else:
+            values = {
+                "status": WebhookEventStatus.pending,
+                "next_attempt_at": func.now() + timedelta(seconds=retry_in_seconds),
+            }
+
+        await db.execute(
+            update(WebhookEvent)
+            .where(WebhookEvent.id == event_id)
+            .values(last_error=error, **values)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
@@ -11,9 +11,9 @@ from svix.webhooks import Webhook, WebhookVerificationError
 
 from app.core.config import settings
 from app.core.database.session import get_db
-from app.modules.webhooks.constants import EVENT_USER_CREATED, WebhookError
-from app.modules.webhooks.schemas import ClerkWebhookEvent
+from app.modules.webhooks.constants import SVIX_ID_HEADER, WebhookError
 from app.modules.webhooks.services import webhook_service
+from app.modules.webhooks.worker import webhook_worker
 
 router = APIRouter(prefix="/clerk", tags=["Webhooks"])
 
@@ -26,7 +26,9 @@ async def handle_clerk_webhook(
     """
     Handle Clerk webhook events.
 
-    Listens for user.created events and delegates to service layer.
+    Verifies the signature, stores the event in the inbox and returns 204
+    straight away; the webhook worker does the processing. Redeliveries of
+    the same svix-id are stored once.
     """
     # Verify webhook signature
     payload = await request.body()
@@ -41,9 +43,11 @@ async def handle_clerk_webhook(
             detail=WebhookError.INVALID_SIGNATURE,
         ) from e
 
-    # Parse and validate payload
-    event = ClerkWebhookEvent.model_validate(verified_payload)
-
-    # Delegate to service layer (all business logic there)
-    if event.type == EVENT_USER_CREATED:
-        await webhook_service.handle_user_created(db, event.data)
+    # Store for background processing (all business logic in the service layer)
+    stored = await webhook_service.enqueue_event(
+        db,
+        request.headers.get(SVIX_ID_HEADER),
+        verified_payload,
+    )
+    if stored:
+        webhook_worker.notify()
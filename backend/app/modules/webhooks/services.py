@@ -2,36 +2,98 @@
 
 All business logic for webhook handling. Services handle external API calls
 and database operations through the auth service layer.
+
+Deliveries are split in two: ``enqueue_event`` stores a verified delivery
+in the inbox (the request path), and ``process_event`` runs the handler for
+a stored event (called by the webhook worker, with retries).
 """
 
-import httpx
+from typing import Any
+
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
 from app.core.constants.enums import UserRole
-from app.modules.auth.schemas import UserCreate
+from app.modules.auth.schemas import AuthenticatedUser, UserCreate
 from app.modules.auth.services import auth_service
 from app.modules.organizations.repository import OrganizationRepository
-from app.modules.users.models import User
 from app.modules.venues.repository import VenueRepository
+from app.modules.webhooks.clerk_client import clerk_client
 from app.modules.webhooks.constants import (
-    CLERK_API_BASE,
+    EVENT_USER_CREATED,
+    HANDLED_EVENT_TYPES,
     ORG_NAME_METADATA_KEY,
     ROLE_METADATA_KEY,
     WebhookError,
 )
-from app.modules.webhooks.schemas import ClerkUserData
+from app.modules.webhooks.repository import WebhookEventRepository
+from app.modules.webhooks.schemas import ClerkUserData, ClerkWebhookEvent
 
 
 class WebhookService:
     """Service layer for webhook business logic."""
 
+    @staticmethod
+    async def enqueue_event(
+        db: AsyncSession,
+        svix_id: str | None,
+        payload: dict[str, Any],
+    ) -> bool:
+        """
+        Store a verified delivery in the inbox for background processing.
+
+        Event types without a handler are acknowledged without being stored.
+
+        Args:
+            db: Database session.
+            svix_id: Delivery id from the svix-id header.
+            payload: Verified JSON payload.
+
+        Returns:
+            True if a new event was stored (the worker should be woken).
+
+        Raises:
+            HTTPException: If the delivery id is missing.
+        """
+        if not svix_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=WebhookError.MISSING_DELIVERY_ID,
+            )
+
+        event_type = payload.get("type")
+        if event_type not in HANDLED_EVENT_TYPES:
+            return False
+
+        return await WebhookEventRepository.enqueue(db, svix_id, event_type, payload)
+
+    @staticmethod
+    async def process_event(
+        db: AsyncSession,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> None:
+        """
+        Run the handler for a stored event.
+
+        Handlers are idempotent, so an event may safely run more than once
+        (retries, reclaimed leases). A handler commits its DB work before
+        calling external services; the worker commits anything left after.
+
+        Args:
+            db: Database session.
+            event_type: Stored event type.
+            payload: Stored verified payload.
+        """
+        event = ClerkWebhookEvent.model_validate(payload)
+        if event_type == EVENT_USER_CREATED:
+            await WebhookService.handle_user_created(db, event.data)
+
     @staticmethod
     async def handle_user_created(
         db: AsyncSession,
         user_data: ClerkUserData,
-    ) -> User:
+    ) -> AuthenticatedUser:
         """
         Handle user.created webhook event.
 
@@ -41,15 +103,19 @@ class WebhookService:
         3. Create organization or venue based on role
         4. Sync role to Clerk publicMetadata
 
-        Order matters: DB operations first (reversible via rollback),
-        then Clerk API call (external, harder to compensate).
+        Order matters: DB operations first (reversible via rollback), then
+        they are committed, then the Clerk API call (external, harder to
+        compensate). Committing first means a slow or retrying Clerk call
+        never holds the transaction, its row and advisory locks, or its
+        pooled connection. If the call fails, the event is retried and the
+        idempotent DB steps find the rows already there.
 
         Args:
             db: Database session.
             user_data: User data from Clerk webhook.
 
         Returns:
-            Created User.
+            Identity of the created (or existing) user.
 
         Raises:
             HTTPException: If required data is missing or invalid.
@@ -92,7 +158,8 @@ class WebhookService:
         if org_name:
             await WebhookService._create_org_or_venue(db, user, role, org_name)
 
-        # 4. Sync role to Clerk publicMetadata (external call last)
+        # 4. Commit, then sync role to Clerk publicMetadata (external call last)
+        await db.commit()
         await WebhookService._sync_role_to_clerk(user_data.id, role_str)
 
         return user
@@ -109,52 +176,39 @@ class WebhookService:
             role: Role value to set in publicMetadata.
 
         Raises:
-            HTTPException: If Clerk API call fails.
+            ExternalServiceError: If the Clerk API call fails or Clerk is unavailable.
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{CLERK_API_BASE}/users/{user_id}/metadata",
-                    headers={
-                        "Authorization": f"Bearer {settings.CLERK_SECRET_KEY}",
-                        "Content-Type": "application/json",
-                    },
-                    json={"public_metadata": {ROLE_METADATA_KEY: role}},
-                )
-                response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=WebhookError.CLERK_SYNC_FAILED,
-            ) from e
+        await clerk_client.update_user_metadata(user_id, {ROLE_METADATA_KEY: role})
 
     @staticmethod
     async def _create_org_or_venue(
         db: AsyncSession,
-        user: User,
+        user: AuthenticatedUser,
         role: UserRole,
         name: str,
     ) -> None:
         """
         Create organization or venue for user based on their role.
 
-        Idempotent: skips creation if entity already exists.
+        Idempotent: the identity already says whether the user owns one, and
+        the repository inserts are conflict-safe, so redelivered or
+        concurrent webhooks create at most one.
 
         Args:
             db: Database session.
-            user: User who owns the org/venue.
+            user: AuthenticatedUser who owns the org/venue.
             role: User's role.
             name: Organization or venue name.
         """
-        if role == UserRole.student_org:
-            existing_org = await OrganizationRepository.get_by_owner_id(db, user.id)
-            if not existing_org:
-                await OrganizationRepository.create(db, name, user.id)
-
-        elif role == UserRole.venue_admin:
-            existing_venue = await VenueRepository.get_by_owner_id(db, user.id)
-            if not existing_venue:
-                await VenueRepository.create_minimal(db, name, user.id)
+        created = None
+        if role == UserRole.student_org and user.organization_id is None:
+            created = await OrganizationRepository.create(db, name, user.id)
+
+        elif role == UserRole.venue_admin and not user.venue_ids:
+            created = await VenueRepository.create_minimal(db, name, user.id)
+
+        if created is not None:
+            auth_service.invalidate_user(user.email)
 
 
 # Singleton instance
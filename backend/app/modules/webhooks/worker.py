@@ -0,0 +1,201 @@
+"""Background worker that drains the webhook inbox.
+
+Each API process runs one worker (started by the application lifespan).
+The worker claims due events with SKIP LOCKED, so workers in different
+processes never process the same event at the same time, and runs up to
+``concurrency`` handlers at once, each in its own session and transaction.
+
+Failure handling:
+- Permanent failures (invalid payload, 4xx-style handler errors, requests
+  an external service rejected) are dead-lettered immediately
+- Anything else is retried with exponential backoff plus jitter until
+  ``max_attempts`` is reached, then dead-lettered
+- If a worker dies mid-event, the event's lease expires and another
+  worker reclaims it; once its claims reach ``max_attempts`` it is
+  dead-lettered instead, so a poison event can't crash workers forever
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+from typing import Any
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import Row
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.exceptions import ExternalServiceError
+from app.modules.webhooks.constants import (
+    LAST_ERROR_MAX_LENGTH,
+    WEBHOOK_LEASE_SECONDS,
+    WEBHOOK_RETRY_JITTER,
+)
+from app.modules.webhooks.repository import WebhookEventRepository
+from app.modules.webhooks.services import webhook_service
+
+logger = logging.getLogger(__name__)
+
+# Handler errors with a status below this are the event's fault; retrying won't help
+SERVER_ERROR_STATUS = 500
+
+
+class WebhookWorker:
+    """
+    Concurrent, poll-and-notify consumer of the webhook inbox.
+
+    Usage:
+        worker = WebhookWorker(concurrency=4, poll_interval=5.0)
+        await worker.start()
+        worker.notify()                 # after storing a new event
+        await worker.stop()
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        poll_interval: float,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+    ) -> None:
+        """
+        Configure the worker (nothing runs until ``start``).
+
+        Args:
+            concurrency: Maximum events processed at once by this process
+            poll_interval: Seconds between polls when not notified
+            max_attempts: Attempts before an event is dead-lettered
+            retry_base_seconds: Delay before the first retry (doubles each attempt)
+            retry_max_seconds: Upper bound on the retry delay
+        """
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._wakeup = asyncio.Event()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._runner: asyncio.Task[None] | None = None
+
+    def notify(self) -> None:
+        """Wake the worker to claim new events now instead of at the next poll."""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the claim loop."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop claiming and let in-flight events finish."""
+        if self._runner is not None:
+            self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+            self._runner = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next attempt: base * 2^(attempts-1), capped, with jitter."""
+        delay = min(self.retry_base_seconds * 2 ** (attempts - 1), self.retry_max_seconds)
+        jitter = random.uniform(-WEBHOOK_RETRY_JITTER, WEBHOOK_RETRY_JITTER)  # noqa: S311
+        return delay * (1 + jitter)
+
+    async def _run(self) -> None:
+        """Claim due events into free slots, then sleep until notified or polled."""
+        while True:
+            self._wakeup.clear()
+            free_slots = self.concurrency - len(self._tasks)
+            if free_slots > 0:
+                for event in await self._claim(free_slots):
+                    task = asyncio.create_task(self._process(event))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._on_done)
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        """Free the task's slot and wake the loop to refill it."""
+        self._tasks.discard(task)
+        self._wakeup.set()
+
+    async def _claim(self, limit: int) -> list[Row[Any]]:
+        """Claim due events, treating database errors as "nothing due"."""
+        try:
+            async with AsyncSessionLocal() as db:
+                return await WebhookEventRepository.claim_due(
+                    db, limit, WEBHOOK_LEASE_SECONDS, self.max_attempts
+                )
+        except (SQLAlchemyError, OSError):
+            logger.warning("Claiming webhook events failed", exc_info=True)
+            return []
+
+    async def _process(self, event: Row[Any]) -> None:
+        """Run one event's handler and record the outcome."""
+        try:
+            async with AsyncSessionLocal() as db:
+                await webhook_service.process_event(db, event.event_type, event.payload)
+                await db.commit()
+        except Exception as e:  # Any handler failure is recorded, never raised
+            await self._record_failure(event, e)
+            return
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await WebhookEventRepository.mark_succeeded(db, event.id)
+        except (SQLAlchemyError, OSError):
+            # The lease will expire and the (idempotent) event will run again
+            logger.warning("Recording webhook event %s as done failed", event.id, exc_info=True)
+
+    async def _record_failure(self, event: Row[Any], error: Exception) -> None:
+        """Schedule a retry, or dead-letter the event if it can't succeed."""
+        retry_in = None
+        if _is_retryable(error) and event.attempts < self.max_attempts:
+            retry_in = self.retry_delay(event.attempts)
+
+        logger.warning(
+            "Webhook event %s (%s, svix-id %s) failed on attempt %d; %s",
+            event.id,
+            event.event_type,
+            event.svix_id,
+            event.attempts,
+            "dead-lettered" if retry_in is None else f"retrying in {retry_in:.0f}s",
+            exc_info=error,
+        )
+        try:
+            async with AsyncSessionLocal() as db:
+                await WebhookEventRepository.mark_failed(
+                    db,
+                    event.id,
+                    f"{type(error).__name__}: {error}"[:LAST_ERROR_MAX_LENGTH],
+                    retry_in,
+                )
+        except (SQLAlchemyError, OSError):
+            logger.warning("Recording webhook event %s failure failed", event.id, exc_info=True)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a handler error might succeed on a later attempt."""
+    if isinstance(error, ValidationError):
+        return False
+    if isinstance(error, HTTPException):
+        return error.status_code >= SERVER_ERROR_STATUS
+    if isinstance(error, ExternalServiceError):
+        return error.retryable
+    return True
+
+
+# Process-wide worker, started and stopped by the application lifespan
+webhook_worker = WebhookWorker(
+    concurrency=settings.WEBHOOK_WORKER_CONCURRENCY,
+    poll_interval=settings.WEBHOOK_WORKER_POLL_SECONDS,
+    max_attempts=settings.WEBHOOK_MAX_ATTEMPTS,
+    retry_base_seconds=settings.WEBHOOK_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.WEBHOOK_RETRY_MAX_SECONDS,
+)
@@ -0,0 +1,123 @@
+"""Benchmark: verified-JWT claims cache in the auth dependency.
+
+Measures requests/second against an authenticated no-op route that depends
+only on ``get_token_claims`` (no database), with the claims cache disabled
+and enabled. A throwaway RSA key pair is generated so the full RS256
+verification path is exercised.
+
+Usage (from backend/):
+    poetry run python benchmarks/auth_claims_cache.py [--requests 5000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Annotated, Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+RSA_KEY_SIZE = 2048
+RSA_PUBLIC_EXPONENT = 65537
+TOKEN_TTL_SECONDS = 3600
+
+
+def _generate_key_pair() -> tuple[str, str]:
+    """Return a (private, public) PEM pair for signing test tokens."""
+    key = rsa.generate_private_key(public_exponent=RSA_PUBLIC_EXPONENT, key_size=RSA_KEY_SIZE)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+async def _run(app: Any, token: str, total: int, concurrency: int) -> float:
+    """Send ``total`` authenticated requests and return requests/second."""
+    import httpx
+
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=app)
+    remaining = iter(range(total))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            for _ in remaining:
+                response = await client.get("/noop", headers=headers)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+def main() -> int:
+    """Run the benchmark with the cache off, then on, and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    private_pem, public_pem = _generate_key_pair()
+    # Must be set before the auth dependencies module reads it at import time
+    os.environ["CLERK_PEM_PUBLIC_KEY"] = public_pem
+
+    from fastapi import Depends, FastAPI
+    from jose import jwt
+
+    from app.core.cache import ExpiringLRUCache
+    from app.modules.auth import dependencies
+
+    app = FastAPI()
+
+    @app.get("/noop")
+    async def noop(
+        _claims: Annotated[dict[str, Any], Depends(dependencies.get_token_claims)],
+    ) -> dict[str, bool]:
+        return {"ok": True}
+
+    token = jwt.encode(
+        {
+            "sub": "user_bench",
+            "email": "bench@example.edu",
+            "exp": int(time.time()) + TOKEN_TTL_SECONDS,
+        },
+        private_pem,
+        algorithm="RS256",
+    )
+
+    enabled_cache = dependencies.claims_cache
+
+    dependencies.claims_cache = ExpiringLRUCache(max_entries=0)
+    uncached_rps = asyncio.run(_run(app, token, args.requests, args.concurrency))
+
+    dependencies.claims_cache = enabled_cache
+    cached_rps = asyncio.run(_run(app, token, args.requests, args.concurrency))
+    stats = enabled_cache.stats()
+
+    print(f"requests={args.requests} concurrency={args.concurrency}")
+    print(f"  without cache: {uncached_rps:10.1f} req/s")
+    print(f"  with cache:    {cached_rps:10.1f} req/s  ({cached_rps / uncached_rps:.1f}x)")
+    print(f"  cache hits={stats.hits} misses={stats.misses} hit_ratio={stats.hit_ratio:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
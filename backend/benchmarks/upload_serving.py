@@ -0,0 +1,148 @@
+"""Benchmark: concurrent image fetches from the /uploads mount.
+
+Serves a directory of generated images through Starlette's stock
+``StaticFiles`` and through ``ImmutableStaticFiles`` and reports
+requests/second for cold fetches (full bodies) and for revalidations
+(``If-None-Match`` answered with 304), plus a ranged fetch sanity check.
+Requests go through httpx's ASGI transport, so the numbers measure the
+application's serving path rather than the network or the ASGI server.
+
+Usage (from backend/):
+    poetry run python benchmarks/upload_serving.py [--files 200] [--size 65536] \
+        [--requests 5000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+HTTP_OK = 200
+HTTP_PARTIAL_CONTENT = 206
+HTTP_NOT_MODIFIED = 304
+RANGE_PROBE_BYTES = 1024
+
+
+def _write_images(directory: Path, count: int, size: int) -> list[str]:
+    """Write ``count`` random files named by content hash; return their URL paths."""
+    paths = []
+    for _ in range(count):
+        data = os.urandom(size)
+        name = f"{hashlib.sha256(data).hexdigest()}.webp"
+        (directory / name).write_bytes(data)
+        paths.append(f"/uploads/{name}")
+    return paths
+
+
+async def _run(
+    app: Any,
+    paths: list[str],
+    total: int,
+    concurrency: int,
+    *,
+    revalidate: bool,
+) -> float:
+    """Fetch ``total`` images round-robin and return requests/second."""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    remaining = iter(range(total))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        etags = {}
+        if revalidate:
+            for path in paths:
+                etags[path] = (await client.get(path)).headers["etag"]
+        expected = HTTP_NOT_MODIFIED if revalidate else HTTP_OK
+
+        async def worker() -> None:
+            for i in remaining:
+                path = paths[i % len(paths)]
+                headers = {"If-None-Match": etags[path]} if revalidate else {}
+                response = await client.get(path, headers=headers)
+                if response.status_code != expected:
+                    msg = f"{path}: expected {expected}, got {response.status_code}"
+                    raise RuntimeError(msg)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+async def _check_range(app: Any, path: str, size: int) -> None:
+    """Fetch the last bytes of an image with a suffix Range and verify the 206."""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(path, headers={"Range": f"bytes=-{RANGE_PROBE_BYTES}"})
+    expected_range = f"bytes {size - RANGE_PROBE_BYTES}-{size - 1}/{size}"
+    if (
+        response.status_code != HTTP_PARTIAL_CONTENT
+        or response.headers.get("content-range") != expected_range
+        or len(response.content) != RANGE_PROBE_BYTES
+    ):
+        msg = f"Range check failed: {response.status_code} {response.headers}"
+        raise RuntimeError(msg)
+
+
+def main() -> int:
+    """Benchmark both static file apps and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--size", type=int, default=64 * 1024)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    from starlette.staticfiles import StaticFiles
+
+    from app.core.static_files import ImmutableStaticFiles
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        paths = _write_images(directory, args.files, args.size)
+        apps = {
+            "StaticFiles": Starlette(
+                routes=[Mount("/uploads", StaticFiles(directory=directory))],
+            ),
+            "ImmutableStaticFiles": Starlette(
+                routes=[Mount("/uploads", ImmutableStaticFiles(directory=directory))],
+            ),
+        }
+
+        asyncio.run(_check_range(apps["ImmutableStaticFiles"], paths[0], args.size))
+
+        print(
+            f"files={args.files} size={args.size}B requests={args.requests} "
+            f"concurrency={args.concurrency}"
+        )
+        results = {}
+        for name, app in apps.items():
+            full = asyncio.run(_run(app, paths, args.requests, args.concurrency, revalidate=False))
+            cached = asyncio.run(_run(app, paths, args.requests, args.concurrency, revalidate=True))
+            results[name] = (full, cached)
+            print(f"  {name:<21} full: {full:9.1f} req/s   304: {cached:9.1f} req/s")
+
+        base_full, base_cached = results["StaticFiles"]
+        full, cached = results["ImmutableStaticFiles"]
+        print(
+            f"  {'speedup':<21} full: {full / base_full:8.1f}x       "
+            f"304: {cached / base_cached:8.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
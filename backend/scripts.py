@@ -5,9 +5,18 @@ Usage via Poetry:
     poetry run lint     - Run ruff linter
     poetry run format   - Format code with black
     poetry run typecheck - Run mypy type checker
+    poetry run rebuild-ratings - Recompute venue rating aggregates
+    poetry run import-users <export.json|export.csv> - Bulk-provision users from a Clerk export
+    poetry run gc-uploads - Delete uploaded files nothing references any more
+    poetry run check-pooler - Exercise the database layer through a transaction-mode pooler
+    poetry run clerk-stub - Start the local Clerk stand-in (JWKS + Backend API) server
+    poetry run s3-stub - Start the local S3-compatible storage stand-in server
 """
 
+import argparse
+import asyncio
 import sys
+from pathlib import Path
 from subprocess import run
 
 
@@ -107,6 +116,216 @@ def dev() -> int:
     return result.returncode
 
 
+def clerk_stub() -> int:
+    """Start the local Clerk stand-in server (development only)."""
+    print("\n🔑 Starting Clerk stand-in server...")
+    print("    JWKS: http://127.0.0.1:8090/.well-known/jwks.json")
+    print("    API:  http://127.0.0.1:8090/v1")
+    print("\n")
+    result = run(
+        ["poetry", "run", "uvicorn", "stubs.clerk:app", "--port", "8090"],  # noqa: S603, S607
+        check=False,
+    )
+    return result.returncode
+
+
+def s3_stub() -> int:
+    """Start the local S3-compatible storage stand-in server (development only)."""
+    print("\n🪣 Starting S3 stand-in server...")
+    print("    Endpoint: http://127.0.0.1:9000 (path-style, any bucket)")
+    print("    Keys:     stub-access-key / stub-secret-key")
+    print("\n")
+    result = run(
+        ["poetry", "run", "uvicorn", "stubs.s3:app", "--port", "9000"],  # noqa: S603, S607
+        check=False,
+    )
+    return result.returncode
+
+
+def rebuild_ratings() -> int:
+    """Recompute denormalized venue rating aggregates from the ratings table."""
+    from app.core.database import AsyncSessionLocal, engine
+    from app.modules.ratings.repository import RatingRepository
+
+    async def _rebuild() -> int:
+        async with AsyncSessionLocal() as session:
+            rated = await RatingRepository.rebuild_venue_aggregates(session)
+            await session.commit()
+        await engine.dispose()
+        return rated
+
+    print("\n⭐ Rebuilding venue rating aggregates...")
+    rated = asyncio.run(_rebuild())
+    print(f"    ✅ Rebuilt aggregates ({rated} rated venues)\n")
+    return 0
+
+
+def import_users() -> int:
+    """Bulk-provision users, orgs and venues from a Clerk JSON/CSV export."""
+    from app.core.database import engine
+    from app.core.http_client import close_http_client
+    from app.modules.webhooks.backfill import (
+        DEFAULT_BATCH_SIZE,
+        DEFAULT_SYNC_CONCURRENCY,
+        MAX_BATCH_SIZE,
+        BackfillReport,
+        backfill_users,
+        load_export,
+    )
+
+    def _batch_size(value: str) -> int:
+        size = int(value)
+        if not 1 <= size <= MAX_BATCH_SIZE:
+            msg = f"must be between 1 and {MAX_BATCH_SIZE}"
+            raise argparse.ArgumentTypeError(msg)
+        return size
+
+    def _sync_concurrency(value: str) -> int:
+        concurrency = int(value)
+        if concurrency < 1:
+            msg = "must be at least 1"
+            raise argparse.ArgumentTypeError(msg)
+        return concurrency
+
+    parser = argparse.ArgumentParser(prog="import-users", description=import_users.__doc__)
+    parser.add_argument("export", type=Path, help="Clerk user export (.json or .csv)")
+    parser.add_argument(
+        "--batch-size",
+        type=_batch_size,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Records per transaction (max {MAX_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--sync-concurrency",
+        type=_sync_concurrency,
+        default=DEFAULT_SYNC_CONCURRENCY,
+    )
+    parser.add_argument(
+        "--no-clerk-sync",
+        action="store_true",
+        help="Skip syncing roles to Clerk public metadata",
+    )
+    # "python scripts.py import_users ..." passes the command name first
+    args = parser.parse_args(sys.argv[2:] if __name__ == "__main__" else sys.argv[1:])
+
+    async def _import() -> BackfillReport:
+        try:
+            return await backfill_users(
+                load_export(args.export),
+                batch_size=args.batch_size,
+                sync_concurrency=args.sync_concurrency,
+                sync_clerk=not args.no_clerk_sync,
+            )
+        finally:
+            await close_http_client()
+            await engine.dispose()
+
+    print(f"\n👥 Importing users from {args.export}...")
+    report = asyncio.run(_import())
+    print(f"    Rows read:        {report.rows} ({report.skipped} skipped)")
+    print(f"    Users created:    {report.users_created}")
+    print(f"    Orgs created:     {report.orgs_created}")
+    print(f"    Venues created:   {report.venues_created}")
+    if not args.no_clerk_sync:
+        print(f"    Clerk synced:     {report.synced} ({len(report.sync_failed)} failed)")
+    print(f"    Database load:    {report.db_rows_per_second:,.0f} rows/s")
+    print(f"    End to end:       {report.rows_per_second:,.0f} rows/s")
+    if report.sync_failed:
+        print("\n    ⚠️  Clerk sync failed for (re-run the import to retry):")
+        for clerk_id in report.sync_failed:
+            print(f"       {clerk_id}")
+        return 1
+    print("    ✅ Import complete\n")
+    return 0
+
+
+def gc_uploads() -> int:
+    """Delete uploaded files that have been unreferenced for the grace period."""
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal, engine
+    from app.modules.uploads.services import GarbageReport, upload_service
+
+    async def _collect() -> GarbageReport:
+        async with AsyncSessionLocal() as session:
+            report = await upload_service.collect_garbage(
+                session,
+                grace_seconds=settings.UPLOAD_GC_GRACE_SECONDS,
+            )
+        await engine.dispose()
+        return report
+
+    print("\n🧹 Collecting unreferenced uploads...")
+    report = asyncio.run(_collect())
+    print(f"    Orphaned blobs:   {report.orphans_deleted}")
+    print(f"    Files removed:    {report.files_removed}")
+    print(f"    Files kept:       {report.files_kept} (touched within the grace period)")
+    print("    ✅ Collection complete\n")
+    return 0
+
+
+def check_pooler() -> int:
+    """Exercise the database layer through a transaction-mode pooler (PgBouncer)."""
+    from sqlalchemy import func, select, text
+
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal, PrimaryReadSessionLocal, engine
+    from app.core.database.session import POOLING_MODE_TRANSACTION
+    from app.modules.venues.models import Venue
+
+    parser = argparse.ArgumentParser(prog="check-pooler", description=check_pooler.__doc__)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args(sys.argv[2:] if __name__ == "__main__" else sys.argv[1:])
+
+    if settings.DB_POOLING_MODE != POOLING_MODE_TRANSACTION:
+        print(f"\n❌ DB_POOLING_MODE is {settings.DB_POOLING_MODE!r}; set it to 'transaction'")
+        print("   and point DATABASE_URL at the pooler (docker compose --profile pooler up)\n")
+        return 1
+
+    backends: set[int] = set()
+    errors: list[str] = []
+
+    async def _client() -> None:
+        for i in range(args.iterations):
+            try:
+                # Read-write transaction: several statements pinned to one backend.
+                # Reusing the same parameterized SQL across transactions is what
+                # breaks cached prepared statements behind a transaction pooler.
+                async with AsyncSessionLocal() as session:
+                    pid = await session.scalar(text("SELECT pg_backend_pid()"))
+                    value = await session.scalar(text("SELECT CAST(:n AS integer) + 1"), {"n": i})
+                    await session.execute(select(func.count()).select_from(Venue))
+                    end_pid = await session.scalar(text("SELECT pg_backend_pid()"))
+                    await session.commit()
+                if value != i + 1 or end_pid != pid:
+                    errors.append(f"transaction moved backends or returned {value}")
+                backends.add(pid)
+                # Autocommit read-only session: each statement is its own transaction
+                async with PrimaryReadSessionLocal() as session:
+                    await session.scalar(text("SELECT CAST(:n AS integer) + 1"), {"n": i})
+                    await session.execute(select(func.count()).select_from(Venue))
+            except Exception as e:  # Every failure is reported
+                errors.append(f"{type(e).__name__}: {e}")
+
+    async def _run() -> None:
+        try:
+            await asyncio.gather(*(_client() for _ in range(args.clients)))
+        finally:
+            await engine.dispose()
+
+    print(f"\n🔌 Checking transaction pooling ({args.clients} clients x {args.iterations})...")
+    asyncio.run(_run())
+    print(f"    Transactions:     {args.clients * args.iterations * 3}")
+    print(f"    Server backends:  {len(backends)}")
+    if errors:
+        print(f"    ❌ {len(errors)} failures, e.g.:")
+        for error in errors[:5]:
+            print(f"       {error}")
+        return 1
+    print("    ✅ No prepared statement or session state errors\n")
+    return 0
+
+
 if __name__ == "__main__":
     # Allow running as a script: python scripts.py qa
     if len(sys.argv) > 1:
@@ -0,0 +1 @@
+"""Local stand-in servers for external services (development and testing only)."""
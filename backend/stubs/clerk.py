@@ -0,0 +1,180 @@
+"""Local stand-in for the Clerk endpoints the backend calls.
+
+Serves a JWKS document for an in-memory RSA key, can mint session tokens
+signed with it, and implements the Backend API user-metadata endpoint with
+injectable faults. JWT verification (including key rotation) and the Clerk
+client's retries and circuit breaker can be exercised without a Clerk
+account. Never deploy this.
+
+Usage (from backend/):
+    poetry run clerk-stub
+    # then run the API with
+    #   CLERK_JWKS_URL=http://127.0.0.1:8090/.well-known/jwks.json
+    #   CLERK_API_BASE=http://127.0.0.1:8090/v1
+
+Endpoints:
+    GET   /.well-known/jwks.json          Published signing keys (current + previous)
+    PATCH /v1/users/{user_id}/metadata    Merge public_metadata into the user
+    GET   /v1/users/{user_id}             The user's stored metadata
+    POST  /__stub/tokens                  Mint a session token: {"sub", "email", "role", "ttl"}
+    POST  /__stub/rotate                  Start signing with a fresh key; the previous
+                                          key stays published for in-flight tokens
+    POST  /__stub/faults                  Make the next N API calls fail:
+                                          {"status": 503, "count": 3, "delay": 0}
+    GET   /__stub/calls                   Number of API calls received
+"""
+
+import asyncio
+import itertools
+import time
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from jose import jwk, jwt
+from pydantic import BaseModel
+
+ALGORITHM = "RS256"
+RSA_KEY_SIZE = 2048
+RSA_PUBLIC_EXPONENT = 65537
+JWKS_MAX_AGE_SECONDS = 300
+DEFAULT_TOKEN_TTL_SECONDS = 3600
+DEFAULT_FAULT_STATUS = 503
+
+app = FastAPI(title="Clerk stand-in")
+
+_kid_counter = itertools.count(1)
+
+
+class _SigningKey:
+    """An RSA key pair with its kid and public JWK."""
+
+    def __init__(self) -> None:
+        self.kid = f"stub-{next(_kid_counter)}"
+        private_key = rsa.generate_private_key(
+            public_exponent=RSA_PUBLIC_EXPONENT,
+            key_size=RSA_KEY_SIZE,
+        )
+        self.private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        public_jwk = jwk.construct(self.private_pem, ALGORITHM).public_key().to_dict()
+        self.public_jwk = {**public_jwk, "kid": self.kid, "use": "sig"}
+
+
+_keys: list[_SigningKey] = [_SigningKey()]
+
+# Backend API state: user_id -> public_metadata, plus pending injected faults
+_users: dict[str, dict[str, Any]] = {}
+_faults: dict[str, Any] = {"status": DEFAULT_FAULT_STATUS, "count": 0, "delay": 0.0}
+_stats = {"calls": 0}
+
+
+class FaultRequest(BaseModel):
+    """Failure injected into the next ``count`` Backend API calls."""
+
+    status: int = DEFAULT_FAULT_STATUS
+    count: int = 1
+    delay: float = 0.0  # Seconds to wait before answering (to trigger client timeouts)
+
+
+class MetadataUpdate(BaseModel):
+    """Body of the user-metadata PATCH."""
+
+    public_metadata: dict[str, Any] = {}
+
+
+class TokenRequest(BaseModel):
+    """Claims for a minted session token."""
+
+    sub: str = "user_stub"
+    email: str = "stub@example.edu"
+    role: str | None = None
+    ttl: int = DEFAULT_TOKEN_TTL_SECONDS
+
+
+@app.get("/.well-known/jwks.json")
+async def jwks(response: Response) -> dict[str, Any]:
+    """Publish the current and previous public keys."""
+    response.headers["Cache-Control"] = f"public, max-age={JWKS_MAX_AGE_SECONDS}"
+    return {"keys": [key.public_jwk for key in _keys]}
+
+
+@app.post("/__stub/tokens")
+async def mint_token(request: TokenRequest) -> dict[str, str]:
+    """Sign a session token with the current key."""
+    now = int(time.time())
+    claims: dict[str, Any] = {
+        "sub": request.sub,
+        "email": request.email,
+        "iat": now,
+        "exp": now + request.ttl,
+    }
+    if request.role:
+        claims["public_metadata"] = {"role": request.role}
+
+    current = _keys[-1]
+    token = jwt.encode(
+        claims, current.private_pem, algorithm=ALGORITHM, headers={"kid": current.kid}
+    )
+    return {"token": token, "kid": current.kid}
+
+
+@app.post("/__stub/rotate")
+async def rotate() -> dict[str, str]:
+    """Add a new signing key, keeping only the previous one alongside it."""
+    _keys.append(_SigningKey())
+    del _keys[:-2]
+    return {"kid": _keys[-1].kid}
+
+
+async def _apply_fault() -> JSONResponse | None:
+    """Count the call and, if a fault is pending, delay and/or fail it."""
+    _stats["calls"] += 1
+    if _faults["count"] <= 0:
+        return None
+    _faults["count"] -= 1
+    if _faults["delay"]:
+        await asyncio.sleep(_faults["delay"])
+    return JSONResponse(status_code=_faults["status"], content={"errors": ["injected fault"]})
+
+
+@app.patch("/v1/users/{user_id}/metadata", response_model=None)
+async def update_metadata(user_id: str, update: MetadataUpdate) -> dict[str, Any] | JSONResponse:
+    """Merge public_metadata into the stored user (Clerk merges shallowly)."""
+    fault = await _apply_fault()
+    if fault is not None:
+        return fault
+
+    metadata = _users.setdefault(user_id, {})
+    metadata.update(update.public_metadata)
+    return {"id": user_id, "public_metadata": metadata}
+
+
+@app.get("/v1/users/{user_id}", response_model=None)
+async def get_user(user_id: str) -> dict[str, Any] | JSONResponse:
+    """Return the stored user metadata."""
+    fault = await _apply_fault()
+    if fault is not None:
+        return fault
+
+    if user_id not in _users:
+        return JSONResponse(status_code=404, content={"errors": ["user not found"]})
+    return {"id": user_id, "public_metadata": _users[user_id]}
+
+
+@app.post("/__stub/faults")
+async def inject_faults(request: FaultRequest) -> dict[str, Any]:
+    """Fail (and/or delay) the next ``count`` Backend API calls."""
+    _faults.update(request.model_dump())
+    return _faults
+
+
+@app.get("/__stub/calls")
+async def api_calls() -> dict[str, int]:
+    """Number of Backend API calls received so far."""
+    return _stats
@@ -0,0 +1,293 @@
+"""Local stand-in for the S3 API subset the storage backend uses.
+
+An in-memory, path-style S3 endpoint (MinIO-like) that verifies SigV4
+signatures (Authorization header and presigned URLs, including expiry),
+payload hashes and x-amz-checksum-sha256, so the S3 storage backend and
+the direct-upload flow can be exercised end to end without a cloud
+account. Browser PUTs are allowed from any origin. Never deploy this.
+
+Usage (from backend/):
+    poetry run s3-stub
+    # then run the API with
+    #   STORAGE_BACKEND=s3
+    #   S3_ENDPOINT_URL=http://127.0.0.1:9000
+    #   S3_BUCKET=venuelink
+    #   S3_ACCESS_KEY_ID=stub-access-key
+    #   S3_SECRET_ACCESS_KEY=stub-secret-key
+
+Endpoints:
+    PUT    /{bucket}/{key}     Store an object (or copy one with x-amz-copy-source)
+    GET    /{bucket}/{key}     Fetch an object (Range supported); unsigned reads
+                               are allowed, like a public-read bucket
+    HEAD   /{bucket}/{key}     Object metadata
+    DELETE /{bucket}/{key}     Delete an object
+    GET    /{bucket}           ListObjectsV2 (prefix, max-keys, continuation-token)
+    GET    /__stub/objects     Stored keys and sizes
+"""
+
+import base64
+import calendar
+import hashlib
+import hmac
+import time
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from typing import Any
+from urllib.parse import unquote
+from xml.sax.saxutils import escape
+
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.core.storage.sigv4 import (
+    ALGORITHM,
+    AMZ_DATE_FORMAT,
+    UNSIGNED_PAYLOAD,
+    Credentials,
+    signature,
+)
+
+ACCESS_KEY_ID = "stub-access-key"
+SECRET_ACCESS_KEY = "stub-secret-key"  # noqa: S105
+S3_XML_NAMESPACE = "http://s3.amazonaws.com/doc/2006-03-01/"
+DEFAULT_MAX_KEYS = 1000
+# Credential scope after the access key: <date>/<region>/s3/aws4_request
+SCOPE_PARTS = 4
+
+app = FastAPI(title="S3 stand-in")
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["GET", "HEAD", "PUT"],
+    allow_headers=["*"],
+    expose_headers=["ETag"],
+)
+
+
+@dataclass
+class _Object:
+    """A stored object."""
+
+    body: bytes
+    content_type: str
+    cache_control: str | None
+    last_modified: float = field(default_factory=time.time)
+
+    @property
+    def etag(self) -> str:
+        """Quoted MD5 of the body, as S3 reports for single-part uploads."""
+        return f'"{hashlib.md5(self.body, usedforsecurity=False).hexdigest()}"'
+
+    def headers(self) -> dict[str, str]:
+        """Response headers describing the object."""
+        headers = {
+            "Content-Type": self.content_type,
+            "ETag": self.etag,
+            "Last-Modified": formatdate(self.last_modified, usegmt=True),
+            "Accept-Ranges": "bytes",
+        }
+        if self.cache_control:
+            headers["Cache-Control"] = self.cache_control
+        return headers
+
+
+# (bucket, key) -> object; buckets spring into existence on first write
+_objects: dict[tuple[str, str], _Object] = {}
+
+
+def _error(status: int, code: str, message: str) -> Response:
+    """S3-style XML error response."""
+    body = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f"<Error><Code>{code}</Code><Message>{escape(message)}</Message></Error>"
+    )
+    return Response(body, status_code=status, media_type="application/xml")
+
+
+def _credentials_for(credential: str) -> Credentials | None:
+    """Resolve "<access key>/<date>/<region>/s3/aws4_request" to signing credentials."""
+    access_key_id, _, scope = credential.partition("/")
+    parts = scope.split("/")
+    if access_key_id != ACCESS_KEY_ID or len(parts) != SCOPE_PARTS:
+        return None
+    return Credentials(ACCESS_KEY_ID, SECRET_ACCESS_KEY, region=parts[1])
+
+
+def _verify(request: Request, body: bytes) -> Response | None:  # noqa: PLR0911
+    """Check the request's SigV4 signature; return an error response if invalid."""
+    query = list(request.query_params.multi_items())
+    path = request.scope["path"]
+
+    if "X-Amz-Signature" in request.query_params:
+        params = request.query_params
+        credentials = _credentials_for(params.get("X-Amz-Credential", ""))
+        if params.get("X-Amz-Algorithm") != ALGORITHM or credentials is None:
+            return _error(403, "InvalidAccessKeyId", "Unknown access key")
+        amz_date = params.get("X-Amz-Date", "")
+        signed_names = params.get("X-Amz-SignedHeaders", "").split(";")
+        try:
+            issued = calendar.timegm(time.strptime(amz_date, AMZ_DATE_FORMAT))
+            expires = int(params.get("X-Amz-Expires", "0"))
+        except ValueError:
+            return _error(403, "AuthorizationQueryParametersError", "Bad X-Amz-Date/Expires")
+        if time.time() > issued + expires:
+            return _error(403, "AccessDenied", "Request has expired")
+        provided = params["X-Amz-Signature"]
+        query = [(k, v) for k, v in query if k != "X-Amz-Signature"]
+        payload_hash = UNSIGNED_PAYLOAD
+    else:
+        authorization = request.headers.get("authorization", "")
+        algorithm, _, fields = authorization.partition(" ")
+        values = dict(part.strip().split("=", 1) for part in fields.split(",") if "=" in part)
+        credentials = _credentials_for(values.get("Credential", ""))
+        if algorithm != ALGORITHM or credentials is None:
+            return _error(403, "InvalidAccessKeyId", "Unknown access key")
+        amz_date = request.headers.get("x-amz-date", "")
+        signed_names = values.get("SignedHeaders", "").split(";")
+        provided = values.get("Signature", "")
+        payload_hash = request.headers.get("x-amz-content-sha256", "")
+        if payload_hash != UNSIGNED_PAYLOAD and payload_hash != hashlib.sha256(body).hexdigest():
+            return _error(400, "XAmzContentSHA256Mismatch", "Payload hash mismatch")
+
+    signed_headers = {name: request.headers.get(name, "") for name in signed_names}
+    expected = signature(
+        request.method,
+        path,
+        query,
+        signed_headers,
+        payload_hash,
+        amz_date,
+        credentials,
+    )
+    if not hmac.compare_digest(expected, provided):
+        return _error(403, "SignatureDoesNotMatch", "Signature does not match")
+
+    checksum = request.headers.get("x-amz-checksum-sha256")
+    if (
+        checksum is not None
+        and checksum != base64.b64encode(hashlib.sha256(body).digest()).decode()
+    ):
+        return _error(400, "BadDigest", "x-amz-checksum-sha256 does not match the body")
+    return None
+
+
+@app.get("/__stub/objects")
+async def list_stored() -> list[dict[str, Any]]:
+    """Stored objects (bucket, key, size)."""
+    return [
+        {"bucket": bucket, "key": key, "size": len(obj.body)}
+        for (bucket, key), obj in sorted(_objects.items())
+    ]
+
+
+@app.get("/{bucket}")
+async def list_objects(bucket: str, request: Request) -> Response:
+    """ListObjectsV2, paged by offset (the continuation token)."""
+    error = _verify(request, b"")
+    if error is not None:
+        return error
+
+    prefix = request.query_params.get("prefix", "")
+    max_keys = int(request.query_params.get("max-keys", DEFAULT_MAX_KEYS))
+    start = int(request.query_params.get("continuation-token", "0"))
+    keys = sorted(k for b, k in _objects if b == bucket and k.startswith(prefix))
+    page = keys[start : start + max_keys]
+    truncated = start + max_keys < len(keys)
+
+    contents = "".join(
+        f"<Contents><Key>{escape(key)}</Key>"
+        f"<LastModified>{_iso(_objects[(bucket, key)].last_modified)}</LastModified>"
+        f"<ETag>{escape(_objects[(bucket, key)].etag)}</ETag>"
+        f"<Size>{len(_objects[(bucket, key)].body)}</Size></Contents>"
+        for key in page
+    )
+    token = (
+        f"<NextContinuationToken>{start + max_keys}</NextContinuationToken>" if truncated else ""
+    )
+    body = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<ListBucketResult xmlns="{S3_XML_NAMESPACE}">'
+        f"<Name>{escape(bucket)}</Name><Prefix>{escape(prefix)}</Prefix>"
+        f"<KeyCount>{len(page)}</KeyCount><MaxKeys>{max_keys}</MaxKeys>"
+        f"<IsTruncated>{'true' if truncated else 'false'}</IsTruncated>"
+        f"{token}{contents}</ListBucketResult>"
+    )
+    return Response(body, media_type="application/xml")
+
+
+@app.api_route("/{bucket}/{key:path}", methods=["GET", "HEAD", "PUT", "DELETE"])
+async def object_route(bucket: str, key: str, request: Request) -> Response:
+    """Object PUT (and copy), GET/HEAD (with Range) and DELETE."""
+    body = await request.body()
+    public_read = request.method in ("GET", "HEAD") and not (
+        "authorization" in request.headers or "X-Amz-Signature" in request.query_params
+    )
+    if not public_read:
+        error = _verify(request, body)
+        if error is not None:
+            return error
+
+    if request.method == "PUT":
+        return _put(bucket, key, request, body)
+    if request.method == "DELETE":
+        _objects.pop((bucket, key), None)
+        return Response(status_code=204)
+
+    return _get(bucket, key, request)
+
+
+def _get(bucket: str, key: str, request: Request) -> Response:
+    """Serve an object (GET, optionally ranged) or its metadata (HEAD)."""
+    obj = _objects.get((bucket, key))
+    if obj is None:
+        return _error(404, "NoSuchKey", "The specified key does not exist.")
+    if request.method == "HEAD":
+        return Response(headers={**obj.headers(), "Content-Length": str(len(obj.body))})
+
+    range_header = request.headers.get("range")
+    if range_header and range_header.startswith("bytes="):
+        first, _, last = range_header.removeprefix("bytes=").partition("-")
+        start = int(first or 0)
+        end = min(int(last) if last else len(obj.body) - 1, len(obj.body) - 1)
+        return Response(
+            obj.body[start : end + 1],
+            status_code=206,
+            headers={**obj.headers(), "Content-Range": f"bytes {start}-{end}/{len(obj.body)}"},
+        )
+    return Response(obj.body, headers=obj.headers())
+
+
+def _put(bucket: str, key: str, request: Request, body: bytes) -> Response:
+    """Store an object, or copy one when x-amz-copy-source is set."""
+    copy_source = request.headers.get("x-amz-copy-source")
+    if copy_source is None:
+        obj = _Object(
+            body=body,
+            content_type=request.headers.get("content-type", "application/octet-stream"),
+            cache_control=request.headers.get("cache-control"),
+        )
+        _objects[(bucket, key)] = obj
+        return Response(headers={"ETag": obj.etag})
+
+    source_bucket, _, source_key = unquote(copy_source).lstrip("/").partition("/")
+    source = _objects.get((source_bucket, source_key))
+    if source is None:
+        return _error(404, "NoSuchKey", "The copy source does not exist.")
+    replace = request.headers.get("x-amz-metadata-directive") == "REPLACE"
+    obj = _Object(
+        body=source.body,
+        content_type=request.headers.get("content-type", "") if replace else source.content_type,
+        cache_control=request.headers.get("cache-control") if replace else source.cache_control,
+    )
+    _objects[(bucket, key)] = obj
+    body_xml = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f"<CopyObjectResult><LastModified>{_iso(obj.last_modified)}</LastModified>"
+        f"<ETag>{escape(obj.etag)}</ETag></CopyObjectResult>"
+    )
+    return Response(body_xml, media_type="application/xml")
+
+
+def _iso(timestamp: float) -> str:
+    """ISO 8601 UTC timestamp as S3 formats it."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(timestamp))
@@ -38,6 +38,8 @@ export type {
   UpdateOrganizationRequest,
   BookingActionType,
   BookingActionPayload,
+  DirectUploadRequest,
+  UploadConfirmRequest,
 } from './requests';
 
 // Responses
@@ -52,4 +54,5 @@ export type {
   CurrentOrganizationResponse,
   VenueStatsResponse,
   HealthCheckResponse,
+  DirectUploadResponse,
 } from './responses';
@@ -128,3 +128,28 @@ export interface BookingActionPayload {
   /** UUID of the venue (for cache invalidation) */
   venueId: string;
 }
+
+/**
+ * Payload for presigning a direct-to-storage image upload.
+ *
+ * POST /api/v1/venues/:id/logo/presign and /api/v1/organizations/:id/logo/presign.
+ * The upload is bound to exactly this type, size and hash.
+ */
+export interface DirectUploadRequest {
+  /** MIME type: image/png, image/jpeg or image/webp */
+  contentType: string;
+  /** Exact file size in bytes */
+  size: number;
+  /** SHA-256 of the file, hex-encoded (e.g. via crypto.subtle.digest) */
+  sha256: string;
+}
+
+/**
+ * Payload for recording a directly uploaded logo.
+ *
+ * POST /api/v1/venues/:id/logo/confirm and /api/v1/organizations/:id/logo/confirm.
+ */
+export interface UploadConfirmRequest {
+  /** Storage key returned by the presign call */
+  key: string;
+}
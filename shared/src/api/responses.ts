@@ -68,3 +68,26 @@ export interface HealthCheckResponse {
   /** Service version */
   version: string;
 }
+
+/**
+ * Presigned direct upload.
+ *
+ * Returned from POST /api/v1/venues/:id/logo/presign and
+ * /api/v1/organizations/:id/logo/presign. PUT the file to `uploadUrl` with
+ * exactly `headers`, then confirm `key`. When `alreadyStored` is true, skip
+ * the PUT and confirm straight away.
+ */
+export interface DirectUploadResponse {
+  /** Storage key the file will have */
+  key: string;
+  /** Whether identical bytes are already stored */
+  alreadyStored: boolean;
+  /** URL to PUT the file to (null when already stored) */
+  uploadUrl: string | null;
+  /** HTTP method for the upload */
+  method: 'PUT';
+  /** Headers that must be sent with the upload */
+  headers: Record<string, string>;
+  /** Seconds until uploadUrl expires (null when already stored) */
+  expiresIn: number | null;
+}
@@ -15,6 +15,8 @@ export interface Booking {
   organizationId: string;
   /** Event date in ISO 8601 format (YYYY-MM-DD) */
   eventDate: string;
+  /** Date the event ends in ISO 8601 format; later than eventDate for overnight/multi-day events */
+  eventEndDate: string;
   /** Event start time in HH:MM:SS format */
   eventStartTime: string;
   /** Event end time in HH:MM:SS format */
@@ -52,7 +54,7 @@ export interface BookingWithDetails extends Booking {
  *
  * Includes organization context for venue admin review.
  */
-export interface AdminBookingView extends Pick<Booking, 'id' | 'eventName' | 'eventDate' | 'eventStartTime' | 'eventEndTime' | 'eventDurationMinutes' | 'guestCount' | 'status' | 'createdAt'> {
+export interface AdminBookingView extends Pick<Booking, 'id' | 'eventName' | 'eventDate' | 'eventEndDate' | 'eventStartTime' | 'eventEndTime' | 'eventDurationMinutes' | 'guestCount' | 'status' | 'createdAt'> {
   /** Organization name for display */
   organizationName: string;
 }
@@ -62,7 +64,7 @@ export interface AdminBookingView extends Pick<Booking, 'id' | 'eventName' | 'ev
  *
  * Includes computed fields and formatted data for display.
  */
-export interface BookingConfirmation extends Pick<Booking, 'id' | 'eventName' | 'eventDate' | 'eventStartTime' | 'eventEndTime' | 'eventDurationMinutes' | 'guestCount' | 'status'> {
+export interface BookingConfirmation extends Pick<Booking, 'id' | 'eventName' | 'eventDate' | 'eventEndDate' | 'eventStartTime' | 'eventEndTime' | 'eventDurationMinutes' | 'guestCount' | 'status'> {
   /** Venue name for display */
   venueName: string;
   /** Estimated total cost in cents */
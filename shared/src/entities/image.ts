@@ -0,0 +1,29 @@
+/**
+ * Resized image derivatives.
+ *
+ * Rendered by the backend for each uploaded logo; see
+ * `app/core/uploads.py` (IMAGE_DERIVATIVE_SIZES / IMAGE_DERIVATIVE_FORMATS).
+ */
+
+/**
+ * One derivative size, available in WebP and JPEG.
+ */
+export interface ImageVariant {
+  /** Width in pixels */
+  width: number;
+  /** Height in pixels */
+  height: number;
+  /** URL of the WebP rendition */
+  webp: string;
+  /** URL of the JPEG rendition (fallback for browsers without WebP) */
+  jpeg: string;
+}
+
+/**
+ * Derivatives by size name ("thumbnail" 128px, "card" 480px, "full" 1200px
+ * on the longest edge; never upscaled).
+ *
+ * Build a srcset from the entries, e.g.
+ * `Object.values(v).map((s) => `${s.webp} ${s.width}w`).join(', ')`.
+ */
+export type ImageVariants = Record<string, ImageVariant>;
@@ -5,6 +5,11 @@
  * Property names use camelCase (transformed from snake_case in API layer).
  */
 
+export type {
+  ImageVariant,
+  ImageVariants,
+} from './image';
+
 export type {
   User,
   UserSummary,
@@ -1,4 +1,5 @@
 import type { OrganizationType } from '../enums';
+import type { ImageVariants } from './image';
 
 /**
  * Organization entity as stored in the database.
@@ -57,4 +58,6 @@ export interface OrganizationProfile extends Organization {
   websiteUrl?: string;
   /** Organization logo/avatar URL (optional) */
   logoUrl?: string;
+  /** Resized logo derivatives (optional) */
+  logoVariants?: ImageVariants;
 }
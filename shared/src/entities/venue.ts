@@ -1,4 +1,5 @@
 import type { VenueType } from '../enums';
+import type { ImageVariants } from './image';
 
 /**
  * Address fields for a venue location.
@@ -52,6 +53,14 @@ export interface Venue {
   deletedAt: string | null;
   /** URL of the venue logo image, or null if not set */
   logoUrl: string | null;
+  /** Resized logo derivatives, or null if not rendered */
+  logoVariants: ImageVariants | null;
+  /** Number of ratings received */
+  ratingCount: number;
+  /** Mean rating score (1-5), or null if unrated */
+  ratingAverage: number | null;
+  /** Rating counts per score; index 0 = 1 star ... index 4 = 5 stars */
+  ratingHistogram: number[];
 }
 
 /**